@@ -0,0 +1,38 @@
+"""add scrape recipe cache
+
+Revision ID: 5b2e9c7d4a18
+Revises: d32feec83c05
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2e9c7d4a18"
+down_revision: Union[str, Sequence[str], None] = "d32feec83c05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "scrape_recipes",
+        sa.Column("url_hash", sa.Text(), nullable=False),
+        sa.Column("url", sa.Text(), nullable=False),
+        sa.Column("recipe_json", sa.Text(), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=False),
+        sa.Column("analyzed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("url_hash"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("scrape_recipes")
@@ -0,0 +1,30 @@
+"""add events city/start_time composite index
+
+Revision ID: d32feec83c05
+Revises: 8c0f9f8b1f6b
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d32feec83c05"
+down_revision: Union[str, Sequence[str], None] = "8c0f9f8b1f6b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_city_start_time ON events (city_slug, start_time)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS idx_events_city_start_time")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,15 +11,19 @@ if TYPE_CHECKING:
 _PUNCT_RE = re.compile(r"[^\w\s-]")
 _WHITESPACE_RE = re.compile(r"\s+")
 _HYPHEN_RE = re.compile(r"[-_]+")
+_REPEATED_HYPHEN_RE = re.compile(r"-{2,}")
 
 
+# Event and profile cities come from a small set, but every ranked or upserted event
+# slugifies one; caching keeps the unicode/regex work off those loops.
+@lru_cache(maxsize=512)
 def normalize_city_slug(city: str) -> str:
     text = unicodedata.normalize("NFKD", str(city or ""))
     text = text.encode("ascii", "ignore").decode("ascii")
     text = _WHITESPACE_RE.sub(" ", text.strip())
     text = _PUNCT_RE.sub("", text.lower())
     text = _HYPHEN_RE.sub("-", text.replace(" ", "-"))
-    text = re.sub(r"-{2,}", "-", text).strip("-")
+    text = _REPEATED_HYPHEN_RE.sub("-", text).strip("-")
     return text or "unknown"
 
 
@@ -17,6 +17,11 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = DEFAULT_DATABASE_URL
+    database_read_url: str = ""
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_lock_timeout_ms: int = 5000
+    database_synchronous_commit: Literal["on", "off", "local"] = "on"
 
     # OpenAI
     openai_api_key: str = ""
@@ -25,6 +30,8 @@ class Settings(BaseSettings):
     openai_max_retries: int = 1
     tagger_concurrency: int = 8
     tagger_batch_size: int = 25
+    # Sources fetched at once by run_scrape
+    scrape_concurrency: int = 4
     background_job_timeout_seconds: int = 3600
 
     # External HTTP
@@ -51,6 +58,9 @@ class Settings(BaseSettings):
     resend_api_key: str = ""
     email_from: str = "Family Events <onboarding@resend.dev>"
 
+    # Friday fan-out: users notified at once by the cron job
+    notify_concurrency: int = 8
+
     # App
     host: str = "0.0.0.0"
     port: int = 8000
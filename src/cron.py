@@ -7,20 +7,48 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import signal
 import time
+from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from src.db.database import create_database
+from src.config import settings
+from src.db.database import Database, create_database
+from src.db.models import User
 from src.scheduler import run_notify, run_scheduled_scrape_then_tag
+from src.timezones import utc_now
 from src.utils import duration_ms, error_details, runtime_log
 
 logger = logging.getLogger("uvicorn.error")
 CRON_TZ = ZoneInfo("America/Chicago")
 
 
+async def _vacuum_after_scrape(db: Database) -> None:
+    """Clean up after the nightly upsert burst; failures never fail the scrape job."""
+    started = time.perf_counter()
+    try:
+        await db.vacuum_events()
+    except Exception as exc:
+        error_type, error_message = error_details(exc)
+        runtime_log(
+            logging.WARNING,
+            "cron_maintenance_failed",
+            cron_job="daily_scrape_and_tag",
+            error_type=error_type,
+            error_message=error_message,
+        )
+        return
+    runtime_log(
+        logging.INFO,
+        "cron_maintenance_succeeded",
+        cron_job="daily_scrape_and_tag",
+        duration_ms=duration_ms(started),
+    )
+
+
 async def daily_scrape_and_tag() -> None:
     """Run at 2 AM daily: scrape all sources and tag new events."""
     started = time.perf_counter()
@@ -28,6 +56,7 @@ async def daily_scrape_and_tag() -> None:
     try:
         async with create_database() as db:
             result = await run_scheduled_scrape_then_tag(db)
+            await _vacuum_after_scrape(db)
         runtime_log(
             logging.INFO,
             "cron_job_succeeded",
@@ -50,6 +79,47 @@ async def daily_scrape_and_tag() -> None:
         logger.exception("cron_job_failed_exception", extra={"cron_job": "daily_scrape_and_tag"})
 
 
+async def _notify_user(
+    db: Database, user: User, semaphore: asyncio.Semaphore, now: datetime
+) -> None:
+    async with semaphore:
+        runtime_log(
+            logging.INFO,
+            "cron_notification_user_started",
+            cron_job="friday_notification",
+            user_id=user.id,
+            user_email=user.email,
+        )
+        try:
+            await run_notify(db, user=user, now=now)
+            runtime_log(
+                logging.INFO,
+                "cron_notification_user_succeeded",
+                cron_job="friday_notification",
+                user_id=user.id,
+                user_email=user.email,
+            )
+        except Exception as exc:
+            error_type, error_message = error_details(exc)
+            runtime_log(
+                logging.ERROR,
+                "cron_notification_user_failed",
+                cron_job="friday_notification",
+                user_id=user.id,
+                user_email=user.email,
+                error_type=error_type,
+                error_message=error_message,
+            )
+            logger.exception(
+                "cron_notification_user_failed_exception",
+                extra={
+                    "cron_job": "friday_notification",
+                    "user_id": user.id,
+                    "user_email": user.email,
+                },
+            )
+
+
 async def friday_notification() -> None:
     """Run at 8 AM on Fridays: send weekend plans to each user."""
     started = time.perf_counter()
@@ -65,42 +135,15 @@ async def friday_notification() -> None:
                 )
                 await run_notify(db)
             else:
-                for user in users:
-                    runtime_log(
-                        logging.INFO,
-                        "cron_notification_user_started",
-                        cron_job="friday_notification",
-                        user_id=user.id,
-                        user_email=user.email,
-                    )
-                    try:
-                        await run_notify(db, user=user)
-                        runtime_log(
-                            logging.INFO,
-                            "cron_notification_user_succeeded",
-                            cron_job="friday_notification",
-                            user_id=user.id,
-                            user_email=user.email,
-                        )
-                    except Exception as exc:
-                        error_type, error_message = error_details(exc)
-                        runtime_log(
-                            logging.ERROR,
-                            "cron_notification_user_failed",
-                            cron_job="friday_notification",
-                            user_id=user.id,
-                            user_email=user.email,
-                            error_type=error_type,
-                            error_message=error_message,
-                        )
-                        logger.exception(
-                            "cron_notification_user_failed_exception",
-                            extra={
-                                "cron_job": "friday_notification",
-                                "user_id": user.id,
-                                "user_email": user.email,
-                            },
-                        )
+                # Users are independent, so overlap their sends; the semaphore keeps the
+                # burst inside Twilio/Resend rate limits and the DB pool.
+                semaphore = asyncio.Semaphore(max(1, settings.notify_concurrency))
+                # Read the clock once so a fan-out straddling Saturday noon still sends
+                # every user the same weekend.
+                now = utc_now()
+                async with asyncio.TaskGroup() as task_group:
+                    for user in users:
+                        task_group.create_task(_notify_user(db, user, semaphore, now))
         runtime_log(
             logging.INFO,
             "cron_job_succeeded",
@@ -149,11 +192,19 @@ async def main() -> None:
             next_run_time=str(job.next_run_time),
         )
 
+    # Park on an event instead of waking hourly; SIGINT/SIGTERM from systemd, Docker, or
+    # Railway set it so the scheduler shuts down cleanly.
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
     try:
-        while True:
-            await asyncio.sleep(3600)
-    except (KeyboardInterrupt, SystemExit):
-        scheduler.shutdown()
+        await stop.wait()
+        runtime_log(logging.INFO, "scheduler_stopping")
+    finally:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(signum)
+        scheduler.shutdown(wait=False)
 
 
 if __name__ == "__main__":
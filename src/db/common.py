@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import hashlib
 import re
-from datetime import datetime, timedelta
 
 from src.cities import normalize_city_slug
 from src.db.models import Event
-from src.timezones import as_local_date, utc_now
+from src.timezones import as_local_date
 
 USER_UPDATE_FIELDS = frozenset(
     {
@@ -63,9 +62,3 @@ def normalize_email(email: str) -> str:
 def normalize_search_query(query: str) -> str:
     """Normalize free-text filters before SQL binding."""
     return query.strip()
-
-
-def time_window(days: int) -> tuple[datetime, datetime]:
-    """Return a UTC time window from now through the next N days."""
-    now = utc_now()
-    return now, now + timedelta(days=days)
@@ -7,7 +7,7 @@ import uuid
 from datetime import UTC, datetime, time
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 # ---------------------------------------------------------------------------
 # EventTags - AI-generated metadata about an event
@@ -103,6 +103,17 @@ class Constraints(BaseModel):
     bedtime: str = "19:30"  # HH:MM
     budget_per_event: float = 30.0
 
+    # Parsed once per profile; the ranker reads these for every scored event.
+    _nap_start: time = PrivateAttr(default=time(13, 0))
+    _nap_end: time = PrivateAttr(default=time(15, 0))
+    _bedtime_time: time = PrivateAttr(default=time(19, 30))
+
+    def model_post_init(self, context: Any, /) -> None:
+        nap_start, nap_end = self.nap_time.split("-", 1)
+        self._nap_start = self._parse_clock(nap_start, field_name="nap_time")
+        self._nap_end = self._parse_clock(nap_end, field_name="nap_time")
+        self._bedtime_time = self._parse_clock(self.bedtime, field_name="bedtime")
+
     @field_validator("nap_time", mode="before")
     @classmethod
     def validate_nap_time(cls, value: object) -> str:
@@ -135,15 +146,15 @@ class Constraints(BaseModel):
 
     @property
     def nap_start(self) -> time:
-        return self._parse_clock(self.nap_time.split("-", 1)[0], field_name="nap_time")
+        return self._nap_start
 
     @property
     def nap_end(self) -> time:
-        return self._parse_clock(self.nap_time.split("-", 1)[1], field_name="nap_time")
+        return self._nap_end
 
     @property
     def bedtime_time(self) -> time:
-        return self._parse_clock(self.bedtime, field_name="bedtime")
+        return self._bedtime_time
 
 
 class InterestProfile(BaseModel):
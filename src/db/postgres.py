@@ -5,11 +5,13 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import time
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from typing import Any
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
@@ -21,16 +23,104 @@ from src.db.common import (
     event_fingerprint,
     normalize_email,
     normalize_search_query,
-    time_window,
     title_similarity,
 )
 from src.db.migrations import ensure_postgres_schema_current
 from src.db.models import Event, EventTags, InterestProfile, Job, Source, User, UserEventState
-from src.db.session import get_engine, get_sessionmaker
+from src.db.session import create_engine, create_sessionmaker
 from src.timezones import as_local_date, utc_now, weekend_window_utc
 
 logger = logging.getLogger("uvicorn.error")
 POSTGRES_SCHEME_PREFIX = "postgresql+"
+FILTER_OPTIONS_CACHE_TTL_SECONDS = 300.0
+
+
+# Hot-path statements are built once at import so each scrape row reuses the same
+# compiled TextClause (and asyncpg's per-connection prepared-statement cache key).
+_SELECT_EVENT_IDS_BY_SOURCE_SQL = text(
+    """
+    SELECT e.id, e.source, e.source_id
+    FROM events e
+    JOIN unnest(CAST(:sources AS text[]), CAST(:source_ids AS text[])) AS k(source, source_id)
+      ON e.source = k.source AND e.source_id = k.source_id
+    """
+)
+
+_UPSERT_EVENT_BASE_SQL = """
+    INSERT INTO events (
+        id, source, source_url, source_id, title, description,
+        location_name, location_address, location_city, city_slug,
+        latitude, longitude, start_time, end_time,
+        is_recurring, recurrence_rule, is_free,
+        price_min, price_max, image_url,
+        scraped_at, raw_data, tags, tagged_at, score_breakdown
+    ) VALUES (
+        :id, :source, :source_url, :source_id, :title, :description,
+        :location_name, :location_address, :location_city, :city_slug,
+        :latitude, :longitude, :start_time, :end_time,
+        :is_recurring, :recurrence_rule, :is_free,
+        :price_min, :price_max, :image_url,
+        :scraped_at, CAST(:raw_data AS jsonb), CAST(:tags AS jsonb), :tagged_at, CAST(:score_breakdown AS jsonb)
+    )
+    ON CONFLICT (source, source_id) DO UPDATE SET
+        source_url = EXCLUDED.source_url,
+        title = EXCLUDED.title,
+        description = EXCLUDED.description,
+        location_name = EXCLUDED.location_name,
+        location_address = EXCLUDED.location_address,
+        location_city = EXCLUDED.location_city,
+        city_slug = EXCLUDED.city_slug,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        start_time = EXCLUDED.start_time,
+        end_time = EXCLUDED.end_time,
+        is_recurring = EXCLUDED.is_recurring,
+        recurrence_rule = EXCLUDED.recurrence_rule,
+        is_free = EXCLUDED.is_free,
+        price_min = EXCLUDED.price_min,
+        price_max = EXCLUDED.price_max,
+        image_url = EXCLUDED.image_url,
+        scraped_at = EXCLUDED.scraped_at,
+        raw_data = EXCLUDED.raw_data
+"""
+_UPSERT_EVENT_SQL = text(_UPSERT_EVENT_BASE_SQL + "    RETURNING id\n")
+# Rows already known to exist are refreshed with executemany, which cannot return rows.
+_REFRESH_EVENTS_SQL = text(_UPSERT_EVENT_BASE_SQL)
+
+# Backfills empty fields on the canonical row when a near-duplicate event is folded into it.
+_MERGE_DUPLICATE_EVENT_SQL = text(
+    """
+    UPDATE events
+    SET description = CASE
+            WHEN (description IS NULL OR description = '') AND :description != '' THEN :description
+            ELSE description
+        END,
+        location_name = CASE
+            WHEN (location_name IS NULL OR location_name = '') AND :location_name != '' THEN :location_name
+            ELSE location_name
+        END,
+        location_address = CASE
+            WHEN (location_address IS NULL OR location_address = '') AND :location_address != '' THEN :location_address
+            ELSE location_address
+        END,
+        latitude = COALESCE(latitude, :latitude),
+        longitude = COALESCE(longitude, :longitude),
+        end_time = COALESCE(end_time, :end_time),
+        image_url = COALESCE(image_url, :image_url),
+        scraped_at = CASE
+            WHEN scraped_at < :scraped_at THEN :scraped_at
+            ELSE scraped_at
+        END,
+        tags = COALESCE(tags, CAST(:tags AS jsonb)),
+        score_breakdown = COALESCE(score_breakdown, CAST(:score_breakdown AS jsonb)),
+        city_slug = :city_slug,
+        location_city = CASE
+            WHEN (location_city IS NULL OR location_city = '' OR location_city = 'unknown') AND :location_city != '' THEN :location_city
+            ELSE location_city
+        END
+    WHERE id = :canonical_id
+    """
+)
 
 
 def _uuid_param(value: str | None) -> uuid.UUID | str | None:
@@ -50,19 +140,30 @@ def _normalize_uuid(value: Any) -> str | None:
     return str(value)
 
 
+def _json_param(value: Any) -> str:
+    """Serialize a JSONB bind parameter; scraped payloads sometimes carry non-string keys."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _recipe_url_hash(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
 def _row_to_event(row: Any) -> Event:
+    # Rows come from columns this module wrote and Postgres already typed (timestamptz,
+    # JSONB decoded by the engine's deserializer), so skip Pydantic re-validation.
     data = dict(row)
     data["id"] = _normalize_uuid(data.get("id"))
     viewer_saved = data.pop("viewer_saved", None)
     viewer_attended = data.pop("viewer_attended", None)
     if viewer_saved is not None or viewer_attended is not None:
-        data["viewer_state"] = UserEventState(
+        data["viewer_state"] = UserEventState.model_construct(
             saved=bool(viewer_saved or False),
             attended=bool(viewer_attended or False),
         )
     tags = data.get("tags")
-    data["tags"] = EventTags.model_validate(tags) if tags else None
-    return Event.model_validate(data)
+    data["tags"] = EventTags.model_construct(**tags) if tags else None
+    return Event.model_construct(**data)
 
 
 def _row_to_user(row: Any) -> User:
@@ -87,14 +188,48 @@ def _row_to_source(row: Any) -> Source:
     data = dict(row)
     data["id"] = _normalize_uuid(data.get("id"))
     data["user_id"] = _normalize_uuid(data.get("user_id"))
-    return Source.model_validate(data)
+    return Source.model_construct(**data)
+
+
+# Paginated list views never render raw_data (only the detail page does), so they skip the
+# largest JSONB column instead of shipping and decoding it for every row.
+_EVENT_LIST_COLUMNS = ", ".join(
+    f"e.{column}"
+    for column in (
+        "id",
+        "source",
+        "source_url",
+        "source_id",
+        "title",
+        "description",
+        "location_name",
+        "location_address",
+        "location_city",
+        "city_slug",
+        "latitude",
+        "longitude",
+        "start_time",
+        "end_time",
+        "is_recurring",
+        "recurrence_rule",
+        "is_free",
+        "price_min",
+        "price_max",
+        "image_url",
+        "scraped_at",
+        "tags",
+        "score_breakdown",
+    )
+)
 
 
-def _event_query_parts(viewer_user_id: str | None) -> tuple[str, str, dict[str, Any]]:
+def _event_query_parts(
+    viewer_user_id: str | None, *, event_columns: str = "e.*"
+) -> tuple[str, str, dict[str, Any]]:
     if not viewer_user_id:
-        return "e.*", "", {}
+        return event_columns, "", {}
     return (
-        "e.*, COALESCE(ues.saved, false) AS viewer_saved, COALESCE(ues.attended, false) AS viewer_attended",
+        f"{event_columns}, COALESCE(ues.saved, false) AS viewer_saved, COALESCE(ues.attended, false) AS viewer_attended",
         "LEFT JOIN user_event_state ues ON ues.event_id = e.id AND ues.user_id = :viewer_user_id",
         {"viewer_user_id": _uuid_param(viewer_user_id)},
     )
@@ -113,31 +248,153 @@ def _add_city_slug_filter(
     params["visible_city_slugs"] = visible_city_slugs
 
 
+def _add_text_search_filter(conditions: list[str], params: dict[str, Any], q: str) -> None:
+    if not q:
+        return
+    # Written against lower(...) so the gin_trgm_ops expression indexes on title and
+    # description serve the substring match instead of a sequential scan.
+    conditions.append("(lower(e.title) LIKE :q OR lower(e.description) LIKE :q)")
+    params["q"] = f"%{q.lower()}%"
+
+
+async def _fetch_event_page(
+    session: AsyncSession,
+    *,
+    select_cols: str,
+    join_sql: str,
+    where: str,
+    order_clause: str,
+    params: dict[str, Any],
+    cursor_condition: str = "",
+) -> tuple[list[Event], int]:
+    """Fetch one LIMIT/OFFSET page plus the unpaged total in a single round trip."""
+    if cursor_condition:
+        # A keyset page only sees rows past the cursor, so a window total would undercount.
+        result = await session.execute(
+            text(
+                f"""
+                SELECT {select_cols}
+                FROM events e
+                {join_sql}
+                WHERE {where} AND {cursor_condition}
+                ORDER BY {order_clause}
+                LIMIT :limit
+                """
+            ),
+            params,
+        )
+        count_result = await session.execute(
+            text(f"SELECT COUNT(*) FROM events e {join_sql} WHERE {where}"), params
+        )
+        return [_row_to_event(row) for row in result.mappings().all()], int(
+            count_result.scalar_one()
+        )
+    result = await session.execute(
+        text(
+            f"""
+            SELECT {select_cols}, COUNT(*) OVER () AS total_count
+            FROM events e
+            {join_sql}
+            WHERE {where}
+            ORDER BY {order_clause}
+            LIMIT :limit OFFSET :offset
+            """
+        ),
+        params,
+    )
+    rows = [dict(row) for row in result.mappings().all()]
+    if rows:
+        total = int(rows[0]["total_count"])
+        for row in rows:
+            del row["total_count"]
+        return [_row_to_event(row) for row in rows], total
+    if not params.get("offset"):
+        return [], 0
+    # Past the last page the window has no rows to report on; count separately.
+    count_result = await session.execute(
+        text(f"SELECT COUNT(*) FROM events e {join_sql} WHERE {where}"), params
+    )
+    return [], int(count_result.scalar_one())
+
+
+async def _update_source_status_in_session(
+    session: AsyncSession,
+    source_id: str,
+    *,
+    status: str | None = None,
+    count: int | None = None,
+    error: str | None = None,
+) -> None:
+    # Timestamps come from the database clock so no per-call datetime is built or bound.
+    sets = ["updated_at = now()"]
+    params: dict[str, Any] = {"id": _uuid_param(source_id)}
+    if count is not None:
+        sets += ["last_event_count = :count", "last_scraped_at = now()", "last_error = NULL"]
+        params["count"] = count
+        if count == 0:
+            status = "stale"
+        elif status is None:
+            status = "active"
+    if status is not None:
+        sets.append("status = :status")
+        params["status"] = status
+    if error is not None:
+        sets.append("last_error = :error")
+        params["error"] = error
+    await session.execute(text(f"UPDATE sources SET {', '.join(sets)} WHERE id = :id"), params)
+
+
 class PostgresDatabase:
     """Postgres implementation behind the existing DB API."""
 
-    def __init__(self, database_url: str | None = None) -> None:
+    def __init__(
+        self, database_url: str | None = None, *, read_database_url: str | None = None
+    ) -> None:
         resolved_url = database_url or settings.database_url
         if not resolved_url.startswith(POSTGRES_SCHEME_PREFIX):
             raise ValueError(
                 "DATABASE_URL must use a PostgreSQL async SQLAlchemy URL "
                 f"({POSTGRES_SCHEME_PREFIX}...). Got: {resolved_url}"
             )
+        resolved_read_url = read_database_url or settings.database_read_url or resolved_url
+        if not resolved_read_url.startswith(POSTGRES_SCHEME_PREFIX):
+            raise ValueError(
+                "DATABASE_READ_URL must use a PostgreSQL async SQLAlchemy URL "
+                f"({POSTGRES_SCHEME_PREFIX}...). Got: {resolved_read_url}"
+            )
         self.database_url = resolved_url
+        self.read_database_url = resolved_read_url
         self.engine: AsyncEngine | None = None
         self.sessionmaker: async_sessionmaker[AsyncSession] | None = None
+        self.read_engine: AsyncEngine | None = None
+        self.read_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+        # Distinct cities/sources only change when scrapes land; keyed by city scope.
+        self._filter_options_cache: dict[
+            tuple[str, ...] | None, tuple[float, dict[str, list[str]]]
+        ] = {}
 
     @property
     def db_path(self) -> str | None:
         return None
 
     async def connect(self) -> None:
-        self.engine = get_engine(self.database_url)
-        self.sessionmaker = get_sessionmaker(self.database_url)
+        # Each instance owns its pools: asyncpg connections are bound to the event loop
+        # that opened them, and the web app, CLI, and scheduler each run their own loop.
+        self.engine = create_engine(self.database_url)
+        self.sessionmaker = create_sessionmaker(self.engine)
+        if self.read_database_url == self.database_url:
+            self.read_engine = self.engine
+        else:
+            self.read_engine = create_engine(self.read_database_url)
+        self.read_sessionmaker = create_sessionmaker(self.read_engine)
         async with self.engine.connect() as conn:
             await ensure_postgres_schema_current(conn)
 
     async def close(self) -> None:
+        if self.read_engine is not None and self.read_engine is not self.engine:
+            await self.read_engine.dispose()
+        self.read_engine = None
+        self.read_sessionmaker = None
         if self.engine is not None:
             await self.engine.dispose()
             self.engine = None
@@ -150,6 +407,30 @@ class PostgresDatabase:
         async with self.sessionmaker() as session:
             yield session
 
+    @asynccontextmanager
+    async def read_session(self):
+        """Session for browse/search reads, served by DATABASE_READ_URL when configured.
+
+        Read-your-writes lookups (jobs, source-by-url, untagged events) stay on ``session()``.
+        """
+        if self.read_sessionmaker is None:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        async with self.read_sessionmaker() as session:
+            yield session
+
+    async def vacuum_events(self) -> None:
+        """Reclaim dead event tuples and refresh planner stats after a scrape's upserts.
+
+        ANALYZE keeps the city/start_time and toddler-score index choices in search_events
+        accurate as the table grows. VACUUM cannot run inside a transaction block, so this
+        uses an autocommit connection.
+        """
+        if self.engine is None:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("VACUUM (ANALYZE) events"))
+
     async def health_stats(self) -> dict[str, Any]:
         cutoff = utc_now() - timedelta(seconds=settings.background_job_timeout_seconds)
         async with self.session() as session:
@@ -185,115 +466,89 @@ class PostgresDatabase:
             }
 
     async def upsert_event(self, event: Event) -> str:
-        event.location_city = (event.location_city or "").strip()
         async with self.session() as session:
+            [event_id] = await self._upsert_events_in_session([event], session=session)
+            await session.commit()
+        self._filter_options_cache.clear()
+        return event_id
+
+    async def upsert_events(
+        self, events: list[Event], *, source_id: str | None = None
+    ) -> list[str]:
+        """Upsert a scrape batch in one transaction; returns ids in input order.
+
+        When ``source_id`` is given, the source's scrape status and event count are
+        recorded in the same transaction, so a scraped source costs a single commit.
+        """
+        if not events and source_id is None:
+            return []
+        async with self.session() as session:
+            event_ids = await self._upsert_events_in_session(events, session=session)
+            if source_id is not None:
+                await _update_source_status_in_session(session, source_id, count=len(events))
+            await session.commit()
+        self._filter_options_cache.clear()
+        return event_ids
+
+    async def _upsert_events_in_session(
+        self, events: list[Event], *, session: AsyncSession
+    ) -> list[str]:
+        if not events:
+            return []
+        for event in events:
+            event.location_city = (event.location_city or "").strip()
             if not event.location_city:
                 event.location_city = await self._fallback_event_city(event, session=session)
             event.city_slug = normalize_city_slug(event.location_city)
-            existing_result = await session.execute(
-                text("SELECT id FROM events WHERE source = :source AND source_id = :source_id"),
-                {"source": event.source, "source_id": event.source_id},
-            )
-            existing = existing_result.mappings().first()
-            if existing:
-                event.id = _normalize_uuid(existing["id"]) or event.id
 
-            if not existing:
-                canonical_id, _dedupe_reason = await self._find_duplicate_event_id(
-                    event, session=session
-                )
-                if canonical_id:
-                    await session.execute(
-                        text(
-                            """
-                            UPDATE events
-                            SET description = CASE
-                                    WHEN (description IS NULL OR description = '') AND :description != '' THEN :description
-                                    ELSE description
-                                END,
-                                location_name = CASE
-                                    WHEN (location_name IS NULL OR location_name = '') AND :location_name != '' THEN :location_name
-                                    ELSE location_name
-                                END,
-                                location_address = CASE
-                                    WHEN (location_address IS NULL OR location_address = '') AND :location_address != '' THEN :location_address
-                                    ELSE location_address
-                                END,
-                                latitude = COALESCE(latitude, :latitude),
-                                longitude = COALESCE(longitude, :longitude),
-                                end_time = COALESCE(end_time, :end_time),
-                                image_url = COALESCE(image_url, :image_url),
-                                scraped_at = CASE
-                                    WHEN scraped_at < :scraped_at THEN :scraped_at
-                                    ELSE scraped_at
-                                END,
-                                tags = COALESCE(tags, CAST(:tags AS jsonb)),
-                                score_breakdown = COALESCE(score_breakdown, CAST(:score_breakdown AS jsonb)),
-                                city_slug = :city_slug,
-                                location_city = CASE
-                                    WHEN (location_city IS NULL OR location_city = '' OR location_city = 'unknown') AND :location_city != '' THEN :location_city
-                                    ELSE location_city
-                                END
-                            WHERE id = :canonical_id
-                            """
-                        ),
-                        self._event_params(event) | {"canonical_id": canonical_id},
-                    )
-                    await session.commit()
-                    return canonical_id
+        # One lookup for the whole batch instead of a SELECT per event.
+        existing_result = await session.execute(
+            _SELECT_EVENT_IDS_BY_SOURCE_SQL,
+            {
+                "sources": [event.source for event in events],
+                "source_ids": [event.source_id for event in events],
+            },
+        )
+        known_ids = {
+            (row["source"], row["source_id"]): _normalize_uuid(row["id"])
+            for row in existing_result.mappings()
+        }
 
-            await session.execute(
-                text(
-                    """
-                    INSERT INTO events (
-                        id, source, source_url, source_id, title, description,
-                        location_name, location_address, location_city, city_slug,
-                        latitude, longitude, start_time, end_time,
-                        is_recurring, recurrence_rule, is_free,
-                        price_min, price_max, image_url,
-                        scraped_at, raw_data, tags, tagged_at, score_breakdown
-                    ) VALUES (
-                        :id, :source, :source_url, :source_id, :title, :description,
-                        :location_name, :location_address, :location_city, :city_slug,
-                        :latitude, :longitude, :start_time, :end_time,
-                        :is_recurring, :recurrence_rule, :is_free,
-                        :price_min, :price_max, :image_url,
-                        :scraped_at, CAST(:raw_data AS jsonb), CAST(:tags AS jsonb), :tagged_at, CAST(:score_breakdown AS jsonb)
-                    )
-                    ON CONFLICT (source, source_id) DO UPDATE SET
-                        source_url = EXCLUDED.source_url,
-                        title = EXCLUDED.title,
-                        description = EXCLUDED.description,
-                        location_name = EXCLUDED.location_name,
-                        location_address = EXCLUDED.location_address,
-                        location_city = EXCLUDED.location_city,
-                        city_slug = EXCLUDED.city_slug,
-                        latitude = EXCLUDED.latitude,
-                        longitude = EXCLUDED.longitude,
-                        start_time = EXCLUDED.start_time,
-                        end_time = EXCLUDED.end_time,
-                        is_recurring = EXCLUDED.is_recurring,
-                        recurrence_rule = EXCLUDED.recurrence_rule,
-                        is_free = EXCLUDED.is_free,
-                        price_min = EXCLUDED.price_min,
-                        price_max = EXCLUDED.price_max,
-                        image_url = EXCLUDED.image_url,
-                        scraped_at = EXCLUDED.scraped_at,
-                        raw_data = EXCLUDED.raw_data
-                    RETURNING id
-                    """
-                ),
-                self._event_params(event),
-            )
-            await session.commit()
-            result = await session.execute(
-                text("SELECT id FROM events WHERE source = :source AND source_id = :source_id"),
-                {"source": event.source, "source_id": event.source_id},
+        event_ids: list[str] = []
+        refresh_params: list[dict[str, Any]] = []
+        for event in events:
+            key = (event.source, event.source_id)
+            existing_id = known_ids.get(key)
+            if existing_id:
+                event.id = existing_id
+                event_ids.append(existing_id)
+                refresh_params.append(self._event_params(event))
+                continue
+
+            # Flush pending refreshes first so duplicate detection sees rows in input order.
+            if refresh_params:
+                await session.execute(_REFRESH_EVENTS_SQL, refresh_params)
+                refresh_params = []
+
+            canonical_id, _dedupe_reason = await self._find_duplicate_event_id(
+                event, session=session
             )
-            row = result.mappings().first()
-            if not row:
-                return event.id
-            return _normalize_uuid(row["id"]) or event.id
+            if canonical_id:
+                await session.execute(
+                    _MERGE_DUPLICATE_EVENT_SQL,
+                    self._event_params(event) | {"canonical_id": canonical_id},
+                )
+                event_ids.append(canonical_id)
+                continue
+
+            result = await session.execute(_UPSERT_EVENT_SQL, self._event_params(event))
+            event_id = _normalize_uuid(result.scalar_one()) or event.id
+            known_ids[key] = event_id
+            event_ids.append(event_id)
+
+        if refresh_params:
+            await session.execute(_REFRESH_EVENTS_SQL, refresh_params)
+        return event_ids
 
     def _event_params(self, event: Event) -> dict[str, Any]:
         return {
@@ -318,10 +573,12 @@ class PostgresDatabase:
             "price_max": event.price_max,
             "image_url": event.image_url,
             "scraped_at": event.scraped_at,
-            "raw_data": json.dumps(event.raw_data),
-            "tags": json.dumps(event.tags.model_dump()) if event.tags else None,
+            "raw_data": _json_param(event.raw_data),
+            "tags": event.tags.model_dump_json() if event.tags else None,
             "tagged_at": None,
-            "score_breakdown": json.dumps(event.score_breakdown) if event.score_breakdown else None,
+            "score_breakdown": _json_param(event.score_breakdown)
+            if event.score_breakdown
+            else None,
         }
 
     async def _fallback_event_city(
@@ -428,7 +685,7 @@ class PostgresDatabase:
                 conditions.append("COALESCE(ues.saved, false) = true")
             elif saved == "no":
                 conditions.append("COALESCE(ues.saved, false) = false")
-        async with self.session() as session:
+        async with self.read_session() as session:
             result = await session.execute(
                 text(
                     f"""
@@ -486,8 +743,8 @@ class PostgresDatabase:
                     "UPDATE events SET tags = CAST(:tags AS jsonb), score_breakdown = CAST(:score_breakdown AS jsonb), tagged_at = :tagged_at WHERE id = :id"
                 ),
                 {
-                    "tags": json.dumps(tags.model_dump()),
-                    "score_breakdown": json.dumps(score_breakdown) if score_breakdown else None,
+                    "tags": tags.model_dump_json(),
+                    "score_breakdown": _json_param(score_breakdown) if score_breakdown else None,
                     "tagged_at": utc_now(),
                     "id": _uuid_param(event_id),
                 },
@@ -524,13 +781,20 @@ class PostgresDatabase:
         *,
         viewer_user_id: str | None = None,
         visible_city_slugs: list[str] | None = None,
+        exclude_ids: list[str] | None = None,
     ) -> list[Event]:
-        now, future = time_window(days)
         select_cols, join_sql, extra_params = _event_query_parts(viewer_user_id)
-        conditions = ["e.start_time >= :now", "e.start_time <= :future"]
-        params: dict[str, Any] = {"now": now, "future": future, **extra_params}
+        # Let Postgres evaluate the window against its own clock; only the day count is bound.
+        conditions = [
+            "e.start_time >= now()",
+            "e.start_time <= now() + make_interval(days => :days)",
+        ]
+        params: dict[str, Any] = {"days": days, **extra_params}
         _add_city_slug_filter(conditions, params, visible_city_slugs)
-        async with self.session() as session:
+        if exclude_ids:
+            conditions.append("NOT (e.id = ANY(CAST(:exclude_ids AS uuid[])))")
+            params["exclude_ids"] = [_uuid_param(event_id) for event_id in exclude_ids]
+        async with self.read_session() as session:
             result = await session.execute(
                 text(
                     f"""
@@ -569,7 +833,7 @@ class PostgresDatabase:
             elif saved == "no":
                 conditions.append("COALESCE(ues.saved, false) = false")
         sql = f"SELECT {select_cols} FROM events e {join_sql} WHERE {' AND '.join(conditions)} ORDER BY e.start_time"
-        async with self.session() as session:
+        async with self.read_session() as session:
             result = await session.execute(text(sql), params)
             return [_row_to_event(row) for row in result.mappings().all()]
 
@@ -589,15 +853,26 @@ class PostgresDatabase:
         sort: str = "start_time",
         page: int = 1,
         per_page: int = 25,
+        after_start_time: datetime | None = None,
+        after_id: str | None = None,
     ) -> tuple[list[Event], int]:
-        now, future = time_window(days)
-        select_cols, join_sql, extra_params = _event_query_parts(viewer_user_id)
-        conditions = ["e.start_time >= :now", "e.start_time <= :future"]
-        params: dict[str, Any] = {"now": now, "future": future, **extra_params}
+        """Return one page of matching events and the unpaged total.
+
+        With ``sort="start_time"``, passing the last row's ``(start_time, id)`` as
+        ``after_start_time``/``after_id`` seeks straight to the next page instead of
+        discarding ``OFFSET`` rows; other sorts always page by ``page``.
+        """
+        select_cols, join_sql, extra_params = _event_query_parts(
+            viewer_user_id, event_columns=_EVENT_LIST_COLUMNS
+        )
+        # Let Postgres evaluate the window against its own clock; only the day count is bound.
+        conditions = [
+            "e.start_time >= now()",
+            "e.start_time <= now() + make_interval(days => :days)",
+        ]
+        params: dict[str, Any] = {"days": days, **extra_params}
         _add_city_slug_filter(conditions, params, visible_city_slugs)
-        if q:
-            conditions.append("(e.title ILIKE :q OR e.description ILIKE :q)")
-            params["q"] = f"%{q}%"
+        _add_text_search_filter(conditions, params, q)
         if city:
             conditions.append("e.city_slug = :city_slug")
             params["city_slug"] = normalize_city_slug(city)
@@ -624,7 +899,7 @@ class PostgresDatabase:
             params["score_min"] = score_min
         where = " AND ".join(conditions)
         valid_sorts = {
-            "start_time": "e.start_time",
+            "start_time": "e.start_time, e.id",
             "-start_time": "e.start_time DESC",
             "title": "e.title",
             "-title": "e.title DESC",
@@ -636,56 +911,65 @@ class PostgresDatabase:
             "-score": "CAST(e.tags->>'toddler_score' AS INTEGER) DESC",
         }
         order_clause = valid_sorts.get(sort, "e.start_time")
-        offset = (page - 1) * per_page
+        cursor_condition = ""
+        if sort == "start_time" and after_start_time is not None and after_id:
+            cursor_condition = "(e.start_time, e.id) > (:after_start_time, :after_id)"
+            params |= {"after_start_time": after_start_time, "after_id": _uuid_param(after_id)}
+            offset = 0
+        else:
+            offset = (page - 1) * per_page
         params |= {"limit": per_page, "offset": offset}
-        async with self.session() as session:
-            count_result = await session.execute(
-                text(f"SELECT COUNT(*) FROM events e {join_sql} WHERE {where}"), params
-            )
-            total_row = count_result.first()
-            total = int(total_row[0] if total_row else 0)
-            result = await session.execute(
-                text(
-                    f"SELECT {select_cols} FROM events e {join_sql} WHERE {where} ORDER BY {order_clause} LIMIT :limit OFFSET :offset"
-                ),
-                params,
+        async with self.read_session() as session:
+            return await _fetch_event_page(
+                session,
+                select_cols=select_cols,
+                join_sql=join_sql,
+                where=where,
+                order_clause=order_clause,
+                params=params,
+                cursor_condition=cursor_condition,
             )
-            return [_row_to_event(row) for row in result.mappings().all()], total
 
     async def get_filter_options(
         self,
         *,
         visible_city_slugs: list[str] | None = None,
     ) -> dict[str, list[str]]:
-        async with self.session() as session:
-            city_conditions: list[str] = []
-            params: dict[str, Any] = {}
-            _add_city_slug_filter(city_conditions, params, visible_city_slugs, column="city_slug")
-            city_where = f"WHERE {' AND '.join(city_conditions)}" if city_conditions else ""
-            city_rows = (
+        cache_key = tuple(visible_city_slugs) if visible_city_slugs else None
+        cached = self._filter_options_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < FILTER_OPTIONS_CACHE_TTL_SECONDS:
+            return {key: list(values) for key, values in cached[1].items()}
+        city_conditions: list[str] = []
+        params: dict[str, Any] = {}
+        _add_city_slug_filter(city_conditions, params, visible_city_slugs, column="city_slug")
+        city_where = f"WHERE {' AND '.join(city_conditions)}" if city_conditions else ""
+        async with self.read_session() as session:
+            # One round trip and one scan of the scoped rows for both dropdowns.
+            rows = (
                 await session.execute(
                     text(
                         f"""
-                        SELECT MIN(location_city) AS location_city
-                        FROM events
-                        {city_where}
+                        WITH scoped AS (
+                            SELECT city_slug, location_city, source FROM events {city_where}
+                        )
+                        SELECT 'cities' AS kind, MIN(location_city) AS value
+                        FROM scoped
                         GROUP BY city_slug
-                        ORDER BY location_city
+                        UNION ALL
+                        SELECT 'sources' AS kind, source AS value
+                        FROM scoped
+                        GROUP BY source
+                        ORDER BY kind, value
                         """
                     ),
                     params,
                 )
             ).all()
-            source_rows = (
-                await session.execute(
-                    text(f"SELECT DISTINCT source FROM events {city_where} ORDER BY source"),
-                    params,
-                )
-            ).all()
-            return {
-                "cities": [str(row[0]) for row in city_rows],
-                "sources": [str(row[0]) for row in source_rows],
-            }
+        options: dict[str, list[str]] = {"cities": [], "sources": []}
+        for kind, value in rows:
+            options[kind].append(str(value))
+        self._filter_options_cache[cache_key] = (time.monotonic(), options)
+        return {key: list(values) for key, values in options.items()}
 
     async def create_source(self, source: Source) -> str:
         source.city_slug = normalize_city_slug(source.city)
@@ -729,13 +1013,61 @@ class PostgresDatabase:
             row = result.mappings().first()
             return _row_to_source(row) if row else None
 
-    async def get_all_sources(self) -> list[Source]:
+    async def get_cached_recipe_json(
+        self, url: str, *, max_age: timedelta, min_confidence: float
+    ) -> str | None:
+        """Return a cached analyzer recipe for *url* if it is fresh and confident enough."""
+        async with self.read_session() as session:
+            result = await session.execute(
+                text(
+                    """
+                    SELECT recipe_json FROM scrape_recipes
+                    WHERE url_hash = :url_hash
+                      AND analyzed_at >= :cutoff
+                      AND confidence >= :min_confidence
+                    """
+                ),
+                {
+                    "url_hash": _recipe_url_hash(url),
+                    "cutoff": utc_now() - max_age,
+                    "min_confidence": min_confidence,
+                },
+            )
+            return result.scalar_one_or_none()
+
+    async def cache_recipe(
+        self, url: str, recipe_json: str, *, confidence: float, analyzed_at: datetime
+    ) -> None:
         async with self.session() as session:
+            await session.execute(
+                text(
+                    """
+                    INSERT INTO scrape_recipes (url_hash, url, recipe_json, confidence, analyzed_at)
+                    VALUES (:url_hash, :url, :recipe_json, :confidence, :analyzed_at)
+                    ON CONFLICT (url_hash) DO UPDATE SET
+                        url = EXCLUDED.url,
+                        recipe_json = EXCLUDED.recipe_json,
+                        confidence = EXCLUDED.confidence,
+                        analyzed_at = EXCLUDED.analyzed_at
+                    """
+                ),
+                {
+                    "url_hash": _recipe_url_hash(url),
+                    "url": url,
+                    "recipe_json": recipe_json,
+                    "confidence": confidence,
+                    "analyzed_at": analyzed_at,
+                },
+            )
+            await session.commit()
+
+    async def get_all_sources(self) -> list[Source]:
+        async with self.read_session() as session:
             result = await session.execute(text("SELECT * FROM sources ORDER BY created_at DESC"))
             return [_row_to_source(row) for row in result.mappings().all()]
 
     async def get_enabled_sources(self) -> list[Source]:
-        async with self.session() as session:
+        async with self.read_session() as session:
             result = await session.execute(
                 text(
                     "SELECT * FROM sources WHERE enabled = true AND builtin = false AND status IN ('active', 'stale') ORDER BY created_at"
@@ -749,14 +1081,9 @@ class PostgresDatabase:
         async with self.session() as session:
             await session.execute(
                 text(
-                    "UPDATE sources SET recipe_json = :recipe_json, status = :status, updated_at = :now WHERE id = :id"
+                    "UPDATE sources SET recipe_json = :recipe_json, status = :status, updated_at = now() WHERE id = :id"
                 ),
-                {
-                    "recipe_json": recipe_json,
-                    "status": status,
-                    "now": utc_now(),
-                    "id": _uuid_param(source_id),
-                },
+                {"recipe_json": recipe_json, "status": status, "id": _uuid_param(source_id)},
             )
             await session.commit()
 
@@ -768,44 +1095,30 @@ class PostgresDatabase:
         count: int | None = None,
         error: str | None = None,
     ) -> None:
-        sets = ["updated_at = :now"]
-        params: dict[str, Any] = {"now": utc_now(), "id": _uuid_param(source_id)}
-        if status is not None:
-            sets.append("status = :status")
-            params["status"] = status
-        if count is not None:
-            sets += ["last_event_count = :count", "last_scraped_at = :now", "last_error = NULL"]
-            params["count"] = count
-            if count == 0:
-                sets.append("status = 'stale'")
-            elif status is None:
-                sets.append("status = 'active'")
-        if error is not None:
-            sets.append("last_error = :error")
-            params["error"] = error
         async with self.session() as session:
-            await session.execute(
-                text(f"UPDATE sources SET {', '.join(sets)} WHERE id = :id"), params
+            await _update_source_status_in_session(
+                session, source_id, status=status, count=count, error=error
             )
             await session.commit()
 
     async def toggle_source(self, source_id: str) -> bool:
         async with self.session() as session:
-            await session.execute(
+            result = await session.execute(
                 text(
                     """
                     UPDATE sources
                     SET enabled = NOT enabled,
                         status = CASE WHEN enabled THEN 'disabled' ELSE 'active' END,
-                        updated_at = :now
+                        updated_at = now()
                     WHERE id = :id
+                    RETURNING enabled
                     """
                 ),
-                {"now": utc_now(), "id": _uuid_param(source_id)},
+                {"id": _uuid_param(source_id)},
             )
+            enabled = result.scalar_one_or_none()
             await session.commit()
-        source = await self.get_source(source_id)
-        return source.enabled if source else False
+        return bool(enabled)
 
     async def delete_source(self, source_id: str) -> None:
         source = await self.get_source(source_id)
@@ -819,6 +1132,7 @@ class PostgresDatabase:
                 text("DELETE FROM sources WHERE id = :id"), {"id": _uuid_param(source_id)}
             )
             await session.commit()
+        self._filter_options_cache.clear()
 
     async def get_or_create_user_event_state(self, user_id: str, event_id: str) -> UserEventState:
         async with self.session() as session:
@@ -917,29 +1231,31 @@ class PostgresDatabase:
             return
         async with self.session() as session:
             now = utc_now()
-            for event_id in event_ids:
-                await session.execute(
-                    text(
-                        """
-                        INSERT INTO user_event_state (
-                            user_id, event_id, saved, attended, saved_at, attended_at, created_at, updated_at
-                        ) VALUES (
-                            :user_id, :event_id, false, :attended, NULL, :attended_at, :now, :now
-                        )
-                        ON CONFLICT (user_id, event_id) DO UPDATE SET
-                            attended = :attended,
-                            attended_at = :attended_at,
-                            updated_at = :now
-                        """
+            # One set-based statement instead of a round trip per event.
+            await session.execute(
+                text(
+                    """
+                    INSERT INTO user_event_state (
+                        user_id, event_id, saved, attended, saved_at, attended_at, created_at, updated_at
+                    )
+                    SELECT :user_id, event_id, false, :attended, NULL, :attended_at, :now, :now
+                    FROM unnest(CAST(:event_ids AS uuid[])) AS ids(event_id)
+                    ON CONFLICT (user_id, event_id) DO UPDATE SET
+                        attended = :attended,
+                        attended_at = :attended_at,
+                        updated_at = :now
+                    """
+                ),
+                {
+                    "user_id": _uuid_param(user_id),
+                    "event_ids": list(
+                        dict.fromkeys(_uuid_param(event_id) for event_id in event_ids)
                     ),
-                    {
-                        "user_id": _uuid_param(user_id),
-                        "event_id": _uuid_param(event_id),
-                        "attended": attended,
-                        "attended_at": now if attended else None,
-                        "now": now,
-                    },
-                )
+                    "attended": attended,
+                    "attended_at": now if attended else None,
+                    "now": now,
+                },
+            )
             await session.commit()
 
     async def list_my_events(
@@ -956,12 +1272,12 @@ class PostgresDatabase:
         page: int = 1,
         per_page: int = 25,
     ) -> tuple[list[Event], int]:
-        select_cols, join_sql, extra_params = _event_query_parts(viewer_user_id)
+        select_cols, join_sql, extra_params = _event_query_parts(
+            viewer_user_id, event_columns=_EVENT_LIST_COLUMNS
+        )
         conditions = ["(COALESCE(ues.saved, false) = true OR COALESCE(ues.attended, false) = true)"]
         params: dict[str, Any] = dict(extra_params)
-        if q:
-            conditions.append("(e.title ILIKE :q OR e.description ILIKE :q)")
-            params["q"] = f"%{q}%"
+        _add_text_search_filter(conditions, params, q)
         if city:
             conditions.append("e.city_slug = :city_slug")
             params["city_slug"] = normalize_city_slug(city)
@@ -999,26 +1315,14 @@ class PostgresDatabase:
         where = " AND ".join(conditions)
 
         async with self.session() as session:
-            count_result = await session.execute(
-                text(f"SELECT COUNT(*) FROM events e {join_sql} WHERE {where}"),
-                params,
+            return await _fetch_event_page(
+                session,
+                select_cols=select_cols,
+                join_sql=join_sql,
+                where=where,
+                order_clause=order_clause,
+                params=params,
             )
-            total_row = count_result.first()
-            total = int(total_row[0] if total_row else 0)
-            result = await session.execute(
-                text(
-                    f"""
-                    SELECT {select_cols}
-                    FROM events e
-                    {join_sql}
-                    WHERE {where}
-                    ORDER BY {order_clause}
-                    LIMIT :limit OFFSET :offset
-                    """
-                ),
-                params,
-            )
-            return [_row_to_event(row) for row in result.mappings().all()], total
 
     async def create_job(self, job: Job) -> str:
         async with self.session() as session:
@@ -1278,36 +1582,7 @@ class PostgresDatabase:
                         canonical.append(event)
                         continue
                     await session.execute(
-                        text(
-                            """
-                            UPDATE events
-                            SET description = CASE
-                                    WHEN (description IS NULL OR description = '') AND :description != '' THEN :description
-                                    ELSE description
-                                END,
-                                location_name = CASE
-                                    WHEN (location_name IS NULL OR location_name = '') AND :location_name != '' THEN :location_name
-                                    ELSE location_name
-                                END,
-                                location_address = CASE
-                                    WHEN (location_address IS NULL OR location_address = '') AND :location_address != '' THEN :location_address
-                                    ELSE location_address
-                                END,
-                                latitude = COALESCE(latitude, :latitude),
-                                longitude = COALESCE(longitude, :longitude),
-                                end_time = COALESCE(end_time, :end_time),
-                                image_url = COALESCE(image_url, :image_url),
-                                scraped_at = CASE WHEN scraped_at < :scraped_at THEN :scraped_at ELSE scraped_at END,
-                                tags = COALESCE(tags, CAST(:tags AS jsonb)),
-                                score_breakdown = COALESCE(score_breakdown, CAST(:score_breakdown AS jsonb)),
-                                city_slug = :city_slug,
-                                location_city = CASE
-                                    WHEN (location_city IS NULL OR location_city = '' OR location_city = 'unknown') AND :location_city != '' THEN :location_city
-                                    ELSE location_city
-                                END
-                            WHERE id = :canonical_id
-                            """
-                        ),
+                        _MERGE_DUPLICATE_EVENT_SQL,
                         self._event_params(event) | {"canonical_id": duplicate_of.id},
                     )
                     await session.execute(
@@ -1345,7 +1620,8 @@ class PostgresDatabase:
                     )
                     merged += 1
             await session.commit()
-            return {"total_scanned": total, "merged": merged, "remaining": total - merged}
+        self._filter_options_cache.clear()
+        return {"total_scanned": total, "merged": merged, "remaining": total - merged}
 
     async def __aenter__(self) -> PostgresDatabase:
         await self.connect()
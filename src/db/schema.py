@@ -59,6 +59,7 @@ events = Table(
 Index("idx_events_start_time", events.c.start_time)
 Index("idx_events_source", events.c.source, events.c.source_id)
 Index("idx_events_city", events.c.city_slug)
+Index("idx_events_city_start_time", events.c.city_slug, events.c.start_time)
 Index("idx_events_tagging_version", text("((tags->>'tagging_version'))"), postgresql_using="btree")
 Index(
     "idx_events_toddler_score",
@@ -181,3 +182,13 @@ jobs = Table(
 Index("idx_jobs_owner_created", jobs.c.owner_user_id, jobs.c.created_at)
 Index("idx_jobs_source_created", jobs.c.source_id, jobs.c.created_at)
 Index("idx_jobs_key_state", jobs.c.job_key, jobs.c.state)
+
+scrape_recipes = Table(
+    "scrape_recipes",
+    metadata,
+    Column("url_hash", Text, primary_key=True),
+    Column("url", Text, nullable=False),
+    Column("recipe_json", Text, nullable=False),
+    Column("confidence", Float, nullable=False),
+    Column("analyzed_at", DateTime(timezone=True), nullable=False),
+)
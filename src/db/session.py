@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -11,22 +14,45 @@ from sqlalchemy.ext.asyncio import (
 
 from src.config import settings
 
-_engine: AsyncEngine | None = None
-_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+APPLICATION_NAME = "family-events"
+PREPARED_STATEMENT_CACHE_SIZE = 256
+
+
+def connection_server_settings() -> dict[str, str]:
+    """Per-connection Postgres settings applied when asyncpg opens a connection."""
+    return {
+        "application_name": APPLICATION_NAME,
+        "lock_timeout": str(max(0, settings.database_lock_timeout_ms)),
+        "synchronous_commit": settings.database_synchronous_commit,
+    }
+
+
+def _json_serializer(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+def engine_options() -> dict[str, Any]:
+    return {
+        # JSONB columns round-trip through asyncpg's text codec; orjson keeps that off the
+        # hot path when list views materialize hundreds of tagged events.
+        "json_serializer": _json_serializer,
+        "json_deserializer": orjson.loads,
+        "pool_size": max(1, settings.database_pool_size),
+        "max_overflow": max(0, settings.database_max_overflow),
+        "connect_args": {
+            "server_settings": connection_server_settings(),
+            # Keep every hot upsert/search statement prepared per connection (default is 100).
+            "prepared_statement_cache_size": PREPARED_STATEMENT_CACHE_SIZE,
+        },
+    }
 
 
-def get_engine(database_url: str | None = None) -> AsyncEngine:
-    global _engine, _sessionmaker
-    resolved_url = database_url or settings.database_url
-    if _engine is None or str(_engine.url) != resolved_url:
-        _engine = create_async_engine(resolved_url, future=True)
-        _sessionmaker = async_sessionmaker(_engine, expire_on_commit=False)
-    return _engine
+def create_engine(database_url: str | None = None) -> AsyncEngine:
+    """Build a new engine with its own pool; callers own and dispose it."""
+    return create_async_engine(
+        database_url or settings.database_url, future=True, **engine_options()
+    )
 
 
-def get_sessionmaker(database_url: str | None = None) -> async_sessionmaker[AsyncSession]:
-    global _sessionmaker
-    if _sessionmaker is None:
-        get_engine(database_url)
-    assert _sessionmaker is not None
-    return _sessionmaker
+def create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(engine, expire_on_commit=False)
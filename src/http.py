@@ -18,6 +18,8 @@ DEFAULT_USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/125.0.0.0 Safari/537.36"
 )
+# Accept-Encoding is left to httpx: it advertises exactly the decoders it can use,
+# which includes "br" because brotli is a project dependency.
 DEFAULT_HEADERS = {
     "User-Agent": DEFAULT_USER_AGENT,
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -25,6 +27,9 @@ DEFAULT_HEADERS = {
 }
 RETRYABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Request extension overriding the client's service label in retry logs, so callers that
+# share one client across providers still say which provider a retry belongs to.
+SERVICE_EXTENSION = "family_events.service"
 
 
 class LoggedRetryTransport(httpx.AsyncBaseTransport):
@@ -44,6 +49,7 @@ class LoggedRetryTransport(httpx.AsyncBaseTransport):
         self._backoff_seconds = max(0.0, backoff_seconds)
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        service = request.extensions.get(SERVICE_EXTENSION, self._service)
         last_error: Exception | None = None
         for attempt in range(self._max_retries + 1):
             try:
@@ -55,7 +61,7 @@ class LoggedRetryTransport(httpx.AsyncBaseTransport):
                 ):
                     logger.warning(
                         "external_http_retry service=%s method=%s url=%s status=%s attempt=%s/%s",
-                        self._service,
+                        service,
                         request.method,
                         request.url,
                         response.status_code,
@@ -72,7 +78,7 @@ class LoggedRetryTransport(httpx.AsyncBaseTransport):
                     break
                 logger.warning(
                     "external_http_retry service=%s method=%s url=%s error=%s attempt=%s/%s",
-                    self._service,
+                    service,
                     request.method,
                     request.url,
                     exc.__class__.__name__,
@@ -3,13 +3,9 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 
 
 def cli() -> None:
-    from src.config import settings
-    from src.observability import configure_logging
-
     parser = argparse.ArgumentParser(description="Family Events Discovery System")
     sub = parser.add_subparsers(dest="command")
 
@@ -25,6 +21,14 @@ def cli() -> None:
     sub.add_parser("dedupe", help="Backfill-dedupe existing events in database")
 
     args = parser.parse_args()
+
+    # Deferred until after argument parsing so `--help` and usage errors skip loading
+    # settings, logging and the event loop machinery.
+    import asyncio
+
+    from src.config import settings
+    from src.observability import configure_logging
+
     configure_logging(
         app_env=settings.app_env,
         log_format=settings.log_format,
@@ -74,6 +78,7 @@ def cli() -> None:
 
 async def _list_events() -> None:
     from src.db.database import create_database
+    from src.timezones import format_clock_12h, weekday_abbr
 
     async with create_database() as db:
         events = await db.get_recent_events(days=30)
@@ -83,8 +88,13 @@ async def _list_events() -> None:
     for e in events:
         tagged = "✅" if e.tags else "⬜"
         score = f"toddler={e.tags.toddler_score}" if e.tags else "untagged"
+        start = e.start_time
+        when = (
+            f"{start.month:02d}/{start.day:02d} {weekday_abbr(start)} "
+            f"{format_clock_12h(start, minutes=False).upper()}"
+        )
         print(
-            f"{tagged} {e.start_time.strftime('%m/%d %a %-I%p')} | {e.title[:50]:50s} | {e.location_city:12s} | {e.source:12s} | {score}"
+            f"{tagged} {when} | {e.title[:50]:50s} | {e.location_city:12s} | {e.source:12s} | {score}"
         )
     print(f"\nTotal: {len(events)} events")
 
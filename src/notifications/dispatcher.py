@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime
+from functools import cached_property
 from typing import TypedDict
 
+import httpx
+
+from src.http import build_async_client, default_timeout
 from src.observability import log_event
 
 from .console import ConsoleNotifier
@@ -23,11 +28,43 @@ class NotificationResult(TypedDict):
 
 
 class NotificationDispatcher:
-    def __init__(self) -> None:
-        self.console = ConsoleNotifier()
-        self.sms = SMSNotifier()
-        self.telegram = TelegramNotifier()
-        self.email = EmailNotifier()
+    """Route a message to notifier channels.
+
+    Notifiers and the shared HTTP client are created on first use, so a console-only
+    dispatch never builds a client (and its TLS context).
+    """
+
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self._owns_client = client is None
+        self._client = client
+
+    def _http_client(self) -> httpx.AsyncClient:
+        # One keep-alive pool for every provider; each notifier sends its own auth headers.
+        if self._client is None:
+            self._client = build_async_client(
+                service="notify", timeout=default_timeout(), max_retries=0
+            )
+        return self._client
+
+    @cached_property
+    def console(self) -> ConsoleNotifier:
+        return ConsoleNotifier()
+
+    @cached_property
+    def sms(self) -> SMSNotifier:
+        return SMSNotifier(self._http_client())
+
+    @cached_property
+    def telegram(self) -> TelegramNotifier:
+        return TelegramNotifier(self._http_client())
+
+    @cached_property
+    def email(self) -> EmailNotifier:
+        return EmailNotifier(self._http_client())
+
+    async def aclose(self) -> None:
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
 
     def _result(
         self,
@@ -67,56 +104,15 @@ class NotificationDispatcher:
             sms_recipient=sms_to or "-",
         )
 
-        results: list[NotificationResult] = []
-        for channel in channels:
-            if channel == "email":
-                recipient = email_to
-                success = await self.email.send(message, to_email=email_to)
-                error = "" if success else "Email delivery failed"
-            elif channel == "sms":
-                recipient = sms_to
-                success = await self.sms.send(message, to_number=sms_to)
-                error = "" if success else "SMS delivery failed"
-            elif channel == "telegram":
-                recipient = "telegram"
-                success = await self.telegram.send(message)
-                error = "" if success else "Telegram delivery failed"
-            elif channel == "console":
-                recipient = "console"
-                success = await self.console.send(message)
-                error = "" if success else "Console delivery failed"
-            else:
-                log_event(
-                    logger,
-                    logging.WARNING,
-                    "notification_dispatch_unknown_channel",
-                    channel=channel,
-                )
-                results.append(
-                    self._result(
-                        channel=channel,
-                        success=False,
-                        error=f"Unknown channel: {channel}",
-                    )
+        # Providers are independent, so total latency is the slowest channel, not the sum.
+        results = list(
+            await asyncio.gather(
+                *(
+                    self._send(channel, message, email_to=email_to, sms_to=sms_to)
+                    for channel in channels
                 )
-                continue
-
-            result = self._result(
-                channel=channel,
-                success=success,
-                recipient=recipient,
-                error=error,
-            )
-            results.append(result)
-            log_event(
-                logger,
-                logging.INFO,
-                "notification_dispatch_result",
-                channel=channel,
-                success=success,
-                recipient=recipient or "-",
-                error=error or "-",
             )
+        )
 
         success_count = sum(1 for item in results if item["success"])
         log_event(
@@ -128,3 +124,56 @@ class NotificationDispatcher:
             failure_count=len(results) - success_count,
         )
         return results
+
+    async def _send(
+        self,
+        channel: str,
+        message: str,
+        *,
+        email_to: str,
+        sms_to: str,
+    ) -> NotificationResult:
+        if channel == "email":
+            recipient = email_to
+            success = await self.email.send(message, to_email=email_to)
+            error = "" if success else "Email delivery failed"
+        elif channel == "sms":
+            recipient = sms_to
+            success = await self.sms.send(message, to_number=sms_to)
+            error = "" if success else "SMS delivery failed"
+        elif channel == "telegram":
+            recipient = "telegram"
+            success = await self.telegram.send(message)
+            error = "" if success else "Telegram delivery failed"
+        elif channel == "console":
+            recipient = "console"
+            success = await self.console.send(message)
+            error = "" if success else "Console delivery failed"
+        else:
+            log_event(
+                logger,
+                logging.WARNING,
+                "notification_dispatch_unknown_channel",
+                channel=channel,
+            )
+            return self._result(
+                channel=channel,
+                success=False,
+                error=f"Unknown channel: {channel}",
+            )
+
+        log_event(
+            logger,
+            logging.INFO,
+            "notification_dispatch_result",
+            channel=channel,
+            success=success,
+            recipient=recipient or "-",
+            error=error or "-",
+        )
+        return self._result(
+            channel=channel,
+            success=success,
+            recipient=recipient,
+            error=error,
+        )
@@ -1,13 +1,20 @@
 import logging
+from contextlib import nullcontext
+
+import httpx
+import orjson
 
 from src.config import settings
-from src.http import build_async_client, default_timeout
+from src.http import SERVICE_EXTENSION, build_async_client, default_timeout
 from src.observability import log_event
 
 logger = logging.getLogger("uvicorn.error")
 
 
 class EmailNotifier:
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self._client = client
+
     async def send(self, message: str, *, to_email: str = "") -> bool:
         service = "notify.email.resend"
         if not settings.resend_api_key:
@@ -37,22 +44,26 @@ class EmailNotifier:
         try:
             html = message.replace("\n", "<br>")
 
-            async with build_async_client(
-                service=service,
-                timeout=default_timeout(),
-                headers={
-                    "Accept": "application/json",
-                    "Authorization": f"Bearer {settings.resend_api_key}",
-                },
-                max_retries=0,
+            async with (
+                nullcontext(self._client)
+                if self._client is not None
+                else build_async_client(service=service, timeout=default_timeout(), max_retries=0)
             ) as client:
                 resp = await client.post(
                     url,
-                    json={
-                        "from": settings.email_from,
-                        "to": [to_email],
-                        "subject": "🌟 Weekend Plans!",
-                        "html": html,
+                    extensions={SERVICE_EXTENSION: service},
+                    content=orjson.dumps(
+                        {
+                            "from": settings.email_from,
+                            "to": [to_email],
+                            "subject": "🌟 Weekend Plans!",
+                            "html": html,
+                        }
+                    ),
+                    headers={
+                        "Accept": "application/json",
+                        "Authorization": f"Bearer {settings.resend_api_key}",
+                        "Content-Type": "application/json",
                     },
                 )
                 resp.raise_for_status()
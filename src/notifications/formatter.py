@@ -2,9 +2,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from src.timezones import format_clock_12h, weekday_abbr
+
 if TYPE_CHECKING:
     from src.db.models import Event
 
+MEDALS = ("🥇 TOP PICK", "🥈", "🥉")
+
 
 def format_console_message(
     events_with_scores: list[tuple[Event, float]],
@@ -21,7 +25,6 @@ def format_console_message(
         f" / {sun_wx.icon} Sun {sun_wx.temp_high_f:.0f}°F"
     )
 
-    medals = ["🥇 TOP PICK", "🥈", "🥉"]
     lines = [
         f"🌟 Weekend Plans for {child_name}! 🌟",
         "",
@@ -29,13 +32,12 @@ def format_console_message(
         "",
     ]
 
-    for i, (event, _score) in enumerate(events_with_scores[:3]):
-        medal = medals[i] if i < 3 else f"#{i + 1}"
+    for medal, (event, _score) in zip(MEDALS, events_with_scores, strict=False):
         tags = event.tags
 
         # Day and time
-        day = event.start_time.strftime("%a")
-        time_str = event.start_time.strftime("%-I:%M%p").lower()
+        day = weekday_abbr(event.start_time)
+        time_str = format_clock_12h(event.start_time)
 
         # Price
         price = "Free" if event.is_free else f"${event.price_min or '?'}"
@@ -50,11 +52,13 @@ def format_console_message(
                 features.append("stroller-friendly")
         feature_str = ", ".join(features)
 
-        lines.append(f"{medal}: {event.title}")
-        lines.append(f"   📍 {event.location_city} | 🕐 {day} {time_str} | 💵 {price}")
+        entry = (
+            f"{medal}: {event.title}\n"
+            f"   📍 {event.location_city} | 🕐 {day} {time_str} | 💵 {price}"
+        )
         if feature_str:
-            lines.append(f"   ✨ {feature_str}")
-        lines.append("")
+            entry += f"\n   ✨ {feature_str}"
+        lines.append(f"{entry}\n")
 
     # If there are more events, mention it
     total = len(events_with_scores)
@@ -1,13 +1,19 @@
 import logging
+from contextlib import nullcontext
+
+import httpx
 
 from src.config import settings
-from src.http import build_async_client, default_timeout
+from src.http import SERVICE_EXTENSION, build_async_client, default_timeout
 from src.observability import log_event
 
 logger = logging.getLogger("uvicorn.error")
 
 
 class SMSNotifier:
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self._client = client
+
     async def send(self, message: str, *, to_number: str = "") -> bool:
         service = "notify.sms.twilio"
         if not all(
@@ -41,20 +47,21 @@ class SMSNotifier:
 
         url = f"https://api.twilio.com/2010-04-01/Accounts/{settings.twilio_account_sid}/Messages.json"
         try:
-            async with build_async_client(
-                service=service,
-                timeout=default_timeout(),
-                headers={"Accept": "application/json"},
-                max_retries=0,
-                auth=(settings.twilio_account_sid, settings.twilio_auth_token),
+            async with (
+                nullcontext(self._client)
+                if self._client is not None
+                else build_async_client(service=service, timeout=default_timeout(), max_retries=0)
             ) as client:
                 resp = await client.post(
                     url,
+                    extensions={SERVICE_EXTENSION: service},
                     data={
                         "From": settings.twilio_from_number,
                         "To": to_number,
                         "Body": message[:1600],
                     },
+                    headers={"Accept": "application/json"},
+                    auth=(settings.twilio_account_sid, settings.twilio_auth_token),
                 )
                 resp.raise_for_status()
                 log_event(
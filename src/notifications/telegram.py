@@ -1,13 +1,20 @@
 import logging
+from contextlib import nullcontext
+
+import httpx
+import orjson
 
 from src.config import settings
-from src.http import build_async_client, default_timeout
+from src.http import SERVICE_EXTENSION, build_async_client, default_timeout
 from src.observability import log_event
 
 logger = logging.getLogger("uvicorn.error")
 
 
 class TelegramNotifier:
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self._client = client
+
     async def send(self, message: str) -> bool:
         service = "notify.telegram"
         if not all([settings.telegram_bot_token, settings.telegram_chat_id]):
@@ -24,19 +31,22 @@ class TelegramNotifier:
 
         url = f"https://api.telegram.org/bot{settings.telegram_bot_token}/sendMessage"
         try:
-            async with build_async_client(
-                service=service,
-                timeout=default_timeout(),
-                headers={"Accept": "application/json"},
-                max_retries=0,
+            async with (
+                nullcontext(self._client)
+                if self._client is not None
+                else build_async_client(service=service, timeout=default_timeout(), max_retries=0)
             ) as client:
                 resp = await client.post(
                     url,
-                    json={
-                        "chat_id": settings.telegram_chat_id,
-                        "text": message,
-                        "parse_mode": "HTML",
-                    },
+                    extensions={SERVICE_EXTENSION: service},
+                    content=orjson.dumps(
+                        {
+                            "chat_id": settings.telegram_chat_id,
+                            "text": message,
+                            "parse_mode": "HTML",
+                        }
+                    ),
+                    headers={"Accept": "application/json", "Content-Type": "application/json"},
                 )
                 resp.raise_for_status()
                 log_event(
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 from src.cities import normalize_city_slug
 
 if TYPE_CHECKING:
+    from datetime import time
+
     from src.db.models import Event, EventTags, InterestProfile
     from src.ranker.weather import DayForecast
 
@@ -38,6 +40,26 @@ class ScoreBreakdown:
     rule_penalty: float
 
 
+@dataclass(slots=True, frozen=True)
+class _ScoringContext:
+    """Profile lookups shared by every event scored in one ranking pass."""
+
+    category_points: dict[str, float]
+    home_city_slug: str
+    preferred_city_slugs: frozenset[str]
+
+    @classmethod
+    def from_profile(cls, profile: InterestProfile) -> _ScoringContext:
+        constraints = profile.constraints
+        return cls(
+            category_points=_category_points(profile),
+            home_city_slug=normalize_city_slug(constraints.home_city),
+            preferred_city_slugs=frozenset(
+                normalize_city_slug(city) for city in constraints.preferred_cities
+            ),
+        )
+
+
 def score_event(
     event: Event,
     profile: InterestProfile,
@@ -87,22 +109,35 @@ def score_event_breakdown(
     event: Event,
     profile: InterestProfile,
     weather: dict[str, DayForecast],
+) -> ScoreBreakdown:
+    return _score_event_breakdown(event, profile, _ScoringContext.from_profile(profile), weather)
+
+
+def _score_event_breakdown(
+    event: Event,
+    profile: InterestProfile,
+    context: _ScoringContext,
+    weather: dict[str, DayForecast],
 ) -> ScoreBreakdown:
     if not event.tags:
         return ScoreBreakdown(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
 
     tags = event.tags
+    start = event.start_time
+    start_hour = start.hour
 
     toddler_fit = tags.toddler_score * TODDLER_SCORE_WEIGHT
     intrinsic = (tags.raw_rule_score / 10.0) * RULE_SCORE_WEIGHT
-    interest = _interest_score(tags.categories, profile) * INTEREST_WEIGHT
-    weather_pts = _weather_score(event, tags, weather) * WEATHER_WEIGHT
-    timing = _timing_score(event, profile, tags) * TIMING_WEIGHT
+    interest = _interest_score(tags.categories, context) * INTEREST_WEIGHT
+    weather_pts = (
+        _weather_score(tags, weather, weekday=start.weekday(), hour=start_hour) * WEATHER_WEIGHT
+    )
+    timing = _timing_score(start_hour, start.time(), profile, tags) * TIMING_WEIGHT
     logistics = _logistics_score(tags) * LOGISTICS_WEIGHT
     novelty = (
         5.0 if not (event.viewer_state and event.viewer_state.attended) else 0.0
     ) * NOVELTY_WEIGHT
-    city_pts = _city_score(event, profile) * CITY_WEIGHT
+    city_pts = _city_score(event, context) * CITY_WEIGHT
     confidence = _confidence_bonus(tags) * CONFIDENCE_WEIGHT
     rule_penalty = _rule_penalty(tags)
 
@@ -142,23 +177,35 @@ def score_event_breakdown(
     )
 
 
-def _interest_score(categories: list[str], profile: InterestProfile) -> float:
-    score = 0.0
-    for cat in categories:
-        interest = _CAT_TO_INTEREST.get(cat, cat)
-        if interest in profile.loves:
-            score += 10.0
-        elif interest in profile.likes:
-            score += 5.0
+def _category_points(profile: InterestProfile) -> dict[str, float]:
+    """Resolve tag categories to interest points once per profile (10 loved, 5 liked)."""
+    interest_points = dict.fromkeys(profile.likes, 5.0)
+    interest_points.update(dict.fromkeys(profile.loves, 10.0))
+    points = {
+        interest: value
+        for interest, value in interest_points.items()
+        if interest not in _CAT_TO_INTEREST
+    }
+    for cat, interest in _CAT_TO_INTEREST.items():
+        if interest in interest_points:
+            points[cat] = interest_points[interest]
+    return points
+
+
+def _interest_score(categories: list[str], context: _ScoringContext) -> float:
+    points = context.category_points
+    score = sum(points.get(cat, 0.0) for cat in categories)
     return _normalize_to_ten(score, max_value=30.0)
 
 
 def _weather_score(
-    event: Event,
     tags: EventTags,
     weather: dict[str, DayForecast],
+    *,
+    weekday: int,
+    hour: int,
 ) -> float:
-    day_key = "saturday" if event.start_time.weekday() == 5 else "sunday"
+    day_key = "saturday" if weekday == 5 else "sunday"
     forecast = weather.get(day_key)
     if not forecast:
         return 5.0
@@ -175,7 +222,7 @@ def _weather_score(
         if tags.indoor_outdoor == "indoor" or tags.good_for_heat:
             score += 2.0
         elif tags.indoor_outdoor == "outdoor":
-            if event.start_time.hour < 11:
+            if hour < 11:
                 score += 0.5
             else:
                 score -= 3.0
@@ -190,16 +237,18 @@ def _weather_score(
     return max(0.0, min(10.0, score))
 
 
-def _timing_score(event: Event, profile: InterestProfile, tags: EventTags | None = None) -> float:
+def _timing_score(
+    hour: int,
+    event_time: time,
+    profile: InterestProfile,
+    tags: EventTags | None = None,
+) -> float:
     score = 5.0
-    hour = event.start_time.hour
 
     nap_start = profile.constraints.nap_start
     nap_end = profile.constraints.nap_end
     bedtime = profile.constraints.bedtime_time
 
-    event_time = event.start_time.time()
-
     if nap_start <= event_time <= nap_end:
         score -= 4.0
     if event_time >= bedtime:
@@ -238,11 +287,11 @@ def _logistics_score(tags: EventTags) -> float:
     return max(0.0, min(10.0, score))
 
 
-def _city_score(event: Event, profile: InterestProfile) -> float:
+def _city_score(event: Event, context: _ScoringContext) -> float:
     """Boost events in the user's home city, penalize far-away ones."""
     event_city_slug = normalize_city_slug(event.location_city)
-    home = normalize_city_slug(profile.constraints.home_city)
-    preferred = {normalize_city_slug(city) for city in profile.constraints.preferred_cities}
+    home = context.home_city_slug
+    preferred = context.preferred_city_slugs
     if home != "unknown" and event_city_slug == home:
         return 10.0
     if event_city_slug in preferred:
@@ -261,6 +310,9 @@ def rank_events(
     weather: dict[str, DayForecast],
 ) -> list[tuple[Event, float]]:
     """Rank events by score, return sorted list of (event, score)."""
-    scored = [(e, score_event_breakdown(e, profile, weather).final) for e in events if e.tags]
+    context = _ScoringContext.from_profile(profile)
+    scored = [
+        (e, _score_event_breakdown(e, profile, context, weather).final) for e in events if e.tags
+    ]
     scored.sort(key=lambda x: x[1], reverse=True)
     return scored
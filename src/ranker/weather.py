@@ -47,8 +47,9 @@ class WeatherService:
                 resp.raise_for_status()
                 data = resp.json()
 
-            sat_forecast = self._summarize_day(data, sat)
-            sun_forecast = self._summarize_day(data, sun)
+            by_day = self._group_by_day(data)
+            sat_forecast = self._summarize_day(by_day.get(sat.isoformat(), []), sat)
+            sun_forecast = self._summarize_day(by_day.get(sun.isoformat(), []), sun)
             return {"saturday": sat_forecast, "sunday": sun_forecast}
         except Exception as exc:
             logger.warning(
@@ -64,19 +65,19 @@ class WeatherService:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _summarize_day(self, data: dict, target: date) -> DayForecast:
-        """Aggregate 3-hour forecast blocks into a single daily summary."""
-        target_str = target.isoformat()
-        temps: list[float] = []
-        precip_probs: list[float] = []
-        descriptions: list[str] = []
-
+    @staticmethod
+    def _group_by_day(data: dict) -> dict[str, list[dict]]:
+        """Bucket 3-hour forecast blocks by their ISO date in a single pass."""
+        by_day: dict[str, list[dict]] = {}
         for item in data.get("list", []):
-            dt_txt = item["dt_txt"][:10]
-            if dt_txt == target_str:
-                temps.append(item["main"]["temp"])
-                precip_probs.append(item.get("pop", 0) * 100)
-                descriptions.append(item["weather"][0]["description"])
+            by_day.setdefault(item["dt_txt"][:10], []).append(item)
+        return by_day
+
+    def _summarize_day(self, blocks: list[dict], target: date) -> DayForecast:
+        """Aggregate one day's 3-hour forecast blocks into a single daily summary."""
+        temps = [item["main"]["temp"] for item in blocks]
+        precip_probs = [item.get("pop", 0) * 100 for item in blocks]
+        descriptions = [item["weather"][0]["description"] for item in blocks]
 
         if not temps:
             return DayForecast(
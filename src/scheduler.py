@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from datetime import datetime
+
+import httpx
 
 from src.cities import user_visible_city_slugs
 from src.config import settings
 from src.db.database import Database, create_database
-from src.db.models import InterestProfile, Job, Source, User
+from src.db.models import Event, InterestProfile, Job, Source, User
+from src.http import build_async_client
 from src.notifications.dispatcher import NotificationDispatcher
 from src.notifications.formatter import format_console_message
 from src.ranker.scoring import rank_events, score_event_breakdown
 from src.ranker.weather import WeatherService
-from src.scrapers.generic import GenericScraper
-from src.scrapers.recipe import ScrapeRecipe
-from src.scrapers.router import get_builtin_scraper
 from src.tagger.llm import EventTagger
 from src.tagger.taxonomy import TAGGING_VERSION
 from src.timezones import current_weekend_dates, local_today, utc_now
@@ -35,7 +37,6 @@ async def run_scrape(db: Database | None = None) -> int:
         db = create_database()
         await db.connect()
 
-    total = 0
     all_sources = await db.get_all_sources()
     enabled_sources = [source for source in all_sources if source.enabled]
     runtime_log(
@@ -45,12 +46,47 @@ async def run_scrape(db: Database | None = None) -> int:
         source_count=len(enabled_sources),
     )
 
-    for source in all_sources:
-        if not source.enabled:
-            continue
+    # Sources live on unrelated hosts, so fetch several at once; database writes stay
+    # serialized so cross-source duplicate merging sees each batch in order. One client
+    # per run lets sources on the same host reuse pooled keep-alive connections.
+    semaphore = asyncio.Semaphore(max(1, settings.scrape_concurrency))
+    write_lock = asyncio.Lock()
+    async with build_async_client(service="scrape") as client:
+        counts = await asyncio.gather(
+            *(
+                _scrape_source(db, source, client, semaphore, write_lock)
+                for source in enabled_sources
+            )
+        )
+    total = sum(counts)
+
+    if own_db:
+        await db.close()
+
+    runtime_log(
+        logging.INFO,
+        "pipeline_stage_succeeded",
+        stage="scrape",
+        source_count=len(enabled_sources),
+        scraped=total,
+        duration_ms=duration_ms(started),
+    )
+    return total
+
+
+async def _scrape_source(
+    db: Database,
+    source: Source,
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    write_lock: asyncio.Lock,
+) -> int:
+    """Scrape and store one source, returning its event count (0 on failure)."""
+    async with semaphore:
         source_started = time.perf_counter()
         try:
             scraper = _build_scraper(source)
+            scraper.http_client = client
             runtime_log(
                 logging.INFO,
                 "pipeline_scrape_source_started",
@@ -61,11 +97,9 @@ async def run_scrape(db: Database | None = None) -> int:
                 builtin=source.builtin,
                 scraper_class=type(scraper).__name__,
             )
-            events = await scraper.scrape()
-            for event in events:
-                await db.upsert_event(event)
-            await db.update_source_status(source.id, count=len(events))
-            total += len(events)
+            events = _dedupe_scraped(await scraper.scrape())
+            async with write_lock:
+                await db.upsert_events(events, source_id=source.id)
             runtime_log(
                 logging.INFO,
                 "pipeline_scrape_source_succeeded",
@@ -76,6 +110,7 @@ async def run_scrape(db: Database | None = None) -> int:
                 event_count=len(events),
                 duration_ms=duration_ms(source_started),
             )
+            return len(events)
         except Exception as exc:
             error_type, error_message = error_details(exc)
             runtime_log(
@@ -89,20 +124,18 @@ async def run_scrape(db: Database | None = None) -> int:
                 error_message=error_message,
                 duration_ms=duration_ms(source_started),
             )
-            await db.update_source_status(source.id, error=error_message)
+            async with write_lock:
+                await db.update_source_status(source.id, error=error_message)
+            return 0
 
-    if own_db:
-        await db.close()
 
-    runtime_log(
-        logging.INFO,
-        "pipeline_stage_succeeded",
-        stage="scrape",
-        source_count=len(enabled_sources),
-        scraped=total,
-        duration_ms=duration_ms(started),
-    )
-    return total
+def _dedupe_scraped(events: list[Event]) -> list[Event]:
+    """Collapse repeats of the same (source, source_id), keeping the last copy.
+
+    Listing pages often repeat an event (JSON-LD lists, paginated CSS pages); dropping
+    them here saves the redundant upsert rows.
+    """
+    return list({(event.source, event.source_id): event for event in events}.values())
 
 
 async def ensure_system_user(db: Database) -> User:
@@ -125,6 +158,12 @@ async def ensure_system_user(db: Database) -> User:
 
 
 def _build_scraper(source: Source):
+    # Deferred so tag/notify-only entry points don't import every scraper module
+    # (and bs4/lxml/soupsieve) just to load the scheduler.
+    from src.scrapers.generic import GenericScraper
+    from src.scrapers.recipe import ScrapeRecipe
+    from src.scrapers.router import get_builtin_scraper
+
     if source.builtin:
         scraper = get_builtin_scraper(source)
         if scraper is None:
@@ -183,6 +222,8 @@ async def run_tag(
 
         processed = 0
         succeeded = 0
+        # Stored breakdowns are scored against the default profile; build it once per run.
+        default_profile = InterestProfile()
 
         async def on_batch_complete(start_idx, batch, tagged_batch, _all_results):
             nonlocal processed, succeeded
@@ -190,7 +231,7 @@ async def run_tag(
             weather_stub = await WeatherService().get_weekend_forecast(today, today)
             for event, tags in tagged_batch:
                 event.tags = tags
-                breakdown = score_event_breakdown(event, InterestProfile(), weather_stub)
+                breakdown = score_event_breakdown(event, default_profile, weather_stub)
                 score_breakdown = {
                     "final": breakdown.final,
                     "toddler_fit": breakdown.toddler_fit,
@@ -342,12 +383,14 @@ async def run_notify(
     *,
     user: User | None = None,
     child_name: str = "Your Little One",
+    now: datetime | None = None,
 ) -> dict[str, object]:
     """Rank weekend events and send notification.
 
     If a User is provided, uses their profile for ranking and their
     notification_channels/email_to for dispatch.  Otherwise falls back
-    to defaults (console-only, generic InterestProfile).
+    to defaults (console-only, generic InterestProfile).  Batch callers
+    pass a shared *now* so every user targets the same weekend.
     """
     started = time.perf_counter()
     own_db = db is None
@@ -370,28 +413,29 @@ async def run_notify(
             channel_count=len(channels),
         )
 
-        saturday, sunday = current_weekend_dates(roll_after_saturday_noon=True)
-        weather_svc = WeatherService()
-        weather = await weather_svc.get_weekend_forecast(saturday, sunday)
-
+        saturday, sunday = current_weekend_dates(now=now, roll_after_saturday_noon=True)
         visible_city_slugs = user_visible_city_slugs(user) if user else None
-        events = await db.get_events_for_weekend(
-            saturday.isoformat(),
-            sunday.isoformat(),
-            viewer_user_id=user.id if user else None,
-            visible_city_slugs=visible_city_slugs or None,
+        # The forecast API and the database are independent; wait on both at once.
+        weather, events = await asyncio.gather(
+            WeatherService().get_weekend_forecast(saturday, sunday),
+            db.get_events_for_weekend(
+                saturday.isoformat(),
+                sunday.isoformat(),
+                viewer_user_id=user.id if user else None,
+                visible_city_slugs=visible_city_slugs or None,
+            ),
         )
 
         if len(events) < 10:
-            upcoming = await db.get_recent_events(
-                days=14,
-                viewer_user_id=user.id if user else None,
-                visible_city_slugs=visible_city_slugs or None,
+            # Postgres skips the weekend rows already in hand, so no Python-side dedupe.
+            events.extend(
+                await db.get_recent_events(
+                    days=14,
+                    viewer_user_id=user.id if user else None,
+                    visible_city_slugs=visible_city_slugs or None,
+                    exclude_ids=[event.id for event in events],
+                )
             )
-            existing_ids = {e.id for e in events}
-            for event in upcoming:
-                if event.id not in existing_ids:
-                    events.append(event)
 
         tagged_events = [event for event in events if event.tags is not None]
 
@@ -426,12 +470,15 @@ async def run_notify(
         message = format_console_message(ranked, weather, name)
 
         dispatcher = NotificationDispatcher()
-        results = await dispatcher.dispatch(
-            message,
-            channels=channels,
-            email_to=email_to,
-            sms_to=sms_to,
-        )
+        try:
+            results = await dispatcher.dispatch(
+                message,
+                channels=channels,
+                email_to=email_to,
+                sms_to=sms_to,
+            )
+        finally:
+            await dispatcher.aclose()
         delivery_success_count = sum(1 for item in results if item["success"])
         delivery_failure_count = len(results) - delivery_success_count
 
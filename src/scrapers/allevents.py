@@ -3,17 +3,57 @@
 from __future__ import annotations
 
 import contextlib
-import hashlib
-import json
 from datetime import UTC, datetime
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+import orjson
+from lxml import etree
+from lxml.html import HtmlElement
 
 from src.db.models import Event, Source
 from src.timezones import APP_TZ, ensure_aware
 
-from .base import BaseScraper
+from .base import (
+    JSON_LD_RAW_KEYS,
+    BaseScraper,
+    json_ld_blocks,
+    node_text,
+    parse_html,
+    pick_raw_fields,
+    stable_source_id,
+    xpath_has_class,
+)
+
+# Card-fallback queries run on the same lxml tree as the JSON-LD pass, so a page that
+# falls through to cards is still parsed only once.
+_CARD_XPATH = etree.XPath(
+    f"//*[{xpath_has_class('event-card')}]"
+    f" | //*[{xpath_has_class('item')} and {xpath_has_class('event')}]"
+    f" | //*[{xpath_has_class('event-item')}]"
+    " | //div[contains(@itemtype, 'Event')] | //a[contains(@class, 'event')]"
+    f" | //*[{xpath_has_class('search-result')}] | //*[{xpath_has_class('listing-item')}]"
+)
+_TITLE_XPATH = etree.XPath(
+    f"(.//h3 | .//h2 | .//h4 | .//*[{xpath_has_class('title')}]"
+    f" | .//*[{xpath_has_class('event-title')}] | .//a)[1]"
+)
+_DATE_XPATH = etree.XPath(
+    f"(.//*[{xpath_has_class('date')}] | .//time | .//*[{xpath_has_class('event-date')}]"
+    f" | .//*[@datetime] | .//*[{xpath_has_class('start-date')}])[1]"
+)
+_LOCATION_XPATH = etree.XPath(
+    f"(.//*[{xpath_has_class('location')}] | .//*[{xpath_has_class('event-location')}]"
+    f" | .//*[{xpath_has_class('venue')}] | .//*[{xpath_has_class('place')}])[1]"
+)
+_IMAGE_XPATH = etree.XPath("(.//img)[1]")
+_PRICE_XPATH = etree.XPath(
+    f"(.//*[{xpath_has_class('price')}] | .//*[{xpath_has_class('event-price')}]"
+    f" | .//*[{xpath_has_class('ticket-price')}])[1]"
+)
+
+
+def _first(matches: list[HtmlElement]) -> HtmlElement | None:
+    return matches[0] if matches else None
 
 
 class AllEventsScraper(BaseScraper):
@@ -33,20 +73,20 @@ class AllEventsScraper(BaseScraper):
             resp = await client.get(self.source.url)
             resp.raise_for_status()
 
-        html = resp.text
-        events = self._extract_json_ld(html)
+        # One parse serves both the JSON-LD pass and the card fallback.
+        tree = parse_html(resp.text)
+        events = self._extract_json_ld(tree)
         if events:
             return events
-        return self._parse_html_cards(html)
+        return self._parse_html_cards(tree) if tree is not None else []
 
-    def _extract_json_ld(self, html: str) -> list[Event]:
-        soup = BeautifulSoup(html, "html.parser")
+    def _extract_json_ld(self, page: str | HtmlElement | None) -> list[Event]:
         events: list[Event] = []
 
-        for script in soup.select('script[type="application/ld+json"]'):
+        for raw in json_ld_blocks(page):
             try:
-                data = json.loads(script.string or "")
-            except json.JSONDecodeError:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
                 continue
 
             items: list[dict] = []
@@ -101,7 +141,7 @@ class AllEventsScraper(BaseScraper):
         with contextlib.suppress(ValueError, TypeError):
             price_val = float(price_str)
 
-        sid = hashlib.md5((url or f"{title}{start}").encode()).hexdigest()
+        sid = stable_source_id(url or f"{title}{start}")
 
         return Event(
             source=self.source_name,
@@ -117,47 +157,42 @@ class AllEventsScraper(BaseScraper):
             is_free=is_free,
             price_min=price_val,
             image_url=image,
-            raw_data=ld,
+            raw_data=pick_raw_fields(ld, JSON_LD_RAW_KEYS),
         )
 
-    def _parse_html_cards(self, html: str) -> list[Event]:
-        soup = BeautifulSoup(html, "html.parser")
-        cards = soup.select(
-            ".event-card, .item.event, .event-item, "
-            "div[itemtype*='Event'], a[class*='event'], "
-            ".search-result, .listing-item"
-        )
+    def _parse_html_cards(self, tree: HtmlElement) -> list[Event]:
+        cards = _CARD_XPATH(tree)
         self.log(f"HTML fallback ({self.city_slug}): {len(cards)} cards.")
         return [self._card_to_event(card) for card in cards]
 
-    def _card_to_event(self, card) -> Event:
-        title_el = card.select_one("h3, h2, h4, .title, .event-title, a")
-        title = title_el.get_text(strip=True) if title_el else card.get_text(strip=True)[:120]
+    def _card_to_event(self, card: HtmlElement) -> Event:
+        title_el = _first(_TITLE_XPATH(card))
+        title = node_text(title_el) if title_el is not None else node_text(card)[:120]
 
         link = card.get("href", "")
-        if not link and title_el and title_el.name == "a":
+        if not link and title_el is not None and title_el.tag == "a":
             link = title_el.get("href", "")
         if link and not link.startswith("http"):
             link = f"https://allevents.in{link}"
 
-        date_el = card.select_one(".date, time, .event-date, [datetime], .start-date")
+        date_el = _first(_DATE_XPATH(card))
         date_text = ""
-        if date_el:
-            date_text = date_el.get("datetime", "") or date_el.get_text(strip=True)
+        if date_el is not None:
+            date_text = date_el.get("datetime", "") or node_text(date_el)
 
-        loc_el = card.select_one(".location, .event-location, .venue, .place")
-        loc_text = loc_el.get_text(strip=True) if loc_el else ""
+        loc_el = _first(_LOCATION_XPATH(card))
+        loc_text = node_text(loc_el) if loc_el is not None else ""
 
-        img_el = card.select_one("img")
+        img_el = _first(_IMAGE_XPATH(card))
         image = None
-        if img_el:
+        if img_el is not None:
             image = img_el.get("data-src") or img_el.get("src")
 
-        price_el = card.select_one(".price, .event-price, .ticket-price")
-        price_text = price_el.get_text(strip=True) if price_el else ""
+        price_el = _first(_PRICE_XPATH(card))
+        price_text = node_text(price_el) if price_el is not None else ""
         is_free = not price_text or "free" in price_text.lower()
 
-        sid = hashlib.md5(f"{title}{date_text}{self.city_slug}".encode()).hexdigest()
+        sid = stable_source_id(f"{title}{date_text}{self.city_slug}")
 
         return Event(
             source=self.source_name,
@@ -174,14 +209,11 @@ class AllEventsScraper(BaseScraper):
 
 def _parse_dt(raw: str) -> datetime:
     raw = raw.strip()
-    utc_formats = {"%Y-%m-%dT%H:%M:%SZ"}
+    # JSON-LD dates are ISO 8601; fromisoformat handles them (including "Z") in C
+    # without walking the strptime table and its ValueError per miss.
+    with contextlib.suppress(ValueError):
+        return ensure_aware(datetime.fromisoformat(raw), default_tz=APP_TZ)
     for fmt in (
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        *utc_formats,
-        "%Y-%m-%dT%H:%M:%S%z",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
         "%m/%d/%Y %I:%M %p",
         "%m/%d/%Y",
         "%B %d, %Y %I:%M %p",
@@ -192,10 +224,7 @@ def _parse_dt(raw: str) -> datetime:
         "%a, %b %d",
     ):
         try:
-            parsed = datetime.strptime(raw, fmt)
-            if fmt in utc_formats:
-                return parsed.replace(tzinfo=UTC)
-            return ensure_aware(parsed, default_tz=APP_TZ)
+            return ensure_aware(datetime.strptime(raw, fmt), default_tz=APP_TZ)
         except ValueError:
             continue
     raise ValueError(f"Cannot parse datetime: {raw!r}")
@@ -8,20 +8,73 @@ Day headers are <header class="day-header"> with <h2> date text.
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
+import functools
+import logging
 import re
 from datetime import datetime, timedelta
 
-from bs4 import BeautifulSoup, Tag
+import httpx
+from lxml import etree
+from lxml.html import HtmlElement
 
 from src.db.models import Event, Source
 from src.timezones import APP_TZ, ensure_aware
 
-from .base import BaseScraper
+from .base import BaseScraper, node_text, parse_html, stable_source_id, xpath_has_class
 
 BASE_URL = "https://www.brec.org"
 CALENDAR_URL = f"{BASE_URL}/calendar"
 
+_DETAIL_ID_RE = re.compile(r"/calendar/detail/[^/]+/(\d+)")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})\s*(am|pm)")
+# Month and detail pages are walked with precompiled XPath over the lxml tree rather
+# than a BeautifulSoup wrapper, so the parse never builds Python objects for the
+# scripts, navigation and footer around the parts we read.
+_EVENTS_LIST_XPATH = etree.XPath(f"//*[{xpath_has_class('events-list')}]")
+_DAY_ITEMS_XPATH = etree.XPath(f"./header[{xpath_has_class('day-header')}] | ./article")
+_LINK_XPATH = etree.XPath(".//a[@href]")
+_TIME_XPATH = etree.XPath(f".//*[{xpath_has_class('time')}]")
+_PARK_XPATH = etree.XPath(f".//*[{xpath_has_class('park')}]")
+_DETAIL_MAX_BYTES = 256_000
+_DESCRIPTION_XPATH = etree.XPath(
+    f"(//*[{xpath_has_class('event-description')}] | //*[{xpath_has_class('event-detail')}]"
+    f" | //*[{xpath_has_class('description')}] | //article//p | //main//p)[1]"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date_header(date_str: str) -> datetime:
+    # Every article under a day header repeats the same date string, often twice
+    # (start and end time), so parse each distinct header once.
+    for fmt in (
+        "%A, %B %d, %Y",
+        "%B %d, %Y",
+        "%m/%d/%Y",
+    ):
+        try:
+            return ensure_aware(datetime.strptime(date_str, fmt))
+        except ValueError:
+            continue
+    raise ValueError(f"Cannot parse date header: {date_str!r}")
+
+
+async def _read_detail_page(client: httpx.AsyncClient, url: str) -> str | None:
+    """Return the leading part of a detail page, or ``None`` on a non-200 response.
+
+    The description sits near the top of the page, so the body is streamed and cut
+    off at ``_DETAIL_MAX_BYTES`` instead of buffering oversized pages whole.
+    """
+    async with client.stream("GET", url) as resp:
+        if resp.status_code != 200:
+            return None
+        body = bytearray()
+        async for chunk in resp.aiter_bytes():
+            body.extend(chunk)
+            if len(body) >= _DETAIL_MAX_BYTES:
+                break
+        return bytes(body[:_DETAIL_MAX_BYTES]).decode(resp.encoding or "utf-8", errors="replace")
+
 
 class BrecScraper(BaseScraper):
     def __init__(self, source: Source) -> None:
@@ -34,22 +87,22 @@ class BrecScraper(BaseScraper):
         Args:
             enrich: If True, fetch detail pages for descriptions (slower but better for LLM tagging).
         """
+        now = datetime.now(tz=APP_TZ)
+        next_month = (now.replace(day=1) + timedelta(days=32)).replace(day=1)
+        next_url = f"{CALENDAR_URL}/{next_month.strftime('%Y/%m')}"
+
+        # The two months are independent pages, so fetch them concurrently.
+        results = await asyncio.gather(
+            self._scrape_month(CALENDAR_URL),
+            self._scrape_month(next_url),
+            return_exceptions=True,
+        )
         all_events: list[Event] = []
-        try:
-            events = await self._scrape_month(CALENDAR_URL)
-            all_events.extend(events)
-        except Exception as exc:
-            self.log(f"Current month failed: {exc}")
-
-        # Also scrape next month
-        try:
-            now = datetime.now(tz=APP_TZ)
-            next_month = (now.replace(day=1) + timedelta(days=32)).replace(day=1)
-            next_url = f"{CALENDAR_URL}/{next_month.strftime('%Y/%m')}"
-            events = await self._scrape_month(next_url)
-            all_events.extend(events)
-        except Exception as exc:
-            self.log(f"Next month failed: {exc}")
+        for label, result in zip(("Current month", "Next month"), results, strict=True):
+            if isinstance(result, BaseException):
+                self.log(f"{label} failed: {result}")
+                continue
+            all_events.extend(result)
 
         # Optionally enrich events with descriptions from detail pages
         if enrich:
@@ -60,101 +113,101 @@ class BrecScraper(BaseScraper):
 
     async def _enrich_events(self, events: list[Event], max_concurrent: int = 5) -> list[Event]:
         """Fetch detail pages to get full descriptions."""
-        import asyncio
-
         sem = asyncio.Semaphore(max_concurrent)
 
-        async def enrich_one(event: Event) -> Event:
-            if event.description or not event.source_url or event.source_url == CALENDAR_URL:
-                return event
+        async def enrich_one(client: httpx.AsyncClient, event: Event) -> None:
             async with sem:
                 try:
-                    async with self._client() as client:
-                        resp = await client.get(event.source_url)
-                        if resp.status_code == 200:
-                            soup = BeautifulSoup(resp.text, "html.parser")
-                            desc_el = soup.select_one(
-                                ".event-description, .event-detail, .description, article p, main p"
-                            )
-                            if desc_el:
-                                event.description = desc_el.get_text(separator=" ", strip=True)[
-                                    :2000
-                                ]
+                    html = await _read_detail_page(client, event.source_url)
+                    tree = parse_html(html) if html is not None else None
+                    desc_els = _DESCRIPTION_XPATH(tree) if tree is not None else []
+                    if desc_els:
+                        event.description = node_text(desc_els[0], " ")[:2000]
                 except Exception:
                     pass
-            return event
 
-        # Only enrich a sample to avoid hammering the server
-        to_enrich = [e for e in events if not e.description][:50]
+        # Only enrich a sample to avoid hammering the server. Events without their own
+        # detail page are skipped up front rather than scheduled as no-op tasks.
+        to_enrich = [
+            e for e in events if not e.description and e.source_url and e.source_url != CALENDAR_URL
+        ][:50]
         self.log(f"Enriching {len(to_enrich)} events with descriptions...")
-        enriched = await asyncio.gather(*[enrich_one(e) for e in to_enrich])
-
-        # Merge back
-        enriched_map = {e.source_id: e for e in enriched}
-        return [enriched_map.get(e.source_id, e) for e in events]
+        # One client for the whole batch so the semaphore slots reuse pooled connections
+        # instead of each detail page paying for its own TCP/TLS handshake. Events are
+        # updated in place, so there is nothing to merge back once the fetches finish.
+        async with self._client() as client:
+            await asyncio.gather(*[enrich_one(client, e) for e in to_enrich])
+        return events
 
     async def _scrape_month(self, url: str) -> list[Event]:
         async with self._client() as client:
             resp = await client.get(url)
             resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        events_list = soup.select_one(".events-list")
-        if not events_list:
+        root = parse_html(resp.text)
+        found = _EVENTS_LIST_XPATH(root) if root is not None else []
+        if not found:
             self.log(f"No .events-list found at {url}")
             return []
 
         events: list[Event] = []
         current_date_str = ""
-
-        for el in events_list.children:
-            if not isinstance(el, Tag):
-                continue
-
-            # Day headers: <header class="day-header"><h2>Sunday, February 1, 2026</h2></header>
-            if el.name == "header" and "day-header" in (el.get("class") or []):
-                h2 = el.select_one("h2")
-                if h2:
-                    current_date_str = h2.get_text(strip=True)
+        parse_errors = 0
+
+        # Day headers and articles come back together, in document order:
+        #   <header class="day-header"><h2>Sunday, February 1, 2026</h2></header>
+        #   <article>...<h3>Title</h3>...<span class="time">...</span>...<a href=...>
+        for el in _DAY_ITEMS_XPATH(found[0]):
+            if el.tag == "header":
+                h2 = el.find(".//h2")
+                if h2 is not None:
+                    current_date_str = node_text(h2)
                 continue
 
-            # Event articles: <article>...<h3>Title</h3>...<span class="time">...</span>...<span class="park">...</span>...<a href="/calendar/detail/...">...
-            if el.name == "article":
-                try:
-                    event = self._parse_article(el, current_date_str)
-                    if event:
-                        events.append(event)
-                except Exception as exc:
-                    self.log(f"Parse error: {exc}")
-
+            try:
+                event = self._parse_article(el, current_date_str)
+                if event:
+                    events.append(event)
+            except Exception as exc:
+                # A malformed page can fail on every article; keep the per-article
+                # detail at DEBUG and report one summary line below.
+                parse_errors += 1
+                self.log(f"Parse error: {exc}", level=logging.DEBUG)
+
+        if parse_errors:
+            self.log(
+                f"{url}: skipped {parse_errors} unparseable articles",
+                level=logging.WARNING,
+                parse_errors=parse_errors,
+            )
         self.log(f"{url}: {len(events)} events")
         return events
 
-    def _parse_article(self, article: Tag, date_str: str) -> Event | None:
+    def _parse_article(self, article: HtmlElement, date_str: str) -> Event | None:
         # Title
-        h3 = article.select_one("h3")
-        title = h3.get_text(strip=True) if h3 else ""
+        h3 = article.find(".//h3")
+        title = node_text(h3) if h3 is not None else ""
         if not title:
             return None
 
         # Link
-        link_el = article.select_one("a[href]")
-        href = str(link_el["href"]) if link_el else ""
+        links = _LINK_XPATH(article)
+        href = str(links[0].get("href")) if links else ""
         if href and not href.startswith("http"):
             href = f"{BASE_URL}{href}"
 
         # Time
-        time_el = article.select_one(".time")
-        time_text = time_el.get_text(" ", strip=True) if time_el else "all day"
+        time_els = _TIME_XPATH(article)
+        time_text = node_text(time_els[0], " ") if time_els else "all day"
 
         # Park/location
-        park_el = article.select_one(".park")
-        park = park_el.get_text(strip=True) if park_el else ""
+        park_els = _PARK_XPATH(article)
+        park = node_text(park_els[0]) if park_els else ""
 
         # Image
-        img_el = article.select_one("img")
+        img_el = article.find(".//img")
         image: str | None = None
-        if img_el:
+        if img_el is not None:
             image = str(img_el.get("src", ""))
             if image and not image.startswith("http"):
                 image = f"{BASE_URL}{image}"
@@ -167,10 +220,10 @@ class BrecScraper(BaseScraper):
         source_id = ""
         if href:
             # Extract slug from /calendar/detail/slug/12345
-            m = re.search(r"/calendar/detail/[^/]+/(\d+)", href)
-            source_id = m.group(1) if m else hashlib.md5(href.encode()).hexdigest()
+            m = _DETAIL_ID_RE.search(href)
+            source_id = m.group(1) if m else stable_source_id(href)
         else:
-            source_id = hashlib.md5(f"{title}{date_str}".encode()).hexdigest()
+            source_id = stable_source_id(f"{title}{date_str}")
 
         return Event(
             source=self.source_name,
@@ -197,7 +250,7 @@ class BrecScraper(BaseScraper):
             return ensure_aware(dt.replace(hour=0, minute=0))
 
         # Try to extract start time like "8:30 AM" or "8:30 am - 9:30 am"
-        m = re.search(r"(\d{1,2}):(\d{2})\s*(am|pm)", time_text)
+        m = _TIME_RE.search(time_text)
         if m:
             hour = int(m.group(1))
             minute = int(m.group(2))
@@ -222,7 +275,7 @@ class BrecScraper(BaseScraper):
             return None
 
         end_part = parts[-1].strip()
-        m = re.search(r"(\d{1,2}):(\d{2})\s*(am|pm)", end_part)
+        m = _TIME_RE.search(end_part)
         if not m:
             return None
 
@@ -239,14 +292,4 @@ class BrecScraper(BaseScraper):
     @staticmethod
     def _parse_date_header(date_str: str) -> datetime:
         """Parse 'Sunday, February 1, 2026' into datetime."""
-        date_str = date_str.strip()
-        for fmt in (
-            "%A, %B %d, %Y",
-            "%B %d, %Y",
-            "%m/%d/%Y",
-        ):
-            try:
-                return ensure_aware(datetime.strptime(date_str, fmt))
-            except ValueError:
-                continue
-        raise ValueError(f"Cannot parse date header: {date_str!r}")
+        return _parse_date_header(date_str.strip())
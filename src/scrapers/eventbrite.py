@@ -3,22 +3,111 @@
 from __future__ import annotations
 
 import contextlib
-import hashlib
-import json
+import functools
 import re
 from datetime import UTC, datetime
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+import orjson
+from lxml import etree
+from lxml.html import HtmlElement
 
 from src.db.models import Event, Source
 from src.timezones import APP_TZ, ensure_aware
 
-from .base import BaseScraper
+from .base import (
+    JSON_LD_RAW_KEYS,
+    BaseScraper,
+    json_ld_blocks,
+    node_text,
+    parse_html,
+    pick_raw_fields,
+    stable_source_id,
+    xpath_has_class,
+)
 
 _EVENTBRITE_PATH_RE = re.compile(r"/d/(?P<state>[a-z]{2})--(?P<city>[a-z0-9-]+)/")
 
 
+# Card-fallback queries run on the same lxml tree as the JSON-LD pass, so a page that
+# falls through to cards is still parsed only once.
+_CARD_XPATH = etree.XPath(
+    f"//div[{xpath_has_class('search-event-card-wrapper')}]"
+    f" | //article[{xpath_has_class('eds-event-card')}]"
+    " | //div[@data-testid='search-event-card']"
+    f" | //li[{xpath_has_class('search-main-content__events-list-item')}]"
+    f" | //div[{xpath_has_class('discover-search-desktop-card')}]"
+)
+_TITLE_XPATH = etree.XPath(
+    f"(.//h2 | .//h3 | .//*[{xpath_has_class('event-card__title')}]"
+    " | .//*[@data-testid='event-name'])[1]"
+)
+_LINK_XPATH = etree.XPath("(.//a[@href])[1]")
+_DATE_XPATH = etree.XPath(
+    f"(.//p[contains(@class, 'date')] | .//time | .//*[{xpath_has_class('event-card__date')}])[1]"
+)
+_LOCATION_XPATH = etree.XPath(
+    f"(.//p[contains(@class, 'location')] | .//*[{xpath_has_class('event-card__location')}]"
+    f" | .//*[{xpath_has_class('card-text--truncated__one')}])[1]"
+)
+_PRICE_XPATH = etree.XPath(
+    f"(.//p[contains(@class, 'price')] | .//*[{xpath_has_class('event-card__price')}])[1]"
+)
+_IMAGE_XPATH = etree.XPath("(.//img)[1]")
+_SERVER_DATA_RAW_KEYS = (
+    "id",
+    "name",
+    "url",
+    "start_date",
+    "start_time",
+    "end_date",
+    "end_time",
+    "is_free",
+    "primary_venue",
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_dt(raw: str) -> datetime:
+    # Search pages repeat the same start/end strings across cards, so each distinct
+    # string is parsed only once. JSON-LD and server data are ISO 8601, which
+    # fromisoformat handles (including "Z") in C before the strptime table is tried.
+    with contextlib.suppress(ValueError):
+        return ensure_aware(datetime.fromisoformat(raw), default_tz=APP_TZ)
+    for fmt in (
+        "%a, %b %d, %Y %I:%M %p",
+        "%a, %b %d, %I:%M %p",
+        "%B %d, %Y",
+        "%b %d, %Y",
+    ):
+        with contextlib.suppress(ValueError):
+            return ensure_aware(datetime.strptime(raw, fmt), default_tz=APP_TZ)
+    raise ValueError(f"Cannot parse datetime: {raw!r}")
+
+
+def _extract_js_object(html: str, anchor: str) -> str | None:
+    """Return the object literal assigned as ``<anchor> = {...};`` in an inline script.
+
+    Plain ``str.find`` calls run in C over the (often 500KB+) page, where a lazy DOTALL
+    regex has to retry its tail at every character. A script body cannot contain a
+    literal ``</script>``, so the first one after the brace closes the assignment.
+    """
+    start = html.find(anchor)
+    if start < 0:
+        return None
+    brace = html.find("{", start + len(anchor))
+    if brace < 0 or html[start + len(anchor) : brace].strip() != "=":
+        return None
+    end = html.find("</script>", brace)
+    if end < 0:
+        return None
+    return html[brace:end].rstrip().removesuffix(";").rstrip()
+
+
+def _first(matches: list[HtmlElement]) -> HtmlElement | None:
+    return matches[0] if matches else None
+
+
 class EventbriteScraper(BaseScraper):
     def __init__(self, source: Source) -> None:
         self.source = source
@@ -37,7 +126,9 @@ class EventbriteScraper(BaseScraper):
             resp.raise_for_status()
 
         html = resp.text
-        events = self._extract_json_ld(html)
+        # One parse serves both the JSON-LD pass and the card fallback.
+        tree = parse_html(html)
+        events = self._extract_json_ld(tree)
         if events:
             return events
 
@@ -45,15 +136,14 @@ class EventbriteScraper(BaseScraper):
         if events:
             return events
 
-        return self._parse_html_cards(html)
+        return self._parse_html_cards(tree) if tree is not None else []
 
-    def _extract_json_ld(self, html: str) -> list[Event]:
-        soup = BeautifulSoup(html, "html.parser")
+    def _extract_json_ld(self, tree: HtmlElement | None) -> list[Event]:
         events: list[Event] = []
-        for script in soup.select('script[type="application/ld+json"]'):
+        for raw in json_ld_blocks(tree):
             try:
-                data = json.loads(script.string or "")
-            except json.JSONDecodeError:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
                 continue
             items = data if isinstance(data, list) else [data]
             for item in items:
@@ -90,7 +180,7 @@ class EventbriteScraper(BaseScraper):
         with contextlib.suppress(ValueError, TypeError):
             price_val = float(price_str)
 
-        sid = hashlib.md5((url or title).encode()).hexdigest()
+        sid = stable_source_id(url or title)
 
         return Event(
             source=self.source_name,
@@ -106,16 +196,16 @@ class EventbriteScraper(BaseScraper):
             is_free=is_free,
             price_min=price_val,
             image_url=image,
-            raw_data=ld,
+            raw_data=pick_raw_fields(ld, JSON_LD_RAW_KEYS),
         )
 
     def _extract_server_data(self, html: str) -> list[Event]:
-        match = re.search(r"window\.__SERVER_DATA__\s*=\s*({.+?});\s*</script>", html, re.DOTALL)
-        if not match:
+        payload = _extract_js_object(html, "window.__SERVER_DATA__")
+        if payload is None:
             return []
         try:
-            data = json.loads(match.group(1))
-        except json.JSONDecodeError:
+            data = orjson.loads(payload)
+        except orjson.JSONDecodeError:
             return []
 
         search_data = data.get("search_data", data.get("searchData", {}))
@@ -140,7 +230,7 @@ class EventbriteScraper(BaseScraper):
         loc_address = (
             address.get("localized_address_display", "") if isinstance(address, dict) else ""
         )
-        sid = str(item.get("id", hashlib.md5((url or title).encode()).hexdigest()))
+        sid = str(item.get("id", stable_source_id(url or title)))
 
         return Event(
             source=self.source_name,
@@ -154,44 +244,35 @@ class EventbriteScraper(BaseScraper):
             end_time=self._parse_dt(end) if end else None,
             is_free=is_free,
             image_url=image,
-            raw_data=item,
+            raw_data=pick_raw_fields(item, _SERVER_DATA_RAW_KEYS),
         )
 
-    def _parse_html_cards(self, html: str) -> list[Event]:
-        soup = BeautifulSoup(html, "html.parser")
-        cards = soup.select(
-            "div.search-event-card-wrapper, "
-            "article.eds-event-card, "
-            "div[data-testid='search-event-card'], "
-            "li.search-main-content__events-list-item, "
-            "div.discover-search-desktop-card"
-        )
+    def _parse_html_cards(self, tree: HtmlElement) -> list[Event]:
+        cards = _CARD_XPATH(tree)
         self.log(f"HTML fallback: {len(cards)} cards found.")
         return [self._card_to_event(card) for card in cards]
 
-    def _card_to_event(self, card) -> Event:
-        title_el = card.select_one("h2, h3, .event-card__title, [data-testid='event-name']")
-        title = title_el.get_text(strip=True) if title_el else "Untitled"
+    def _card_to_event(self, card: HtmlElement) -> Event:
+        title_el = _first(_TITLE_XPATH(card))
+        title = node_text(title_el) if title_el is not None else "Untitled"
 
-        link_el = card.select_one("a[href]")
-        url = link_el["href"] if link_el else self.search_url
+        link_el = _first(_LINK_XPATH(card))
+        url = link_el.get("href") if link_el is not None else self.search_url
 
-        date_el = card.select_one("p[class*='date'], time, .event-card__date")
-        date_text = date_el.get_text(strip=True) if date_el else ""
+        date_el = _first(_DATE_XPATH(card))
+        date_text = node_text(date_el) if date_el is not None else ""
 
-        loc_el = card.select_one(
-            "p[class*='location'], .event-card__location, .card-text--truncated__one"
-        )
-        loc_text = loc_el.get_text(strip=True) if loc_el else ""
+        loc_el = _first(_LOCATION_XPATH(card))
+        loc_text = node_text(loc_el) if loc_el is not None else ""
 
-        price_el = card.select_one("p[class*='price'], .event-card__price")
-        price_text = price_el.get_text(strip=True) if price_el else ""
+        price_el = _first(_PRICE_XPATH(card))
+        price_text = node_text(price_el) if price_el is not None else ""
         is_free = "free" in price_text.lower() if price_text else True
 
-        img_el = card.select_one("img")
-        image = img_el.get("src") if img_el else None
+        img_el = _first(_IMAGE_XPATH(card))
+        image = img_el.get("src") if img_el is not None else None
 
-        sid = hashlib.md5((url or title).encode()).hexdigest()
+        sid = stable_source_id(url or title)
 
         return Event(
             source=self.source_name,
@@ -207,27 +288,4 @@ class EventbriteScraper(BaseScraper):
 
     @staticmethod
     def _parse_dt(raw: str) -> datetime:
-        raw = raw.strip()
-        utc_formats = {
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-        }
-        for fmt in (
-            "%Y-%m-%dT%H:%M:%S",
-            *utc_formats,
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%a, %b %d, %Y %I:%M %p",
-            "%a, %b %d, %I:%M %p",
-            "%B %d, %Y",
-            "%b %d, %Y",
-        ):
-            try:
-                parsed = datetime.strptime(raw, fmt)
-                if fmt in utc_formats:
-                    return parsed.replace(tzinfo=UTC)
-                return ensure_aware(parsed, default_tz=APP_TZ)
-            except ValueError:
-                continue
-        raise ValueError(f"Cannot parse datetime: {raw!r}")
+        return _parse_dt(raw.strip())
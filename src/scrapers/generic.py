@@ -2,21 +2,72 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
+import contextlib
+import functools
 import re
-from datetime import datetime
+from collections.abc import Callable
+from datetime import date, datetime, time
 from typing import Any
 from urllib.parse import urljoin
 
+import orjson
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 from dateutil import parser as dateutil_parser
 
 from src.db.models import Event
-from src.timezones import APP_TZ, ensure_aware
+from src.timezones import APP_TZ, ensure_aware, local_today
 
-from .base import BaseScraper
-from .recipe import FieldRule, ScrapeRecipe
+from .base import BaseScraper, json_ld_blocks, stable_source_id
+from .recipe import CSSFields, FieldRule, ScrapeRecipe
+
+_PRICE_RE = re.compile(r"\$([\d.]+)")
+
+FieldExtractor = Callable[[Tag], str]
+
+
+def _compile_field(rule: FieldRule | None) -> FieldExtractor | None:
+    """Turn a recipe FieldRule into a callable, compiling its selector once.
+
+    The attr/text/default branching is decided here rather than on every container,
+    so the per-event path is one precompiled select plus a read.
+    """
+    if rule is None:
+        return None
+    default = rule.default
+    if not rule.selector:
+        return lambda el: default
+    selector = soupsieve.compile(rule.selector)
+    attr = rule.attr
+    if attr:
+
+        def extract_attr(el: Tag) -> str:
+            found = selector.select_one(el)
+            return default if found is None else str(found.get(attr, default))
+
+        return extract_attr
+
+    def extract_text(el: Tag) -> str:
+        found = selector.select_one(el)
+        return default if found is None else found.get_text(strip=True)
+
+    return extract_text
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_dt(raw: str, today: date) -> datetime | None:
+    # dateutil is slow and recipe pages repeat the same date text across events. Failures
+    # are cached as None so callers can fall back to "now" at call time. ISO 8601 input
+    # (the JSON-LD case) skips dateutil's heuristics entirely.
+    with contextlib.suppress(ValueError):
+        return ensure_aware(datetime.fromisoformat(raw))
+    # dateutil fills missing fields ("10:00", "Saturday 10am", no year) from its default,
+    # so *today* is passed explicitly and keys the cache: long-running processes must
+    # not keep resolving relative text against the day it was first seen.
+    try:
+        return ensure_aware(dateutil_parser.parse(raw, default=datetime.combine(today, time.min)))
+    except (ValueError, OverflowError):
+        return None
 
 
 class GenericScraper(BaseScraper):
@@ -43,13 +94,12 @@ class GenericScraper(BaseScraper):
         async with self._client() as client:
             resp = await client.get(self.url)
             resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
         events: list[Event] = []
         target_type = self.recipe.jsonld.event_type if self.recipe.jsonld else "Event"
-        for script in soup.find_all("script", type="application/ld+json"):
+        for raw in json_ld_blocks(resp.text):
             try:
-                data = json.loads(script.string or "")
-            except json.JSONDecodeError:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
                 continue
             items = data if isinstance(data, list) else [data]
             for item in items:
@@ -82,7 +132,7 @@ class GenericScraper(BaseScraper):
             location_address=loc_addr,
             start_time=self._parse_dt(start_raw),
             end_time=self._parse_dt(data.get("endDate")) if data.get("endDate") else None,
-            is_free="free" in json.dumps(data.get("offers", "")).lower(),
+            is_free=b"free" in orjson.dumps(data.get("offers", "")).lower(),
             image_url=(
                 data.get("image", [None])[0]
                 if isinstance(data.get("image"), list)
@@ -99,22 +149,30 @@ class GenericScraper(BaseScraper):
         pages = 0
         max_pages = self.recipe.css.pagination.max_pages
 
+        # Recipe selectors are fixed for the whole run, so compile them once up front.
+        container_sel = soupsieve.compile(self.recipe.css.event_container)
+        next_selector = self.recipe.css.pagination.next_selector
+        next_sel = soupsieve.compile(next_selector) if next_selector else None
+        extractors = {
+            name: extractor
+            for name in CSSFields.model_fields
+            if (extractor := _compile_field(getattr(self.recipe.css.fields, name))) is not None
+        }
+
         async with self._client() as client:
             while url and pages < max_pages:
                 resp = await client.get(url)
                 resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "html.parser")
-                containers = soup.select(self.recipe.css.event_container)
+                soup = BeautifulSoup(resp.text, "lxml")
 
-                for el in containers:
-                    event = self._extract_from_container(el, url)
+                for el in container_sel.select(soup):
+                    event = self._extract_from_container(el, url, extractors)
                     if event:
                         all_events.append(event)
 
                 # Pagination
-                next_sel = self.recipe.css.pagination.next_selector
-                if next_sel:
-                    link = soup.select_one(next_sel)
+                if next_sel is not None:
+                    link = next_sel.select_one(soup)
                     url = (
                         urljoin(self.url, str(link["href"])) if link and link.get("href") else None
                     )
@@ -125,39 +183,41 @@ class GenericScraper(BaseScraper):
         self.log(f"CSS: {len(all_events)} events from {pages} page(s)")
         return all_events
 
-    def _extract_from_container(self, el: Tag, page_url: str) -> Event | None:
-        assert self.recipe.css is not None
-        fields = self.recipe.css.fields
-        title = self._field(el, fields.title)
-        start_raw = self._field(el, fields.start_time) if fields.start_time else ""
+    def _extract_from_container(
+        self, el: Tag, page_url: str, extractors: dict[str, FieldExtractor]
+    ) -> Event | None:
+        def field(name: str) -> str:
+            extractor = extractors.get(name)
+            return extractor(el) if extractor else ""
+
+        title = field("title")
+        start_raw = field("start_time")
         if not title:
             return None
 
-        event_url = self._field(el, fields.url)
+        event_url = field("url")
         if event_url and not event_url.startswith("http"):
             event_url = urljoin(page_url, event_url)
 
-        price_text = self._field(el, fields.price) if fields.price else ""
+        price_text = field("price")
         is_free = not price_text or "free" in price_text.lower()
         price_val = self._extract_price(price_text) if not is_free else None
 
-        image_url = self._field(el, fields.image) if fields.image else None
+        image_url = field("image") if "image" in extractors else None
         if image_url and not image_url.startswith("http"):
             image_url = urljoin(page_url, image_url)
 
+        end_raw = field("end_time")
+
         return Event(
             source=self.source_name,
             source_url=event_url or page_url,
             source_id=self._make_id(title, start_raw),
             title=title,
-            description=self._field(el, fields.description) if fields.description else "",
-            location_name=self._field(el, fields.location) if fields.location else "",
+            description=field("description"),
+            location_name=field("location"),
             start_time=self._parse_dt(start_raw),
-            end_time=(
-                self._parse_dt(self._field(el, fields.end_time))
-                if fields.end_time and self._field(el, fields.end_time)
-                else None
-            ),
+            end_time=self._parse_dt(end_raw) if end_raw else None,
             is_free=is_free,
             price_min=price_val,
             image_url=image_url,
@@ -165,32 +225,17 @@ class GenericScraper(BaseScraper):
 
     # -- Helpers ------------------------------------------------------------
 
-    @staticmethod
-    def _field(el: Tag, rule: FieldRule | None) -> str:
-        if not rule or not rule.selector:
-            return rule.default if rule else ""
-        found = el.select_one(rule.selector)
-        if not found:
-            return rule.default
-        if rule.attr:
-            return str(found.get(rule.attr, rule.default))
-        return found.get_text(strip=True)
-
     @staticmethod
     def _parse_dt(raw: str | None) -> datetime:
-        if not raw:
-            return datetime.now(tz=APP_TZ)
-        try:
-            return ensure_aware(dateutil_parser.parse(raw))
-        except (ValueError, OverflowError):
-            return datetime.now(tz=APP_TZ)
+        parsed = _parse_dt(raw, local_today()) if raw else None
+        return parsed or datetime.now(tz=APP_TZ)
 
     @staticmethod
     def _make_id(title: str, date_str: str) -> str:
         slug = f"{title}:{date_str}".lower().strip()
-        return hashlib.md5(slug.encode()).hexdigest()[:16]
+        return stable_source_id(slug)[:16]
 
     @staticmethod
     def _extract_price(text: str) -> float | None:
-        match = re.search(r"\$([\d.]+)", text)
+        match = _PRICE_RE.search(text)
         return float(match.group(1)) if match else None
@@ -11,17 +11,60 @@ All three use Modern Events Calendar (MEC) plugin, so parsing logic is shared.
 from __future__ import annotations
 
 import contextlib
-import hashlib
 import re
 from datetime import datetime
 from typing import TypedDict
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, ElementFilter, Tag
 
 from src.db.models import Event, Source
 from src.timezones import APP_TZ, ensure_aware
 
-from .base import BaseScraper
+from .base import BaseScraper, stable_source_id
+
+_EVENT_SLUG_RE = re.compile(r"/events?/([^/?]+)")
+_OCCURRENCE_RE = re.compile(r"occurrence=(\d{4}-\d{2}-\d{2})")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})\s*(am|pm)")
+_DAY_MONTH_YEAR_RE = re.compile(r"(\d{1,2})([A-Za-z]+)(\d{4})")
+_RANGE_END_DAY_RE = re.compile(r"\w+\s*-\s*(\d{1,2})\s+([A-Za-z]+)")
+# Same match as the CSS selector a[href*="events/"], without going through soupsieve.
+_EVENT_HREF_RE = re.compile("events/")
+# Navigation and listing links that point at events/ but are not an event themselves.
+_LINK_TEXT_SKIP = frozenset(
+    {
+        "events",
+        "all events",
+        "view all",
+        "private events",
+        "special events",
+        "member events",
+        "show more dates >>",
+    }
+)
+
+_MEC_ARTICLE_CLASSES = frozenset({"mec-event-article", "type-mec-events"})
+
+
+class _MecContentFilter(ElementFilter):
+    """Build only MEC article cards and event-page links; skip the rest of the page.
+
+    Anything nested inside a kept element is still parsed, so articles keep their
+    title, date and image children.
+    """
+
+    def allow_tag_creation(
+        self, nsprefix: str | None, name: str, attrs: dict[str, str] | None
+    ) -> bool:
+        attrs = attrs or {}
+        if _MEC_ARTICLE_CLASSES.intersection((attrs.get("class") or "").split()):
+            return True
+        return name == "a" and "events/" in (attrs.get("href") or "")
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+_MEC_CONTENT = _MecContentFilter()
 
 
 class MecSource(TypedDict):
@@ -72,7 +115,7 @@ class LafayetteScraper(BaseScraper):
             resp = await client.get(src["url"])
             resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, "lxml", parse_only=_MEC_CONTENT)
         events: list[Event] = []
 
         # Try MEC article cards first
@@ -86,14 +129,11 @@ class LafayetteScraper(BaseScraper):
         # Also extract from event links (catches calendar-view events)
         events.extend(self._extract_event_links(soup, src))
 
-        # Deduplicate by source_id
-        seen: set[str] = set()
-        unique: list[Event] = []
+        # Deduplicate by source_id, keeping the first (article-card) occurrence
+        unique: dict[str, Event] = {}
         for ev in events:
-            if ev.source_id not in seen:
-                seen.add(ev.source_id)
-                unique.append(ev)
-        return unique
+            unique.setdefault(ev.source_id, ev)
+        return list(unique.values())
 
     def _parse_mec_article(self, art: Tag, src: MecSource) -> Event | None:
         title_el = art.select_one(".mec-event-title a, h4 a, h3 a, h2 a")
@@ -129,11 +169,11 @@ class LafayetteScraper(BaseScraper):
 
         start_time = _parse_mec_dt(date_text, time_text)
 
-        m = re.search(r"/events?/([^/?]+)", href)
+        m = _EVENT_SLUG_RE.search(href)
         sid = (
             f"{src['sub']}_{m.group(1)}"
             if m
-            else hashlib.md5(f"{src['sub']}_{title}_{date_text}".encode()).hexdigest()
+            else stable_source_id(f"{src['sub']}_{title}_{date_text}")
         )
 
         return Event(
@@ -158,35 +198,26 @@ class LafayetteScraper(BaseScraper):
         """Fallback: gather events from <a> links to event detail pages."""
         events: list[Event] = []
         seen: set[str] = set()
-        skip = {
-            "events",
-            "all events",
-            "view all",
-            "private events",
-            "special events",
-            "member events",
-            "show more dates >>",
-        }
-
-        for link in soup.select('a[href*="events/"]'):
+
+        for link in soup.find_all("a", href=_EVENT_HREF_RE):
             href = str(link.get("href") or "")
-            text = link.get_text(strip=True)
-            if not text or len(text) < 3 or text.lower() in skip:
-                continue
             if href in seen:
                 continue
+            text = link.get_text(strip=True)
+            if len(text) < 3 or text.lower() in _LINK_TEXT_SKIP:
+                continue
             seen.add(href)
             if not href.startswith("http"):
                 href = f"{src['base']}{href}"
 
             start_time = datetime.now(tz=APP_TZ)
-            occ = re.search(r"occurrence=(\d{4}-\d{2}-\d{2})", href)
+            occ = _OCCURRENCE_RE.search(href)
             if occ:
                 with contextlib.suppress(ValueError):
                     start_time = ensure_aware(datetime.strptime(occ.group(1), "%Y-%m-%d"))
 
-            m = re.search(r"/events?/([^/?]+)", href)
-            sid = f"{src['sub']}_{m.group(1)}" if m else hashlib.md5(href.encode()).hexdigest()
+            m = _EVENT_SLUG_RE.search(href)
+            sid = f"{src['sub']}_{m.group(1)}" if m else stable_source_id(href)
 
             events.append(
                 Event(
@@ -206,7 +237,7 @@ class LafayetteScraper(BaseScraper):
 def _apply_time(dt: datetime, time_text: str) -> datetime:
     if not time_text:
         return ensure_aware(dt)
-    m = re.search(r"(\d{1,2}):(\d{2})\s*(am|pm)", time_text.lower())
+    m = _TIME_RE.search(time_text.lower())
     if m:
         h, mi, ap = int(m.group(1)), int(m.group(2)), m.group(3)
         if ap == "pm" and h != 12:
@@ -223,7 +254,7 @@ def _parse_mec_dt(date_text: str, time_text: str) -> datetime:
     dt = now
 
     # '28February2026' (no spaces)
-    m = re.match(r"(\d{1,2})([A-Za-z]+)(\d{4})", date_text.strip())
+    m = _DAY_MONTH_YEAR_RE.match(date_text.strip())
     if m:
         try:
             dt = datetime.strptime(f"{m.group(1)} {m.group(2)} {m.group(3)}", "%d %B %Y")
@@ -232,7 +263,7 @@ def _parse_mec_dt(date_text: str, time_text: str) -> datetime:
             pass
 
     # 'Saturday - 07 Mar'
-    m = re.match(r"\w+\s*-\s*(\d{1,2})\s+([A-Za-z]+)", date_text.strip())
+    m = _RANGE_END_DAY_RE.match(date_text.strip())
     if m:
         try:
             dt = ensure_aware(
@@ -245,7 +276,7 @@ def _parse_mec_dt(date_text: str, time_text: str) -> datetime:
             pass
 
     # Embedded date anywhere
-    m = re.search(r"(\d{1,2})([A-Za-z]+)(\d{4})", date_text)
+    m = _DAY_MONTH_YEAR_RE.search(date_text)
     if m:
         try:
             dt = datetime.strptime(f"{m.group(1)} {m.group(2)} {m.group(3)}", "%d %B %Y")
@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 import contextlib
-import hashlib
+import html
 import re
-from datetime import UTC, datetime
+from datetime import datetime
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 
 from src.db.models import Event, Source
 from src.timezones import APP_TZ, ensure_aware
 
-from .base import BaseScraper
+from .base import BaseScraper, node_text, parse_html, stable_source_id
+
+_EVENT_ID_RE = re.compile(r"/event/(\d+)")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})(am|pm)")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Only the event cards (and their children) are built from LibCal calendar pages.
+_EVENT_CARDS = SoupStrainer(class_="s-lc-eventcard")
+# Feeds are untrusted: tolerate sloppy XML, but never expand entities or fetch DTDs.
+_RSS_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
 
 
 class LibraryScraper(BaseScraper):
@@ -25,46 +37,48 @@ class LibraryScraper(BaseScraper):
         self.source_name = f"builtin:library:{parsed.netloc}"
 
     async def scrape(self) -> list[Event]:
-        try:
-            events = await self._scrape_rss()
-            self.log(f"{self.source.name}: {len(events)} events from RSS")
-            return events
-        except Exception as exc:
-            self.log(f"{self.source.name} RSS failed: {exc}")
-            events = await self._scrape_calendar_html()
-            self.log(f"{self.source.name}: {len(events)} events from HTML")
-            return events
-
-    async def _scrape_rss(self) -> list[Event]:
+        # The RSS feed and the HTML fallback pages share one pooled client.
         async with self._client() as client:
-            resp = await client.get(self.source.url)
-            resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "xml")
-        items = soup.find_all("item")
-        if not items:
-            soup = BeautifulSoup(resp.text, "html.parser")
-            items = soup.find_all("item")
+            try:
+                events = await self._scrape_rss(client)
+                self.log(f"{self.source.name}: {len(events)} events from RSS")
+                return events
+            except Exception as exc:
+                self.log(f"{self.source.name} RSS failed: {exc}")
+                events = await self._scrape_calendar_html(client)
+                self.log(f"{self.source.name}: {len(events)} events from HTML")
+                return events
+
+    async def _scrape_rss(self, client: httpx.AsyncClient) -> list[Event]:
+        resp = await client.get(self.source.url)
+        resp.raise_for_status()
+
+        root = etree.fromstring(resp.content, _RSS_PARSER) if resp.content else None
+        items = list(root.iter("item")) if root is not None else []
+        if not items and (page := parse_html(resp.text)) is not None:
+            items = list(page.iter("item"))
 
         return [self._rss_item_to_event(item) for item in items]
 
-    def _rss_item_to_event(self, item) -> Event:
-        title = item.find("title").get_text(strip=True) if item.find("title") else "Untitled"
-        link = item.find("link").get_text(strip=True) if item.find("link") else self.base_url
+    def _rss_item_to_event(self, item: etree._Element) -> Event:
+        title_el = item.find("title")
+        title = node_text(title_el) if title_el is not None else "Untitled"
+        link_el = item.find("link")
+        link = node_text(link_el) if link_el is not None else self.base_url
         desc_el = item.find("description")
-        description = desc_el.get_text(strip=True) if desc_el else ""
+        description = node_text(desc_el) if desc_el is not None else ""
         if "<" in description:
-            description = BeautifulSoup(description, "html.parser").get_text(
-                separator=" ", strip=True
-            )
+            # LibCal descriptions are a few <p>/<br> tags; stripping them needs no parser.
+            description = html.unescape(_HTML_TAG_RE.sub(" ", description))
+            description = _WHITESPACE_RE.sub(" ", description).strip()
 
         pub_date = item.find("pubDate")
         start_time = datetime.now(tz=APP_TZ)
-        if pub_date:
-            start_time = self._parse_rss_date(pub_date.get_text(strip=True))
+        if pub_date is not None:
+            start_time = self._parse_rss_date(node_text(pub_date))
 
-        match = re.search(r"/event/(\d+)", link)
-        source_id = match.group(1) if match else hashlib.md5(f"{title}{link}".encode()).hexdigest()
+        match = _EVENT_ID_RE.search(link)
+        source_id = match.group(1) if match else stable_source_id(f"{title}{link}")
 
         return Event(
             source=self.source_name,
@@ -79,16 +93,15 @@ class LibraryScraper(BaseScraper):
             raw_data={"source_library": self.source.name},
         )
 
-    async def _scrape_calendar_html(self) -> list[Event]:
+    async def _scrape_calendar_html(self, client: httpx.AsyncClient) -> list[Event]:
         for url in (f"{self.base_url}/calendar", f"{self.base_url}/upcoming"):
-            async with self._client() as client:
-                resp = await client.get(url)
-                if resp.status_code == 200:
-                    return self._parse_libcal_html(resp.text)
+            resp = await client.get(url)
+            if resp.status_code == 200:
+                return self._parse_libcal_html(resp.text)
         return []
 
     def _parse_libcal_html(self, html: str) -> list[Event]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml", parse_only=_EVENT_CARDS)
         cards = soup.select(".s-lc-eventcard")
         events: list[Event] = []
 
@@ -111,10 +124,8 @@ class LibraryScraper(BaseScraper):
             desc_el = card.select_one(".s-lc-eventcard-description")
             description = desc_el.get_text(strip=True) if desc_el else ""
             start_time = self._parse_libcal_datetime(date_text, time_text)
-            match = re.search(r"/event/(\d+)", href)
-            source_id = (
-                match.group(1) if match else hashlib.md5(f"{title}{date_text}".encode()).hexdigest()
-            )
+            match = _EVENT_ID_RE.search(href)
+            source_id = match.group(1) if match else stable_source_id(f"{title}{date_text}")
 
             events.append(
                 Event(
@@ -140,7 +151,7 @@ class LibraryScraper(BaseScraper):
         with contextlib.suppress(ValueError):
             dt = ensure_aware(datetime.strptime(f"{date_text} {year}", "%b %d %Y"))
 
-        match = re.search(r"(\d{1,2}):(\d{2})(am|pm)", time_text.lower())
+        match = _TIME_RE.search(time_text.lower())
         if match:
             hour = int(match.group(1))
             minute = int(match.group(2))
@@ -154,17 +165,9 @@ class LibraryScraper(BaseScraper):
 
     @staticmethod
     def _parse_rss_date(date_str: str) -> datetime:
-        for fmt in (
-            "%a, %d %b %Y %H:%M:%S %Z",
-            "%a, %d %b %Y %H:%M:%S %z",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d",
-        ):
-            with contextlib.suppress(ValueError):
-                parsed = datetime.strptime(date_str, fmt)
-                if fmt == "%a, %d %b %Y %H:%M:%S %Z":
-                    zone_name = date_str.rsplit(" ", 1)[-1].upper()
-                    if zone_name in {"GMT", "UTC"}:
-                        return parsed.replace(tzinfo=UTC)
-                return ensure_aware(parsed)
+        # RFC 2822 pubDates (including US zone names like CST) in one call; ISO as fallback.
+        with contextlib.suppress(TypeError, ValueError):
+            return ensure_aware(parsedate_to_datetime(date_str))
+        with contextlib.suppress(ValueError):
+            return ensure_aware(datetime.fromisoformat(date_str))
         return datetime.now(tz=APP_TZ)
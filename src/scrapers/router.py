@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from urllib.parse import urlparse
 
@@ -30,6 +31,7 @@ BUILTIN_DOMAINS: dict[str, Callable[[Source], BaseScraper]] = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     host = urlparse(url).hostname or ""
     if host.startswith("www."):
@@ -37,11 +39,20 @@ def extract_domain(url: str) -> str:
     return host.lower()
 
 
+def _builtin_scraper_class(url: str) -> Callable[[Source], BaseScraper] | None:
+    """Match the host or any parent domain, so ``events.brec.org`` routes like ``brec.org``."""
+    host = extract_domain(url)
+    while host:
+        if cls := BUILTIN_DOMAINS.get(host):
+            return cls
+        _, _, host = host.partition(".")
+    return None
+
+
 def is_builtin_domain(url: str) -> bool:
-    return extract_domain(url) in BUILTIN_DOMAINS
+    return _builtin_scraper_class(url) is not None
 
 
 def get_builtin_scraper(source: Source) -> BaseScraper | None:
-    domain = extract_domain(source.url)
-    cls = BUILTIN_DOMAINS.get(domain)
+    cls = _builtin_scraper_class(source.url)
     return cls(source) if cls else None
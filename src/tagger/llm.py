@@ -3,10 +3,11 @@
 import asyncio
 import json
 import logging
+import re
 import time as pytime
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from datetime import time
+from datetime import datetime
 from typing import Literal
 
 from openai import AsyncOpenAI
@@ -93,21 +94,59 @@ PARKING_TERMS = ("parking", "lot", "garage")
 STAIRS_TERMS = ("stairs", "upstairs", "historic")
 BATHROOM_TERMS = ("restroom", "bathroom", "facility", "visitor center", "library")
 WATER_TERMS = CATEGORY_RULES["water"]
+
+
+def _terms_pattern(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile plain substring terms into one alternation, matching ``term in text``."""
+    return re.compile("|".join(re.escape(term) for term in terms))
+
+
+_CATEGORY_PATTERNS = {category: _terms_pattern(terms) for category, terms in CATEGORY_RULES.items()}
+_INDOOR_RE = _terms_pattern(INDOOR_TERMS)
+_OUTDOOR_RE = _terms_pattern(OUTDOOR_TERMS)
+_LOUD_RE = _terms_pattern(LOUD_TERMS)
+_QUIET_RE = _terms_pattern(QUIET_TERMS)
+_LARGE_CROWD_RE = _terms_pattern(LARGE_CROWD_TERMS)
+_SMALL_CROWD_RE = _terms_pattern(SMALL_CROWD_TERMS)
+_FOOD_RE = _terms_pattern(FOOD_TERMS)
+_PARKING_RE = _terms_pattern(PARKING_TERMS)
+_STAIRS_RE = _terms_pattern(STAIRS_TERMS)
+_BATHROOM_RE = _terms_pattern(BATHROOM_TERMS)
+_WATER_RE = _CATEGORY_PATTERNS["water"]
+_TODDLER_AUDIENCE_RE = _terms_pattern(("toddler", "preschool", "story time", "playgroup"))
+_FAMILY_AUDIENCE_RE = _terms_pattern(("family", "kids", "children"))
+
+StartSlot = Literal["late", "nap", "morning", "other"]
+# (event text, start slot, is_free, location_city, has_description)
+AssessmentKey = tuple[str, StartSlot, bool, str, bool]
+
+
+def _start_slot(start: datetime) -> StartSlot:
+    """Collapse a start time to the only distinctions the rule scoring makes."""
+    if start.hour >= 19:
+        return "late"
+    if 13 <= start.hour <= 15:
+        return "nap"
+    if 9 <= start.hour <= 11:
+        return "morning"
+    return "other"
+
+
 logger = logging.getLogger("uvicorn.error")
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class RuleEvaluation:
     age_max_recommended: int
     age_min_recommended: int
     audience: Literal["toddler_focused", "family_mixed", "general_public", "adult_skewed"]
     bathroom_accessible: bool
-    categories: list[str]
-    caution_signals: list[str]
+    categories: tuple[str, ...]
+    caution_signals: tuple[str, ...]
     confidence_score: float
     crowd_level: Literal["small", "medium", "large"]
     energy_level: Literal["calm", "moderate", "active"]
-    exclusion_signals: list[str]
+    exclusion_signals: tuple[str, ...]
     food_available: bool
     good_for_heat: bool
     good_for_rain: bool
@@ -117,7 +156,7 @@ class RuleEvaluation:
     noise_level: Literal["quiet", "moderate", "loud"]
     parent_attention_required: Literal["full", "partial", "minimal"]
     parking_available: bool
-    positive_signals: list[str]
+    positive_signals: tuple[str, ...]
     raw_score: int
     stroller_friendly: bool
     weather_dependent: bool
@@ -128,6 +167,7 @@ class EventTagger:
         self.profile = profile or InterestProfile()
         self._use_llm = bool(settings.openai_api_key)
         self._concurrency = max(1, settings.tagger_concurrency)
+        self._assessments: dict[AssessmentKey, RuleEvaluation] = {}
         if self._use_llm:
             self.client = AsyncOpenAI(
                 api_key=settings.openai_api_key,
@@ -180,20 +220,44 @@ class EventTagger:
             if part
         ).lower()
 
-    def _contains_any(self, haystack: str, needles: tuple[str, ...]) -> bool:
-        return any(needle in haystack for needle in needles)
+    def _contains_any(self, haystack: str, pattern: re.Pattern[str]) -> bool:
+        return pattern.search(haystack) is not None
 
     def _derive_categories(self, text: str) -> list[str]:
         categories: list[str] = []
-        for category, terms in CATEGORY_RULES.items():
-            if self._contains_any(text, terms):
+        for category, pattern in _CATEGORY_PATTERNS.items():
+            if self._contains_any(text, pattern):
                 categories.append(category)
         if not categories:
             categories.append("play")
         return categories[:4]
 
     def _rule_based_assessment(self, event: Event) -> RuleEvaluation:
-        text = self._event_text(event)
+        """Score an event by rules, reusing the result for repeated listings.
+
+        Recurring programs (weekly storytimes, monthly markets) produce many events whose
+        text and scoring inputs are identical, so evaluations are memoized per tagger.
+        """
+        key: AssessmentKey = (
+            self._event_text(event),
+            _start_slot(event.start_time),
+            event.is_free,
+            event.location_city,
+            bool(event.description),
+        )
+        evaluation = self._assessments.get(key)
+        if evaluation is None:
+            evaluation = self._assessments[key] = self._assess(*key)
+        return evaluation
+
+    def _assess(
+        self,
+        text: str,
+        start_slot: StartSlot,
+        is_free: bool,
+        location_city: str,
+        has_description: bool,
+    ) -> RuleEvaluation:
         categories = self._derive_categories(text)
 
         score = 50
@@ -225,20 +289,20 @@ class EventTagger:
         if "play" in categories:
             score += 10
             positive_signals.append("open-ended play is toddler-friendly")
-        if event.is_free:
+        if is_free:
             score += 4
-        if event.start_time.time() >= time(19, 0):
+        if start_slot == "late":
             score -= 18
             caution_signals.append("late start time")
-        elif 13 <= event.start_time.hour <= 15:
+        elif start_slot == "nap":
             score -= 10
             caution_signals.append("starts during nap window")
-        elif 9 <= event.start_time.hour <= 11:
+        elif start_slot == "morning":
             score += 10
             positive_signals.append("morning timing fits toddler routines")
 
-        indoor = self._contains_any(text, INDOOR_TERMS)
-        outdoor = self._contains_any(text, OUTDOOR_TERMS)
+        indoor = self._contains_any(text, _INDOOR_RE)
+        outdoor = self._contains_any(text, _OUTDOOR_RE)
         if indoor and outdoor:
             indoor_outdoor: Literal["indoor", "outdoor", "both"] = "both"
         elif indoor:
@@ -248,33 +312,31 @@ class EventTagger:
         else:
             indoor_outdoor = "both"
 
-        if self._contains_any(text, LOUD_TERMS):
+        if self._contains_any(text, _LOUD_RE):
             noise_level: Literal["quiet", "moderate", "loud"] = "loud"
-        elif self._contains_any(text, QUIET_TERMS):
+        elif self._contains_any(text, _QUIET_RE):
             noise_level = "quiet"
         else:
             noise_level = "moderate"
 
-        if self._contains_any(text, LARGE_CROWD_TERMS):
+        if self._contains_any(text, _LARGE_CROWD_RE):
             crowd_level: Literal["small", "medium", "large"] = "large"
-        elif self._contains_any(text, SMALL_CROWD_TERMS):
+        elif self._contains_any(text, _SMALL_CROWD_RE):
             crowd_level = "small"
         else:
             crowd_level = "medium"
 
-        stroller_friendly = not self._contains_any(text, STAIRS_TERMS)
-        parking_available = self._contains_any(text, PARKING_TERMS) or event.location_city in {
+        stroller_friendly = not self._contains_any(text, _STAIRS_RE)
+        parking_available = self._contains_any(text, _PARKING_RE) or location_city in {
             "Lafayette",
             "Baton Rouge",
         }
-        bathroom_accessible = (
-            self._contains_any(text, BATHROOM_TERMS) or indoor_outdoor != "outdoor"
-        )
-        food_available = self._contains_any(text, FOOD_TERMS)
-        nap_compatible = not (13 <= event.start_time.hour <= 15)
+        bathroom_accessible = self._contains_any(text, _BATHROOM_RE) or indoor_outdoor != "outdoor"
+        food_available = self._contains_any(text, _FOOD_RE)
+        nap_compatible = start_slot != "nap"
         weather_dependent = indoor_outdoor == "outdoor"
         good_for_rain = indoor_outdoor in {"indoor", "both"}
-        good_for_heat = indoor_outdoor == "indoor" or self._contains_any(text, WATER_TERMS)
+        good_for_heat = indoor_outdoor == "indoor" or self._contains_any(text, _WATER_RE)
 
         energy_level: Literal["calm", "moderate", "active"]
         if "sports" in categories or "water" in categories or "play" in categories:
@@ -287,9 +349,9 @@ class EventTagger:
         if exclusion_signals:
             audience: Literal["toddler_focused", "family_mixed", "general_public", "adult_skewed"]
             audience = "adult_skewed"
-        elif any(term in text for term in ("toddler", "preschool", "story time", "playgroup")):
+        elif self._contains_any(text, _TODDLER_AUDIENCE_RE):
             audience = "toddler_focused"
-        elif any(term in text for term in ("family", "kids", "children")):
+        elif self._contains_any(text, _FAMILY_AUDIENCE_RE):
             audience = "family_mixed"
         else:
             audience = "general_public"
@@ -307,7 +369,7 @@ class EventTagger:
             risk_points += 2
         if not nap_compatible:
             risk_points += 1
-        if event.start_time.time() >= time(19, 0):
+        if start_slot == "late":
             risk_points += 2
         if audience == "adult_skewed":
             risk_points += 3
@@ -331,18 +393,18 @@ class EventTagger:
         confidence = 0.55
         if len(positive_signals) + len(caution_signals) + len(exclusion_signals) >= 4:
             confidence = 0.72
-        if event.description:
+        if has_description:
             confidence += 0.08
         confidence = min(confidence, 0.9)
 
         score = max(0, min(100, score))
         return RuleEvaluation(
             raw_score=score,
-            categories=categories,
+            categories=tuple(categories),
             audience=audience,
-            positive_signals=positive_signals[:5],
-            caution_signals=caution_signals[:5],
-            exclusion_signals=exclusion_signals[:5],
+            positive_signals=tuple(positive_signals[:5]),
+            caution_signals=tuple(caution_signals[:5]),
+            exclusion_signals=tuple(exclusion_signals[:5]),
             indoor_outdoor=indoor_outdoor,
             noise_level=noise_level,
             crowd_level=crowd_level,
@@ -363,12 +425,16 @@ class EventTagger:
         )
 
     def _heuristic_tag(self, event: Event) -> EventTags:
-        """Rule-based fallback tagger when no LLM API key is configured."""
+        """Rule-based fallback tagger when no LLM API key is configured.
+
+        Every field comes from ``RuleEvaluation``, which already clamps scores and
+        only produces valid literals, so the tags are built without revalidation.
+        """
         rule_eval = self._rule_based_assessment(event)
         toddler_score = round(rule_eval.raw_score / 10)
         toddler_score = max(0, min(10, toddler_score))
 
-        return EventTags(
+        return EventTags.model_construct(
             tagging_version=TAGGING_VERSION,
             age_min_recommended=rule_eval.age_min_recommended,
             age_max_recommended=rule_eval.age_max_recommended,
@@ -381,7 +447,7 @@ class EventTagger:
             bathroom_accessible=rule_eval.bathroom_accessible,
             food_available=rule_eval.food_available,
             nap_compatible=rule_eval.nap_compatible,
-            categories=rule_eval.categories,
+            categories=list(rule_eval.categories),
             energy_level=rule_eval.energy_level,
             weather_dependent=rule_eval.weather_dependent,
             good_for_rain=rule_eval.good_for_rain,
@@ -390,9 +456,9 @@ class EventTagger:
             parent_attention_required=rule_eval.parent_attention_required,
             meltdown_risk=rule_eval.meltdown_risk,
             audience=rule_eval.audience,
-            positive_signals=rule_eval.positive_signals,
-            caution_signals=rule_eval.caution_signals,
-            exclusion_signals=rule_eval.exclusion_signals,
+            positive_signals=list(rule_eval.positive_signals),
+            caution_signals=list(rule_eval.caution_signals),
+            exclusion_signals=list(rule_eval.exclusion_signals),
             raw_rule_score=rule_eval.raw_score,
         )
 
@@ -432,9 +498,9 @@ class EventTagger:
         raw = json.loads(response.choices[0].message.content or "{}")
         raw.setdefault("tagging_version", TAGGING_VERSION)
         raw.setdefault("raw_rule_score", rule_eval.raw_score)
-        raw.setdefault("positive_signals", rule_eval.positive_signals)
-        raw.setdefault("caution_signals", rule_eval.caution_signals)
-        raw.setdefault("exclusion_signals", rule_eval.exclusion_signals)
+        raw.setdefault("positive_signals", list(rule_eval.positive_signals))
+        raw.setdefault("caution_signals", list(rule_eval.caution_signals))
+        raw.setdefault("exclusion_signals", list(rule_eval.exclusion_signals))
         raw.setdefault("audience", rule_eval.audience)
         return EventTags.model_validate(raw)
 
@@ -484,6 +550,11 @@ class EventTagger:
         tagged = await asyncio.gather(*tasks)
         return [result for result in tagged if result is not None]
 
+    def _schedule(
+        self, semaphore: asyncio.Semaphore, events: list[Event]
+    ) -> list[asyncio.Task[tuple[Event, EventTags] | None]]:
+        return [asyncio.create_task(self._tag_event_safe(semaphore, event)) for event in events]
+
     async def tag_events_in_batches(
         self,
         events: list[Event],
@@ -499,30 +570,51 @@ class EventTagger:
         if batch_size <= 0:
             raise ValueError("batch_size must be > 0")
 
+        semaphore = asyncio.Semaphore(self._concurrency)
+        batches = [events[idx : idx + batch_size] for idx in range(0, len(events), batch_size)]
         all_results: list[tuple[Event, EventTags]] = []
-        for start_idx in range(0, len(events), batch_size):
-            batch = events[start_idx : start_idx + batch_size]
-            started = pytime.perf_counter()
-            runtime_log(
-                logging.INFO,
-                "tag_batch_started",
-                stage="tag",
-                batch_start=start_idx,
-                batch_size=len(batch),
-                total_events=len(events),
-            )
-            tagged_batch = await self.tag_events(batch)
-            all_results.extend(tagged_batch)
-            runtime_log(
-                logging.INFO,
-                "tag_batch_succeeded",
-                stage="tag",
-                batch_start=start_idx,
-                batch_size=len(batch),
-                tagged_count=len(tagged_batch),
-                failed_count=len(batch) - len(tagged_batch),
-                duration_ms=duration_ms(started),
-            )
-            if on_batch_complete is not None:
-                await on_batch_complete(start_idx, batch, tagged_batch, all_results)
+        pending = self._schedule(semaphore, batches[0]) if batches else []
+        current: list[asyncio.Task[tuple[Event, EventTags] | None]] = []
+        try:
+            for index, batch in enumerate(batches):
+                start_idx = index * batch_size
+                started = pytime.perf_counter()
+                runtime_log(
+                    logging.INFO,
+                    "tag_batch_started",
+                    stage="tag",
+                    batch_start=start_idx,
+                    batch_size=len(batch),
+                    total_events=len(events),
+                )
+                # Queue the next batch before waiting on this one so its calls take
+                # over semaphore slots as this batch drains, instead of idling until
+                # the slowest call here returns.
+                # Swap before awaiting so a cancellation here still reaches the queued
+                # batch in the finally block below.
+                current, pending = (
+                    pending,
+                    self._schedule(semaphore, batches[index + 1])
+                    if index + 1 < len(batches)
+                    else [],
+                )
+                tagged_batch = [
+                    result for result in await asyncio.gather(*current) if result is not None
+                ]
+                all_results.extend(tagged_batch)
+                runtime_log(
+                    logging.INFO,
+                    "tag_batch_succeeded",
+                    stage="tag",
+                    batch_start=start_idx,
+                    batch_size=len(batch),
+                    tagged_count=len(tagged_batch),
+                    failed_count=len(batch) - len(tagged_batch),
+                    duration_ms=duration_ms(started),
+                )
+                if on_batch_complete is not None:
+                    await on_batch_complete(start_idx, batch, tagged_batch, all_results)
+        finally:
+            for task in (*current, *pending):
+                task.cancel()
         return all_results
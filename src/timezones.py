@@ -6,6 +6,7 @@ from datetime import UTC, date, datetime, time, timedelta, tzinfo
 from zoneinfo import ZoneInfo
 
 APP_TZ = ZoneInfo("America/Chicago")
+WEEKDAY_ABBREVIATIONS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 
 
 def utc_now() -> datetime:
@@ -70,3 +71,17 @@ def as_local_date(value: datetime) -> date:
     """Convert an aware datetime to an application-local date."""
     current = value if value.tzinfo is not None else value.replace(tzinfo=UTC)
     return current.astimezone(APP_TZ).date()
+
+
+def weekday_abbr(value: date) -> str:
+    """Return the English weekday abbreviation without a locale-dependent strftime."""
+    return WEEKDAY_ABBREVIATIONS[value.weekday()]
+
+
+def format_clock_12h(value: datetime | time, *, minutes: bool = True) -> str:
+    """Format a 12-hour clock such as ``9:05am`` (or ``9am``) without ``%-I``."""
+    hour = value.hour % 12 or 12
+    suffix = "pm" if value.hour >= 12 else "am"
+    if not minutes:
+        return f"{hour}{suffix}"
+    return f"{hour}:{value.minute:02d}{suffix}"
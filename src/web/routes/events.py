@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime
 from urllib.parse import quote_plus
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
@@ -406,6 +407,8 @@ async def api_events(
     saved: str = "",
     score_min: int | None = Query(default=None, ge=0, le=10),
     sort: str = "start_time",
+    after_start_time: datetime | None = None,
+    after_id: str = "",
 ):
     user = await get_current_user(request, get_db(request))
     if not user:
@@ -432,6 +435,15 @@ async def api_events(
         "-score",
     }:
         raise HTTPException(status_code=422, detail="invalid sort")
+    if (after_start_time is None) != (not after_id):
+        raise HTTPException(
+            status_code=422, detail="after_start_time and after_id must be sent together"
+        )
+    if after_id:
+        try:
+            UUID(after_id)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail="after_id must be a UUID") from exc
 
     db = get_db(request)
     resolved_scope = scope if scope in {"nearby", "all"} else "nearby"
@@ -450,7 +462,14 @@ async def api_events(
         sort=sort,
         page=page,
         per_page=per_page,
+        after_start_time=after_start_time,
+        after_id=after_id or None,
     )
+    next_cursor = None
+    has_more = len(events) == per_page and (bool(after_id) or page * per_page < total)
+    if sort == "start_time" and has_more:
+        last = events[-1]
+        next_cursor = {"after_start_time": last.start_time.isoformat(), "after_id": last.id}
     return {
         "items": [
             {
@@ -471,6 +490,7 @@ async def api_events(
             "per_page": per_page,
             "total": total,
             "total_pages": max(1, (total + per_page - 1) // per_page),
+            "next_cursor": next_cursor,
         },
         "filters": {
             "scope": resolved_scope,
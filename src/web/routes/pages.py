@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 
@@ -190,12 +191,14 @@ async def weekend_page(request: Request):
     user = await get_current_user(request, db)
     scope = resolve_event_scope(request, user)
     visible_city_slugs = visible_city_scope(user=user, scope=scope)
-    weather = await WeatherService().get_weekend_forecast(saturday, sunday)
-    events = await db.get_events_for_weekend(
-        saturday.isoformat(),
-        sunday.isoformat(),
-        viewer_user_id=user.id if user else None,
-        visible_city_slugs=visible_city_slugs,
+    weather, events = await asyncio.gather(
+        WeatherService().get_weekend_forecast(saturday, sunday),
+        db.get_events_for_weekend(
+            saturday.isoformat(),
+            sunday.isoformat(),
+            viewer_user_id=user.id if user else None,
+            visible_city_slugs=visible_city_slugs,
+        ),
     )
 
     tagged = [event for event in events if event.tags]
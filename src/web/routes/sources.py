@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from typing import Any
 
 from fastapi import APIRouter, Request
@@ -37,6 +38,58 @@ from src.web.jobs_ui import render_job_cards, start_background_job
 router = APIRouter()
 logger = logging.getLogger("uvicorn.error")
 
+# Adding a URL that was analyzed recently (e.g. a source deleted and re-added) reuses the
+# cached recipe instead of paying for a fresh LLM pass; explicit re-analysis always runs
+# the analyzer and refreshes the cache.
+_RECIPE_REUSE_MAX_AGE = timedelta(days=30)
+_RECIPE_REUSE_MIN_CONFIDENCE = 0.6
+
+
+async def _cached_recipe(job_db, source_url: str) -> ScrapeRecipe | None:
+    # The cache is best effort: a failed lookup just means a fresh analysis.
+    try:
+        cached = await job_db.get_cached_recipe_json(
+            source_url,
+            max_age=_RECIPE_REUSE_MAX_AGE,
+            min_confidence=_RECIPE_REUSE_MIN_CONFIDENCE,
+        )
+    except Exception as exc:
+        log_event(
+            logger,
+            logging.WARNING,
+            "recipe_cache_read_failed",
+            source_url=source_url,
+            error_type=type(exc).__name__,
+            error_message=str(exc),
+        )
+        return None
+    if not cached:
+        return None
+    try:
+        return ScrapeRecipe.model_validate_json(cached)
+    except ValueError:
+        return None
+
+
+async def _cache_recipe(job_db, source_url: str, recipe: ScrapeRecipe) -> None:
+    # A failed cache write must not discard a recipe the analyzer already paid for.
+    try:
+        await job_db.cache_recipe(
+            source_url,
+            recipe.model_dump_json(),
+            confidence=recipe.confidence,
+            analyzed_at=recipe.analyzed_at,
+        )
+    except Exception as exc:
+        log_event(
+            logger,
+            logging.WARNING,
+            "recipe_cache_write_failed",
+            source_url=source_url,
+            error_type=type(exc).__name__,
+            error_message=str(exc),
+        )
+
 
 async def _run_source_analyze_job(
     job_db,
@@ -44,6 +97,7 @@ async def _run_source_analyze_job(
     source_id: str,
     source_name: str,
     source_url: str,
+    reuse_recent: bool = False,
 ) -> dict[str, Any]:
     log_event(
         logger,
@@ -55,7 +109,11 @@ async def _run_source_analyze_job(
         source_url=source_url,
     )
     try:
-        recipe = await PageAnalyzer().analyze(source_url)
+        recipe = await _cached_recipe(job_db, source_url) if reuse_recent else None
+        reused = recipe is not None
+        if recipe is None:
+            recipe = await PageAnalyzer().analyze(source_url)
+            await _cache_recipe(job_db, source_url, recipe)
         status = "active" if recipe.confidence >= 0.3 else "failed"
         await job_db.update_source_recipe(
             source_id,
@@ -68,6 +126,7 @@ async def _run_source_analyze_job(
             "confidence": recipe.confidence,
             "notes": recipe.notes,
             "recipe": recipe.model_dump(mode="json"),
+            "reused": reused,
         }
         log_event(
             logger,
@@ -80,6 +139,7 @@ async def _run_source_analyze_job(
             strategy=recipe.strategy,
             confidence=round(recipe.confidence, 3),
             status=status,
+            reused=reused,
         )
         return result
     except Exception as exc:
@@ -297,6 +357,7 @@ async def api_add_source(request: Request):
                 source_id=source.id,
                 source_name=source.name,
                 source_url=url,
+                reuse_recent=True,
             )
 
     sources = await db.get_user_sources(user.id)
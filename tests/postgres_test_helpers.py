@@ -18,7 +18,14 @@ DEFAULT_POSTGRES_DATABASE_URL = (
 )
 TEST_DATABASE_ENV_VAR = "TEST_DATABASE_URL"
 TEST_DATABASE_SUFFIX = "_test"
-TRUNCATE_TABLES = ("user_event_state", "jobs", "events", "sources", "users")
+TRUNCATE_TABLES = (
+    "user_event_state",
+    "jobs",
+    "events",
+    "sources",
+    "scrape_recipes",
+    "users",
+)
 T = TypeVar("T")
 
 
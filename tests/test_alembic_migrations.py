@@ -8,7 +8,9 @@ from alembic.script import ScriptDirectory
 
 _HISTORICAL_REVISION_SHA256 = {
     "3d7f85fe4c1a": "b56170e6b3ad66bc7ec364782e8589713919f3227fe975e95777ea47911c70d5",
+    "8c0f9f8b1f6b": "8f68592509f945f6a432216ad76e689cf254100e129a9640cf58ab066fd10626",
     "91dae90b6493": "510e74f2695350e6a460027dbb01feca26abf8f91ec7ec5c8c51a8bc600e1e9d",
+    "d32feec83c05": "8bcc88de03c3b4ecddbceb0bf706868377435341ad525e03c28cfca1de7c7e84",
 }
 
 
@@ -28,6 +30,8 @@ def test_historical_revisions_keep_expected_successors() -> None:
     expected_successors = {
         "91dae90b6493": "3d7f85fe4c1a",
         "3d7f85fe4c1a": "8c0f9f8b1f6b",
+        "8c0f9f8b1f6b": "d32feec83c05",
+        "d32feec83c05": "5b2e9c7d4a18",
     }
 
     for revision_id, successor_id in expected_successors.items():
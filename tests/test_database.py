@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import text
+
+from src.db.database import create_database
+from src.db.models import Event, Source, User
+from src.db.postgres import PostgresDatabase
+
+
+def _event(source_id: str, title: str, *, hours_ahead: int = 24) -> Event:
+    start = datetime.now(tz=UTC) + timedelta(hours=hours_ahead)
+    return Event(
+        source="manual",
+        source_url=f"https://example.com/{source_id}",
+        source_id=source_id,
+        title=title,
+        location_city="Lafayette",
+        start_time=start,
+        scraped_at=datetime.now(tz=UTC),
+        raw_data={},
+    )
+
+
+def test_connections_apply_configured_server_settings(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> dict[str, str]:
+        async with (
+            create_database(database_url=isolated_postgres_database_url) as db,
+            db.session() as session,
+        ):
+            result = await session.execute(
+                text(
+                    "SELECT current_setting('lock_timeout') AS lock_timeout, "
+                    "current_setting('application_name') AS application_name"
+                )
+            )
+            return dict(result.mappings().one())
+
+    row = asyncio.run(scenario())
+
+    assert row["lock_timeout"] == "5s"
+    assert row["application_name"] == "family-events"
+
+
+def test_read_session_uses_separate_pool_when_read_url_configured(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> tuple[bool, bool, int]:
+        shared = PostgresDatabase(isolated_postgres_database_url)
+        replica = PostgresDatabase(
+            isolated_postgres_database_url,
+            read_database_url=f"{isolated_postgres_database_url}?prepared_statement_cache_size=0",
+        )
+        async with shared, replica:
+            _, total = await replica.search_events(days=30)
+            return (
+                shared.read_engine is shared.engine,
+                replica.read_engine is replica.engine,
+                total,
+            )
+
+    shared_pool, replica_shares_pool, total = asyncio.run(scenario())
+
+    assert shared_pool is True
+    assert replica_shares_pool is False
+    assert total == 0
+
+
+def test_upsert_events_writes_batch_and_returns_ids_in_order(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> tuple[list[str], list[str], int]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            first = await db.upsert_events(
+                [
+                    _event("a", "Toddler Art Hour"),
+                    _event("b", "Splash Pad Morning", hours_ahead=48),
+                    _event("c", "Toddler Art Hour!"),
+                ]
+            )
+            again = await db.upsert_events(
+                [_event("b", "Splash Pad Morning (updated)", hours_ahead=48)]
+            )
+            _, total = await db.search_events(days=30)
+            return first, again, total
+
+    first, again, total = asyncio.run(scenario())
+
+    assert len(first) == 3
+    assert first[2] == first[0]  # same-day near-duplicate merges into the earlier row
+    assert again == [first[1]]
+    assert total == 2
+
+
+def test_upsert_events_refreshes_existing_rows_and_repeated_keys_in_one_batch(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> tuple[list[str], list[str], list[str]]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            first = await db.upsert_events(
+                [_event("a", "Museum Morning"), _event("b", "Zoo Walk", hours_ahead=48)]
+            )
+            second = await db.upsert_events(
+                [
+                    _event("b", "Zoo Walk (rescheduled)", hours_ahead=50),
+                    _event("d", "Farm Visit", hours_ahead=72),
+                    _event("a", "Museum Morning (updated)"),
+                    _event("d", "Farm Visit (updated)", hours_ahead=72),
+                ]
+            )
+            events, _ = await db.search_events(days=30)
+            return first, second, sorted(event.title for event in events)
+
+    first, second, titles = asyncio.run(scenario())
+
+    assert second[0] == first[1]
+    assert second[2] == first[0]
+    assert second[3] == second[1]
+    assert titles == ["Farm Visit (updated)", "Museum Morning (updated)", "Zoo Walk (rescheduled)"]
+
+
+def test_search_events_skips_raw_data_but_detail_lookup_keeps_it(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> tuple[Event, Event | None]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            event = _event("raw", "Story Time")
+            event.raw_data = {"html": "<div>Story Time</div>"}
+            await db.upsert_event(event)
+            listed, _ = await db.search_events(days=30)
+            return listed[0], await db.get_event(event.id)
+
+    listed, detail = asyncio.run(scenario())
+
+    assert listed.title == "Story Time"
+    assert listed.raw_data == {}
+    assert detail is not None
+    assert detail.raw_data == {"html": "<div>Story Time</div>"}
+
+
+def test_untagged_index_covers_start_time_for_untagged_rows_only(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> dict[str, str]:
+        async with (
+            create_database(database_url=isolated_postgres_database_url) as db,
+            db.session() as session,
+        ):
+            result = await session.execute(
+                text(
+                    "SELECT indexname, indexdef FROM pg_indexes "
+                    "WHERE tablename = 'events' AND indexdef ILIKE '%tags IS NULL%'"
+                )
+            )
+            return {str(row[0]): str(row[1]) for row in result.all()}
+
+    indexes = asyncio.run(scenario())
+
+    assert list(indexes) == ["idx_events_untagged_start_time"]
+    assert "(start_time)" in indexes["idx_events_untagged_start_time"]
+
+
+def test_search_events_text_filter_is_case_insensitive_across_title_and_description(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> tuple[list[str], list[str]]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            splash = _event("splash", "Splash Pad Morning")
+            story = _event("story", "Library Hour")
+            story.description = "Songs and STORYTIME for little ones"
+            await db.upsert_events([splash, story])
+            by_title, _ = await db.search_events(days=30, q="SPLASH")
+            by_description, _ = await db.search_events(days=30, q="storytime")
+            return [e.title for e in by_title], [e.title for e in by_description]
+
+    by_title, by_description = asyncio.run(scenario())
+
+    assert by_title == ["Splash Pad Morning"]
+    assert by_description == ["Library Hour"]
+
+
+def test_search_events_reports_total_on_every_page_including_past_the_end(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> list[tuple[int, int]]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            await db.upsert_events(
+                [
+                    _event("one", "Museum Morning", hours_ahead=24),
+                    _event("two", "Zoo Walk", hours_ahead=48),
+                    _event("three", "Farm Visit", hours_ahead=72),
+                ]
+            )
+            pages = []
+            for page in (1, 2, 3):
+                events, total = await db.search_events(days=30, page=page, per_page=2)
+                pages.append((len(events), total))
+            return pages
+
+    assert asyncio.run(scenario()) == [(2, 3), (1, 3), (0, 3)]
+
+
+def test_filter_options_are_cached_until_events_are_written(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> tuple[list[str], list[str], list[str]]:
+        async with (
+            create_database(database_url=isolated_postgres_database_url) as db,
+            create_database(database_url=isolated_postgres_database_url) as other_process,
+        ):
+            await db.upsert_event(_event("first", "Story Time"))
+            initial = (await db.get_filter_options())["sources"]
+            other = _event("second", "Zoo Walk")
+            other.source = "zoo"
+            await other_process.upsert_event(other)
+            cached = (await db.get_filter_options())["sources"]
+            await db.upsert_event(_event("third", "Farm Visit"))
+            refreshed = (await db.get_filter_options())["sources"]
+            return initial, cached, refreshed
+
+    initial, cached, refreshed = asyncio.run(scenario())
+
+    assert initial == ["manual"]
+    assert cached == ["manual"]
+    assert refreshed == ["manual", "zoo"]
+
+
+def test_upsert_events_records_source_scrape_status_in_same_call(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> tuple[Source | None, Source | None]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            source = Source(name="Library", url="https://library.example.com", domain="library")
+            await db.create_source(source)
+            await db.upsert_events([_event("lib-1", "Story Time")], source_id=source.id)
+            scraped = await db.get_source(source.id)
+            await db.upsert_events([], source_id=source.id)
+            return scraped, await db.get_source(source.id)
+
+    scraped, empty = asyncio.run(scenario())
+
+    assert scraped is not None
+    assert (scraped.status, scraped.last_event_count) == ("active", 1)
+    assert scraped.last_scraped_at is not None
+    assert empty is not None
+    assert (empty.status, empty.last_event_count) == ("stale", 0)
+
+
+def test_set_event_attended_bulk_updates_all_events_in_one_call(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> tuple[int, int]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            user = User(email="bulk-db@example.com", display_name="Parent", password_hash="x")
+            await db.create_user(user)
+            ids = await db.upsert_events(
+                [_event("one", "Museum Morning"), _event("two", "Zoo Walk", hours_ahead=48)]
+            )
+            await db.set_event_attended_bulk(user.id, [*ids, ids[0]], True)
+            _, attended_total = await db.list_my_events(viewer_user_id=user.id, attended="yes")
+            await db.set_event_attended_bulk(user.id, ids[:1], False)
+            _, remaining_total = await db.list_my_events(viewer_user_id=user.id, attended="yes")
+            return attended_total, remaining_total
+
+    assert asyncio.run(scenario()) == (2, 1)
+
+
+def test_vacuum_events_refreshes_planner_statistics(isolated_postgres_database_url: str) -> None:
+    async def scenario() -> int:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            await db.upsert_events([_event("v1", "Story Time"), _event("v2", "Zoo Walk")])
+            await db.upsert_events([_event("v1", "Story Time (updated)")])
+            await db.vacuum_events()
+            async with db.session() as session:
+                analyzed = await session.execute(
+                    text(
+                        "SELECT COUNT(*) FROM pg_stats "
+                        "WHERE tablename = 'events' AND attname = 'start_time'"
+                    )
+                )
+                return int(analyzed.scalar_one())
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_filter_options_lists_scoped_cities_and_sources_in_order(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            zoo = _event("zoo", "Zoo Walk")
+            zoo.source, zoo.location_city = "zoo", "Baton Rouge"
+            farm = _event("farm", "Farm Visit", hours_ahead=48)
+            farm.source = "brec"
+            await db.upsert_events([zoo, farm, _event("story", "Story Time", hours_ahead=72)])
+            everywhere = await db.get_filter_options()
+            lafayette = await db.get_filter_options(visible_city_slugs=["lafayette"])
+            return everywhere, lafayette
+
+    everywhere, lafayette = asyncio.run(scenario())
+
+    assert everywhere == {
+        "cities": ["Baton Rouge", "Lafayette"],
+        "sources": ["brec", "manual", "zoo"],
+    }
+    assert lafayette == {"cities": ["Lafayette"], "sources": ["brec", "manual"]}
+
+
+def test_upsert_event_stores_raw_data_with_non_string_keys(
+    isolated_postgres_database_url: str,
+) -> None:
+    async def scenario() -> Event | None:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            event = _event("json", "Story Time")
+            event.raw_data = {1: "first listing", "html": "<p>Story Time</p>"}
+            event_id = await db.upsert_event(event)
+            return await db.get_event(event_id)
+
+    stored = asyncio.run(scenario())
+
+    assert stored is not None
+    assert stored.raw_data == {"1": "first listing", "html": "<p>Story Time</p>"}
+
+
+def test_get_recent_events_skips_excluded_ids(isolated_postgres_database_url: str) -> None:
+    async def scenario() -> list[str]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            ids = await db.upsert_events(
+                [
+                    _event("one", "Museum Morning"),
+                    _event("two", "Zoo Walk", hours_ahead=48),
+                    _event("three", "Farm Visit", hours_ahead=72),
+                ]
+            )
+            events = await db.get_recent_events(days=14, exclude_ids=ids[:2])
+            return [event.title for event in events]
+
+    assert asyncio.run(scenario()) == ["Farm Visit"]
@@ -49,3 +49,26 @@ def test_pipeline_cli_runs_scrape_tag_then_notify(monkeypatch):
     main.cli()
 
     assert calls == ["scrape_then_tag", "notify"]
+
+
+def test_help_does_not_load_settings_or_asyncio():
+    import subprocess
+    import sys
+
+    probe = (
+        "import sys\n"
+        "from src import main\n"
+        "try:\n"
+        "    main.cli()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(name for name in ('asyncio', 'src.config') if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe, "--help"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 from contextlib import contextmanager
 
@@ -100,6 +101,37 @@ def test_notification_dispatcher_logs_summary():
     asyncio.run(scenario())
 
 
+def test_notification_dispatcher_sends_channels_concurrently():
+    active = 0
+    peak = 0
+
+    class SlowNotifier:
+        async def send(self, message: str, **kwargs) -> bool:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+    async def scenario() -> list[str]:
+        dispatcher = NotificationDispatcher()
+        dispatcher.email = SlowNotifier()
+        dispatcher.sms = SlowNotifier()
+        dispatcher.telegram = SlowNotifier()
+        results = await dispatcher.dispatch(
+            "hello",
+            channels=["telegram", "email", "sms"],
+            email_to="parent@example.com",
+            sms_to="+15557654321",
+        )
+        await dispatcher.aclose()
+        return [item["recipient"] for item in results]
+
+    assert asyncio.run(scenario()) == ["telegram", "parent@example.com", "+15557654321"]
+    assert peak == 3
+
+
 def test_notification_notifiers_log_success_context(monkeypatch):
     calls: list[dict[str, object]] = []
 
@@ -159,6 +191,20 @@ def test_notification_notifiers_log_success_context(monkeypatch):
 
     asyncio.run(scenario())
 
+    email_call = next(call for call in calls if call["url"] == "https://api.resend.com/emails")
+    assert json.loads(email_call["content"]) == {
+        "from": "Family <test@example.com>",
+        "to": ["parent@example.com"],
+        "subject": "🌟 Weekend Plans!",
+        "html": "hello",
+    }
+    assert email_call["headers"]["Content-Type"] == "application/json"
+    assert [call["extensions"] for call in calls] == [
+        {"family_events.service": "notify.email.resend"},
+        {"family_events.service": "notify.sms.twilio"},
+        {"family_events.service": "notify.telegram"},
+    ]
+
 
 def test_notification_notifiers_log_failure_context(monkeypatch):
     class FakeClient:
@@ -238,3 +284,226 @@ def test_notification_notifiers_use_shared_http_client(monkeypatch):
     assert any(entry.get("url") == "https://api.resend.com/emails" for entry in calls)
     assert any("api.twilio.com" in str(entry.get("url", "")) for entry in calls)
     assert any("api.telegram.org" in str(entry.get("url", "")) for entry in calls)
+
+
+def test_notification_dispatcher_skips_http_client_for_console_only(monkeypatch):
+    def fail_build_async_client(**kwargs):
+        raise AssertionError("console delivery should not build an HTTP client")
+
+    monkeypatch.setattr("src.notifications.dispatcher.build_async_client", fail_build_async_client)
+
+    async def scenario() -> list[bool]:
+        dispatcher = NotificationDispatcher()
+        results = await dispatcher.dispatch("hello")
+        await dispatcher.aclose()
+        return [item["success"] for item in results]
+
+    assert asyncio.run(scenario()) == [True]
+
+
+def test_notification_dispatcher_reuses_one_client_across_channels(monkeypatch):
+    posts: list[str] = []
+
+    class FakeResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeClient:
+        closed = False
+
+        async def post(self, url: str, **kwargs):
+            posts.append(url)
+            return FakeResponse()
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    def fail_build_async_client(**kwargs):
+        raise AssertionError("notifiers should reuse the dispatcher client")
+
+    for module in ("email", "sms", "telegram"):
+        monkeypatch.setattr(
+            f"src.notifications.{module}.build_async_client", fail_build_async_client
+        )
+    monkeypatch.setattr("src.notifications.email.settings.resend_api_key", "resend-key")
+    monkeypatch.setattr("src.notifications.sms.settings.twilio_account_sid", "sid")
+    monkeypatch.setattr("src.notifications.sms.settings.twilio_auth_token", "token")
+    monkeypatch.setattr("src.notifications.sms.settings.twilio_from_number", "+15551234567")
+    monkeypatch.setattr("src.notifications.telegram.settings.telegram_bot_token", "bot-token")
+    monkeypatch.setattr("src.notifications.telegram.settings.telegram_chat_id", "chat-id")
+    client = FakeClient()
+
+    async def scenario() -> list[bool]:
+        dispatcher = NotificationDispatcher(client)
+        results = await dispatcher.dispatch(
+            "hello",
+            channels=["email", "sms", "telegram"],
+            email_to="parent@example.com",
+            sms_to="+15557654321",
+        )
+        await dispatcher.aclose()
+        return [item["success"] for item in results]
+
+    assert asyncio.run(scenario()) == [True, True, True]
+    assert len(posts) == 3
+    assert client.closed is False
+
+
+def test_friday_notification_fans_out_with_bounded_concurrency(monkeypatch) -> None:
+    import src.cron as cron_module
+    from src.db.models import User
+
+    users = [
+        User(email=f"parent{index}@example.com", display_name="Parent", password_hash="x")
+        for index in range(5)
+    ]
+    notified: list[str] = []
+    clock_reads: set[object] = set()
+    active = 0
+    peak = 0
+
+    class FakeDatabase:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc) -> None:
+            return None
+
+        async def get_all_users(self):
+            return users
+
+    async def fake_run_notify(db, *, user, now):
+        nonlocal active, peak
+        clock_reads.add(now)
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if user is users[1]:
+            raise RuntimeError("smtp down")
+        notified.append(user.email)
+
+    monkeypatch.setattr(cron_module, "create_database", FakeDatabase)
+    monkeypatch.setattr(cron_module, "run_notify", fake_run_notify)
+    monkeypatch.setattr(cron_module.settings, "notify_concurrency", 2)
+
+    with capture_uvicorn_logs() as messages:
+        asyncio.run(cron_module.friday_notification())
+
+    assert peak == 2
+    assert len(clock_reads) == 1
+    assert sorted(notified) == sorted(u.email for u in users if u is not users[1])
+    assert any("cron_notification_user_failed" in message for message in messages)
+    assert any("cron_job_succeeded" in message for message in messages)
+
+
+def test_cron_main_waits_for_sigterm_then_shuts_scheduler_down(monkeypatch) -> None:
+    import os
+    import signal
+
+    import src.cron as cron_module
+
+    shutdowns: list[bool] = []
+
+    class FakeScheduler:
+        def __init__(self, **kwargs) -> None:
+            self.jobs: list[object] = []
+
+        def add_job(self, *args, **kwargs) -> None:
+            return None
+
+        def start(self) -> None:
+            asyncio.get_running_loop().call_later(0.01, os.kill, os.getpid(), signal.SIGTERM)
+
+        def get_jobs(self) -> list[object]:
+            return self.jobs
+
+        def shutdown(self, wait: bool = True) -> None:
+            shutdowns.append(wait)
+
+    monkeypatch.setattr(cron_module, "AsyncIOScheduler", FakeScheduler)
+
+    asyncio.run(asyncio.wait_for(cron_module.main(), timeout=5))
+
+    assert shutdowns == [False]
+
+
+def test_format_console_message_lists_top_three_with_details():
+    from datetime import date, datetime
+
+    from src.db.models import Event, EventTags
+    from src.notifications.formatter import format_console_message
+    from src.ranker.weather import DayForecast
+
+    forecast = DayForecast(
+        date=date(2026, 3, 7),
+        temp_high_f=81,
+        temp_low_f=64,
+        precipitation_pct=10,
+        description="clear sky",
+        icon="☀️",
+        uv_index=6,
+    )
+    ranked = [
+        (
+            Event(
+                source="test",
+                source_url=f"https://example.com/{index}",
+                source_id=str(index),
+                title=f"Event {index}",
+                start_time=datetime(2026, 3, 7, 9 + index, 5),
+                is_free=index != 1,
+                price_min=12.0,
+                tags=EventTags(categories=["animals", "play", "music"]) if index == 0 else None,
+            ),
+            10.0 - index,
+        )
+        for index in range(4)
+    ]
+
+    message = format_console_message(ranked, {"saturday": forecast, "sunday": forecast}, "Ava")
+
+    assert message.splitlines()[:8] == [
+        "🌟 Weekend Plans for Ava! 🌟",
+        "",
+        "Weather: ☀️ Sat 81°F / ☀️ Sun 81°F",
+        "",
+        "🥇 TOP PICK: Event 0",
+        "   📍 Lafayette | 🕐 Sat 9:05am | 💵 Free",
+        "   ✨ animals, play, both, stroller-friendly",
+        "",
+    ]
+    assert "   📍 Lafayette | 🕐 Sat 10:05am | 💵 $12.0" in message
+    assert "🥉: Event 2" in message
+    assert "Event 3" not in message
+    assert "... and 1 more options available!" in message
+
+
+def test_shared_notify_client_logs_the_provider_service_label():
+    import httpx
+
+    from src.http import SERVICE_EXTENSION, build_async_client
+
+    responses = iter([httpx.Response(503), httpx.Response(200)])
+    client = build_async_client(
+        service="notify",
+        max_retries=1,
+        backoff_seconds=0,
+        transport_factory=lambda: httpx.MockTransport(lambda request: next(responses)),
+    )
+
+    async def scenario() -> None:
+        with capture_uvicorn_logs() as messages:
+            resp = await client.get(
+                "https://api.telegram.org/status",
+                extensions={SERVICE_EXTENSION: "notify.telegram"},
+            )
+            await client.aclose()
+
+        assert resp.status_code == 200
+        assert any(
+            "external_http_retry" in message and "service=notify.telegram" in message
+            for message in messages
+        )
+
+    asyncio.run(scenario())
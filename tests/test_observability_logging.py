@@ -23,6 +23,9 @@ class FakeSourceJobDb:
             {"source_id": source_id, "recipe_json": recipe_json, "status": status}
         )
 
+    async def cache_recipe(self, url: str, recipe_json: str, **_metadata: object) -> None:
+        return None
+
     async def update_source_status(self, source_id: str, *, status: str, error: str = "") -> None:
         self.status_updates.append({"source_id": source_id, "status": status, "error": error})
 
@@ -139,6 +142,49 @@ def test_run_source_analyze_job_logs_failure(monkeypatch):
     ]
 
 
+def test_run_source_analyze_job_treats_recipe_cache_as_best_effort(monkeypatch):
+    import src.web.routes.sources as sources_module
+
+    recipe = ScrapeRecipe(
+        strategy="jsonld",
+        analyzed_at=datetime.now(tz=UTC),
+        confidence=0.9,
+        jsonld=JSONLDStrategy(),
+    )
+
+    class BrokenCacheDb(FakeSourceJobDb):
+        async def get_cached_recipe_json(self, url: str, **_filters: object) -> str | None:
+            raise RuntimeError("cache read down")
+
+        async def cache_recipe(self, url: str, recipe_json: str, **_metadata: object) -> None:
+            raise RuntimeError("cache write down")
+
+    class FakeAnalyzer:
+        async def analyze(self, url: str) -> ScrapeRecipe:
+            return recipe
+
+    monkeypatch.setattr(sources_module, "PageAnalyzer", lambda: FakeAnalyzer())
+    job_db = BrokenCacheDb()
+
+    async def scenario() -> None:
+        with capture_uvicorn_logs() as messages:
+            result = await sources_module._run_source_analyze_job(
+                job_db,
+                source_id="source-1",
+                source_name="Library Calendar",
+                source_url="https://example.com/events",
+                reuse_recent=True,
+            )
+
+        assert result["reused"] is False
+        assert any("recipe_cache_read_failed" in message for message in messages)
+        assert any("recipe_cache_write_failed" in message for message in messages)
+
+    asyncio.run(scenario())
+    assert job_db.recipe_updates and job_db.recipe_updates[0]["status"] == "active"
+    assert job_db.status_updates == []
+
+
 def test_run_source_test_job_logs_success(monkeypatch):
     import src.web.routes.sources as sources_module
 
@@ -252,3 +298,43 @@ def test_run_logged_pipeline_job_logs_success_and_failure():
         )
 
     asyncio.run(scenario())
+
+
+def test_brec_parse_errors_log_one_warning_summary(monkeypatch):
+    from src.db.models import Source
+    from src.scrapers.brec import CALENDAR_URL, BrecScraper
+
+    scraper = BrecScraper(
+        Source(name="BREC", url=CALENDAR_URL, domain="brec.org", city="Baton Rouge")
+    )
+    html = (
+        '<html><body><section class="events-list">'
+        '<header class="day-header"><h2>Not a date</h2></header>'
+        "<article><h3>Walk</h3></article><article><h3>Swim</h3></article>"
+        "</section></body></html>"
+    )
+
+    class FakeResponse:
+        text = html
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        async def get(self, url: str):
+            return FakeResponse()
+
+    monkeypatch.setattr(scraper, "_client", lambda **kwargs: FakeClient())
+
+    with capture_uvicorn_logs() as messages:
+        events = asyncio.run(scraper._scrape_month(CALENDAR_URL))
+
+    assert events == []
+    assert not any("Parse error" in message for message in messages)
+    assert sum("skipped 2 unparseable articles" in message for message in messages) == 1
@@ -7,7 +7,7 @@ from src.onboarding import normalize_city_list
 from src.predefined_sources import get_predefined_source, make_predefined_source
 from src.scrapers.allevents import AllEventsScraper
 from src.scrapers.eventbrite import EventbriteScraper
-from src.scrapers.router import get_builtin_scraper
+from src.scrapers.router import get_builtin_scraper, is_builtin_domain
 from src.tagger.llm import EventTagger
 
 
@@ -72,6 +72,502 @@ def test_builtin_router_builds_parameterized_allevents_scraper():
     assert scraper.city == "New Orleans"
 
 
+def test_builtin_domain_matches_subdomains_on_label_boundaries():
+    assert is_builtin_domain("https://www.brec.org/calendar")
+    assert is_builtin_domain("https://events.BREC.org/calendar")
+    assert not is_builtin_domain("https://notbrec.org/calendar")
+    assert not is_builtin_domain("https://other.libcal.com/calendar")
+
+
+def test_allevents_scraper_falls_back_to_html_cards_without_json_ld(monkeypatch):
+    import asyncio
+
+    source = make_predefined_source(user_id="user-1", source_key="new-orleans-allevents")
+    scraper = get_builtin_scraper(source)
+    html = (
+        '<html><body><div class="event-card"><h3>Toddler Dance Party</h3>'
+        '<time datetime="2025-03-09">Mar 9</time><span class="price">Free</span></div>'
+        "</body></html>"
+    )
+
+    class FakeResponse:
+        text = html
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        async def get(self, url: str):
+            return FakeResponse()
+
+    monkeypatch.setattr(scraper, "_client", lambda **kwargs: FakeClient())
+
+    events = asyncio.run(scraper.scrape())
+
+    assert [(event.title, event.location_city, event.is_free) for event in events] == [
+        ("Toddler Dance Party", "New Orleans", True)
+    ]
+    assert events[0].start_time.date().isoformat() == "2025-03-09"
+
+
+def test_allevents_json_ld_events_keep_only_core_raw_fields():
+    source = make_predefined_source(user_id="user-1", source_key="new-orleans-allevents")
+    scraper = get_builtin_scraper(source)
+
+    event = scraper._ld_to_event(
+        {
+            "@type": "Event",
+            "name": "Toddler Dance Party",
+            "startDate": "2025-03-09T10:00:00-05:00",
+            "url": "https://allevents.in/new-orleans/toddler-dance-party",
+            "description": "Long description " * 200,
+            "performer": {"@type": "Person", "name": "DJ Tiny"},
+            "image": ["a.jpg", "b.jpg"],
+        }
+    )
+
+    assert sorted(event.raw_data) == ["@type", "name", "startDate", "url"]
+
+
+def test_eventbrite_scraper_falls_back_to_html_cards_without_json_ld(monkeypatch):
+    import asyncio
+
+    source = make_predefined_source(user_id="user-1", source_key="houston-eventbrite")
+    scraper = get_builtin_scraper(source)
+    html = (
+        '<html><body><div data-testid="search-event-card"><h2>Story Time</h2>'
+        '<a href="https://www.eventbrite.com/e/story-time-1">Details</a>'
+        "<time>Sat, Mar 08, 2025 10:00 AM</time></div></body></html>"
+    )
+
+    class FakeResponse:
+        text = html
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        async def get(self, url: str):
+            return FakeResponse()
+
+    monkeypatch.setattr(scraper, "_client", lambda **kwargs: FakeClient())
+
+    events = asyncio.run(scraper.scrape())
+
+    assert [(event.title, event.source_url) for event in events] == [
+        ("Story Time", "https://www.eventbrite.com/e/story-time-1")
+    ]
+
+
+def test_eventbrite_server_data_payload_is_extracted_without_json_ld():
+    source = make_predefined_source(user_id="user-1", source_key="houston-eventbrite")
+    scraper = get_builtin_scraper(source)
+    html = (
+        "<html><body><script>window.__SERVER_DATA__ = "
+        '{"search_data": {"events": {"results": [{"id": "42", "name": "Zoo Walk", '
+        '"url": "https://www.eventbrite.com/e/zoo-walk-42", '
+        '"start_date": "2025-03-08"}]}}};\n</script></body></html>'
+    )
+
+    events = scraper._extract_server_data(html)
+
+    assert [(event.source_id, event.title) for event in events] == [("42", "Zoo Walk")]
+    assert scraper._extract_server_data("<script>window.other = {};</script>") == []
+
+
+def test_json_ld_blocks_reads_only_ld_json_scripts():
+    from src.scrapers.base import json_ld_blocks
+
+    html = (
+        '<html><head><script type="application/ld+json">{"@type": "Event"}</script>'
+        "<script>var x = 1;</script></head><body><p>hi</p></body></html>"
+    )
+
+    assert json_ld_blocks(html) == ['{"@type": "Event"}']
+    assert json_ld_blocks("") == []
+
+
+def test_json_ld_blocks_reads_xhtml_pages_with_an_xml_declaration():
+    from src.scrapers.base import json_ld_blocks
+
+    html = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<html><head>'
+        '<script type="application/ld+json">{"@type": "Event"}</script>'
+        "</head><body></body></html>"
+    )
+    assert json_ld_blocks(html) == ['{"@type": "Event"}']
+
+
+def test_stable_source_id_matches_previously_stored_md5_ids():
+    import hashlib
+
+    from src.scrapers.base import stable_source_id
+
+    url = "https://www.eventbrite.com/e/story-time-1"
+    assert stable_source_id(url) == hashlib.md5(url.encode()).hexdigest()
+
+
+def test_brec_scraper_keeps_current_month_when_next_month_fails(monkeypatch):
+    import asyncio
+    from datetime import UTC, datetime
+
+    from src.db.models import Event, Source
+    from src.scrapers.brec import CALENDAR_URL, BrecScraper
+
+    scraper = BrecScraper(
+        Source(name="BREC", url=CALENDAR_URL, domain="brec.org", city="Baton Rouge")
+    )
+    started: list[str] = []
+
+    async def fake_scrape_month(url: str) -> list[Event]:
+        started.append(url)
+        await asyncio.sleep(0)
+        # Both months must be in flight before either one finishes.
+        assert len(started) == 2
+        if url != CALENDAR_URL:
+            raise RuntimeError("next month down")
+        return [
+            Event(
+                source="brec",
+                source_url=url,
+                source_id="1",
+                title="Park Day",
+                start_time=datetime(2025, 3, 9, 10, 0, tzinfo=UTC),
+            )
+        ]
+
+    monkeypatch.setattr(scraper, "_scrape_month", fake_scrape_month)
+
+    events = asyncio.run(scraper.scrape())
+
+    assert [event.title for event in events] == ["Park Day"]
+
+
+def test_brec_month_page_assigns_day_headers_to_following_articles(monkeypatch):
+    import asyncio
+
+    from src.db.models import Source
+    from src.scrapers.brec import CALENDAR_URL, BrecScraper
+
+    scraper = BrecScraper(
+        Source(name="BREC", url=CALENDAR_URL, domain="brec.org", city="Baton Rouge")
+    )
+    html = (
+        '<html><body><section class="events-list">'
+        '<header class="day-header"><h2>Sunday, March 9, 2025</h2></header>'
+        '<article><h3>Park Walk</h3><span class="time">8:30 AM - 9:30 AM</span>'
+        '<span class="park">City Park</span><a href="/calendar/detail/walk/101">More</a>'
+        "</article>"
+        '<header class="day-header"><h2>Monday, March 10, 2025</h2></header>'
+        "<article><h3>Story Time</h3></article>"
+        "</section></body></html>"
+    )
+
+    class FakeResponse:
+        text = html
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        async def get(self, url: str):
+            return FakeResponse()
+
+    monkeypatch.setattr(scraper, "_client", lambda **kwargs: FakeClient())
+
+    events = asyncio.run(scraper._scrape_month(CALENDAR_URL))
+
+    assert [(e.title, e.source_id, e.location_name) for e in events] == [
+        ("Park Walk", "101", "City Park"),
+        ("Story Time", events[1].source_id, ""),
+    ]
+    assert events[0].source_url == "https://www.brec.org/calendar/detail/walk/101"
+    assert (events[0].start_time.hour, events[0].end_time.hour) == (8, 9)
+    assert events[1].start_time.day == 10
+
+
+def test_brec_enrichment_reuses_one_client_for_all_detail_pages(monkeypatch):
+    import asyncio
+    from datetime import UTC, datetime
+
+    from src.db.models import Event, Source
+    from src.scrapers.brec import CALENDAR_URL, BrecScraper
+
+    scraper = BrecScraper(
+        Source(name="BREC", url=CALENDAR_URL, domain="brec.org", city="Baton Rouge")
+    )
+    opened: list[object] = []
+
+    class FakeResponse:
+        status_code = 200
+        encoding = "utf-8"
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        async def aiter_bytes(self):
+            yield b'<html><body><div class="event-description">Bring water.</div>'
+            # Everything past the description cap is never read.
+            yield b"<p>" + b"x" * 300_000 + b"</p>"
+            raise AssertionError("read past the detail-page cap")
+
+    class FakeClient:
+        async def __aenter__(self):
+            opened.append(self)
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        def stream(self, method: str, url: str):
+            assert method == "GET"
+            return FakeResponse()
+
+    monkeypatch.setattr(scraper, "_client", lambda **kwargs: FakeClient())
+    events = [
+        Event(
+            source="brec",
+            source_url=f"{CALENDAR_URL}/detail/walk/{index}",
+            source_id=str(index),
+            title=f"Walk {index}",
+            start_time=datetime(2025, 3, 9, 10, 0, tzinfo=UTC),
+        )
+        for index in range(3)
+    ]
+
+    enriched = asyncio.run(scraper._enrich_events(events))
+
+    assert len(opened) == 1
+    assert [event.description for event in enriched] == ["Bring water."] * 3
+
+
+def test_generic_css_recipe_extracts_fields_with_compiled_selectors(monkeypatch):
+    import asyncio
+    from datetime import UTC, datetime
+
+    from src.scrapers.generic import GenericScraper
+    from src.scrapers.recipe import CSSFields, CSSStrategy, FieldRule, ScrapeRecipe
+
+    recipe = ScrapeRecipe(
+        strategy="css",
+        analyzed_at=datetime(2025, 3, 1, tzinfo=UTC),
+        css=CSSStrategy(
+            event_container="li.event",
+            fields=CSSFields(
+                title=FieldRule(selector="h3"),
+                start_time=FieldRule(selector="time", attr="datetime"),
+                url=FieldRule(selector="a", attr="href"),
+                price=FieldRule(selector=".price", default="Free"),
+                location=FieldRule(default="Main Library"),
+            ),
+        ),
+    )
+    html = (
+        '<ul><li class="event"><h3>Lego Club</h3><time datetime="2025-03-09T10:00:00">'
+        '</time><a href="/events/lego">More</a><span class="price">$5</span></li>'
+        '<li class="event"><h3>Story Time</h3><time datetime="2025-03-10T10:00:00"></time>'
+        "</li></ul>"
+    )
+
+    class FakeResponse:
+        text = html
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        async def get(self, url: str):
+            return FakeResponse()
+
+    scraper = GenericScraper(url="https://example.com/events", source_id="s1", recipe=recipe)
+    monkeypatch.setattr(scraper, "_client", lambda **kwargs: FakeClient())
+
+    events = asyncio.run(scraper.scrape())
+
+    assert [
+        (e.title, e.source_url, e.is_free, e.price_min, e.location_name, e.image_url)
+        for e in events
+    ] == [
+        ("Lego Club", "https://example.com/events/lego", False, 5.0, "Main Library", None),
+        ("Story Time", "https://example.com/events", True, None, "Main Library", None),
+    ]
+    assert events[0].start_time.day == 9
+
+
+def test_lafayette_mec_scrape_keeps_articles_and_event_links_only(monkeypatch):
+    import asyncio
+
+    from src.db.models import Source
+    from src.scrapers.lafayette import LafayetteScraper
+
+    scraper = LafayetteScraper(
+        Source(
+            name="Moncus Park",
+            url="https://moncuspark.org/events/",
+            domain="moncuspark.org",
+            city="Lafayette",
+        )
+    )
+    html = (
+        "<html><head><script>var events = 1;</script></head><body>"
+        '<nav><a href="/about">About us</a><a href="/events/foo-fest/">Foo Fest</a></nav>'
+        '<article class="mec-event-article"><h4><a href="/events/bar-night/">Bar Night</a></h4>'
+        '<span class="mec-event-date">09March2025</span></article>'
+        "</body></html>"
+    )
+
+    class FakeResponse:
+        text = html
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        async def get(self, url: str):
+            return FakeResponse()
+
+    monkeypatch.setattr(scraper, "_client", lambda **kwargs: FakeClient())
+
+    events = asyncio.run(scraper.scrape())
+
+    assert [(event.title, event.source_id) for event in events] == [
+        ("Bar Night", "moncus_park_bar-night"),
+        ("Foo Fest", "moncus_park_foo-fest"),
+    ]
+
+
+def test_library_html_fallback_reuses_the_rss_client(monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from src.db.models import Source
+    from src.scrapers.library import LibraryScraper
+
+    scraper = LibraryScraper(
+        Source(
+            name="Main Library",
+            url="https://lafayettela.libcal.com/rss.php?cid=1",
+            domain="lafayettela.libcal.com",
+            city="Lafayette",
+        )
+    )
+    opened: list[object] = []
+    requested: list[str] = []
+    card_html = (
+        '<html><body><nav>Menu</nav><div class="s-lc-eventcard">'
+        '<h2><a href="https://lafayettela.libcal.com/event/123">Lego Club</a></h2>'
+        "</div></body></html>"
+    )
+
+    class FakeResponse:
+        def __init__(self, status_code: int, text: str) -> None:
+            self.status_code = status_code
+            self.text = text
+
+        def raise_for_status(self) -> None:
+            if self.status_code != 200:
+                raise httpx.HTTPStatusError("feed down", request=None, response=None)
+
+    class FakeClient:
+        async def __aenter__(self):
+            opened.append(self)
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        async def get(self, url: str):
+            requested.append(url)
+            if "rss" in url:
+                return FakeResponse(503, "")
+            if url.endswith("/calendar"):
+                return FakeResponse(404, "")
+            return FakeResponse(200, card_html)
+
+    monkeypatch.setattr(scraper, "_client", lambda **kwargs: FakeClient())
+
+    events = asyncio.run(scraper.scrape())
+
+    assert len(opened) == 1
+    assert len(requested) == 3
+    assert [(event.title, event.source_id) for event in events] == [("Lego Club", "123")]
+
+
+def test_library_rss_items_parse_with_lxml(monkeypatch):
+    import asyncio
+
+    from src.db.models import Source
+    from src.scrapers.library import LibraryScraper
+
+    scraper = LibraryScraper(
+        Source(
+            name="Main Library",
+            url="https://lafayettela.libcal.com/rss.php?cid=1",
+            domain="lafayettela.libcal.com",
+            city="Lafayette",
+        )
+    )
+    feed = (
+        b'<?xml version="1.0" encoding="UTF-8"?><rss><channel><item>'
+        b"<title> Toddler Time </title>"
+        b"<link>https://lafayettela.libcal.com/event/42</link>"
+        b"<description><![CDATA[<p>Songs &amp; rhymes<br/>\n for ages 1-3</p>]]></description>"
+        b"<pubDate>Sun, 09 Mar 2025 15:00:00 GMT</pubDate>"
+        b"</item></channel></rss>"
+    )
+
+    class FakeResponse:
+        content = feed
+        text = feed.decode()
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeClient:
+        async def get(self, url: str):
+            return FakeResponse()
+
+    [event] = asyncio.run(scraper._scrape_rss(FakeClient()))
+
+    assert (event.title, event.source_id) == ("Toddler Time", "42")
+    assert event.description == "Songs & rhymes for ages 1-3"
+    assert event.start_time.hour == 15
+
+
 def test_validate_onboarding_form_rejects_invalid_schedule_fields():
     from src.onboarding import validate_onboarding_form
 
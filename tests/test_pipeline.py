@@ -372,3 +372,95 @@ def test_job_registry_failure_logs_include_job_context(
         assert failed[0]["duration_ms"] >= 0
 
     asyncio.run(scenario())
+
+
+def test_run_scrape_fetches_sources_concurrently_and_isolates_failures(
+    isolated_postgres_database_url: str,
+    monkeypatch,
+):
+    active = 0
+    peak = 0
+    clients: set[int] = set()
+
+    class SlowScraper:
+        http_client = None
+
+        def __init__(self, source: Source) -> None:
+            self.source = source
+
+        async def scrape(self):
+            nonlocal active, peak
+            clients.add(id(self.http_client))
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            if self.source.name == "Broken":
+                raise RuntimeError("upstream down")
+            now = datetime.now(tz=UTC)
+            return [
+                Event(
+                    source=f"custom:{self.source.name}",
+                    source_url=f"{self.source.url}/1",
+                    source_id=f"{self.source.name}-1",
+                    title=f"{self.source.name} Story Time",
+                    start_time=now + timedelta(days=1),
+                    raw_data={},
+                )
+            ]
+
+    monkeypatch.setattr(scheduler_module, "_build_scraper", SlowScraper)
+    monkeypatch.setattr(scheduler_module.settings, "scrape_concurrency", 2)
+
+    async def scenario() -> tuple[int, dict[str, str]]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            for name in ("Library", "Museum", "Broken"):
+                await db.create_source(
+                    Source(name=name, url=f"https://{name.lower()}.example.com", domain=name)
+                )
+            total = await scheduler_module.run_scrape(db)
+            errors = {source.name: source.last_error for source in await db.get_all_sources()}
+            return total, errors
+
+    total, errors = asyncio.run(scenario())
+
+    assert total == 2
+    assert peak == 2
+    assert len(clients) == 1 and id(None) not in clients
+    assert errors == {"Library": None, "Museum": None, "Broken": "upstream down"}
+
+
+def test_run_scrape_collapses_repeated_events_from_one_source(
+    isolated_postgres_database_url: str,
+    monkeypatch,
+):
+    class RepeatingScraper:
+        def __init__(self, source: Source) -> None:
+            self.source = source
+
+        async def scrape(self):
+            start = datetime.now(tz=UTC) + timedelta(days=1)
+            return [
+                Event(
+                    source="custom:library",
+                    source_url="https://library.example.com/1",
+                    source_id="story-1",
+                    title=title,
+                    start_time=start,
+                    raw_data={},
+                )
+                for title in ("Story Time", "Story Time (updated)")
+            ]
+
+    monkeypatch.setattr(scheduler_module, "_build_scraper", RepeatingScraper)
+
+    async def scenario() -> tuple[int, list[str]]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            await db.create_source(
+                Source(name="Library", url="https://library.example.com", domain="library")
+            )
+            total = await scheduler_module.run_scrape(db)
+            events, _ = await db.search_events(days=30)
+            return total, [event.title for event in events]
+
+    assert asyncio.run(scenario()) == (1, ["Story Time (updated)"])
@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from src.db.models import Event, EventTags, InterestProfile
+from src.db.models import Constraints, Event, EventTags, InterestProfile
 from src.ranker.scoring import rank_events, score_event_breakdown
 from src.ranker.weather import DayForecast
 
@@ -131,6 +131,57 @@ def test_score_breakdown_can_be_persisted_on_event_model():
     assert event.score_breakdown == {"final": breakdown.final, "intrinsic": breakdown.intrinsic}
 
 
+def test_timing_score_uses_profile_nap_window_and_bedtime():
+    profile = InterestProfile(constraints=Constraints(nap_time="09:30-11:30", bedtime="18:00"))
+    tags = EventTags(toddler_score=7, nap_compatible=True)
+    morning = _event("Morning Music", city="Lafayette", tags=tags, hour=10)
+    lunch = _event("Lunch Picnic", city="Lafayette", tags=tags, hour=12)
+    evening = _event("Evening Concert", city="Lafayette", tags=tags, hour=18)
+
+    timings = [
+        score_event_breakdown(e, profile, _weather()).timing for e in (morning, lunch, evening)
+    ]
+
+    assert timings == [4.0, 6.5, 0.0]
+
+
+def test_weather_score_favors_morning_outdoor_events_on_hot_days():
+    weather = _weather()
+    weather["sunday"].temp_high_f = 98
+    tags = EventTags(toddler_score=7, indoor_outdoor="outdoor")
+    morning = _event("Morning Park", city="Lafayette", tags=tags, hour=9)
+    afternoon = _event("Afternoon Park", city="Lafayette", tags=tags, hour=14)
+
+    morning_weather = score_event_breakdown(morning, InterestProfile(), weather).weather
+    afternoon_weather = score_event_breakdown(afternoon, InterestProfile(), weather).weather
+
+    assert (morning_weather, afternoon_weather) == (5.5, 2.0)
+
+
+def test_rank_events_applies_profile_interests_and_preferred_cities():
+    profile = InterestProfile(
+        loves=["animals"],
+        likes=["music"],
+        constraints=Constraints(home_city="Lafayette", preferred_cities=["Baton Rouge"]),
+    )
+    tags = {"toddler_score": 7, "raw_rule_score": 70, "audience": "family_mixed"}
+    zoo = _event("Zoo", city="Baton Rouge", tags=EventTags(categories=["animals"], **tags))
+    concert = _event("Concert", city="Lafayette", tags=EventTags(categories=["music"], **tags))
+    lecture = _event("Lecture", city="New Orleans", tags=EventTags(categories=["civic"], **tags))
+
+    breakdowns = {
+        e.title: score_event_breakdown(e, profile, _weather()) for e in (zoo, concert, lecture)
+    }
+
+    assert [b.interest for b in breakdowns.values()] == [4.67, 2.33, 0.0]
+    assert [b.city for b in breakdowns.values()] == [4.8, 8.0, 0.8]
+    assert [e.title for e, _ in rank_events([lecture, zoo, concert], profile, _weather())] == [
+        "Concert",
+        "Zoo",
+        "Lecture",
+    ]
+
+
 def test_weather_service_uses_shared_http_client(monkeypatch):
     import asyncio
 
@@ -188,3 +239,33 @@ def test_weather_service_uses_shared_http_client(monkeypatch):
 
     assert captured["client_kwargs"]["service"] == "weather.openweathermap"
     assert captured["url"] == "https://api.openweathermap.org/data/2.5/forecast"
+
+
+def test_weather_summary_groups_blocks_by_day_and_defaults_missing_days():
+    from src.ranker.weather import WeatherService
+
+    def block(dt_txt: str, temp: float, pop: float, description: str) -> dict:
+        return {
+            "dt_txt": dt_txt,
+            "main": {"temp": temp},
+            "pop": pop,
+            "weather": [{"description": description}],
+        }
+
+    service = WeatherService()
+    by_day = service._group_by_day(
+        {
+            "list": [
+                block("2026-03-07 09:00:00", 71, 0.1, "clear sky"),
+                block("2026-03-07 12:00:00", 84, 0.6, "light rain"),
+                block("2026-03-07 15:00:00", 79, 0.2, "few clouds"),
+            ]
+        }
+    )
+
+    saturday = service._summarize_day(by_day.get("2026-03-07", []), date(2026, 3, 7))
+    sunday = service._summarize_day(by_day.get("2026-03-08", []), date(2026, 3, 8))
+
+    assert (saturday.temp_high_f, saturday.temp_low_f, saturday.precipitation_pct) == (84, 71, 60)
+    assert saturday.description == "light rain"
+    assert sunday.description == "partly cloudy"
@@ -123,7 +123,13 @@ def test_api_events_returns_paginated_filtered_payload(client, create_user) -> N
 
     assert response.status_code == 200
     payload = response.json()
-    assert payload["pagination"] == {"page": 1, "per_page": 1, "total": 1, "total_pages": 1}
+    assert payload["pagination"] == {
+        "page": 1,
+        "per_page": 1,
+        "total": 1,
+        "total_pages": 1,
+        "next_cursor": None,
+    }
     assert payload["filters"]["city"] == "Baton Rouge"
     assert payload["filters"]["attended"] == "yes"
     assert payload["filters"]["saved"] == "yes"
@@ -136,6 +142,29 @@ def test_api_events_returns_paginated_filtered_payload(client, create_user) -> N
     assert all(item["id"] != first.id for item in payload["items"])
 
 
+def test_api_events_pages_by_start_time_cursor(client, create_user) -> None:
+    from tests.test_security import login
+
+    user = create_user(email="events-cursor@example.com")
+    login(client, email=user.email)
+
+    database_url = client.app.state.db.database_url
+    now = datetime.now(tz=UTC)
+    titles = ["Early Art", "Midday Music", "Late Library"]
+    for offset, title in enumerate(titles, start=1):
+        _create_event(database_url, title=title, start_time=now + timedelta(hours=offset))
+
+    first = client.get("/api/events", params={"per_page": 2, "scope": "all"}).json()
+    cursor = first["pagination"]["next_cursor"]
+    second = client.get("/api/events", params={"per_page": 2, "scope": "all", **cursor}).json()
+
+    assert [item["title"] for item in first["items"]] == titles[:2]
+    assert cursor["after_id"] == first["items"][-1]["id"]
+    assert [item["title"] for item in second["items"]] == titles[2:]
+    assert second["pagination"]["total"] == 3
+    assert second["pagination"]["next_cursor"] is None
+
+
 def test_api_events_rejects_invalid_filter_values(client, create_user) -> None:
     from tests.test_security import login
 
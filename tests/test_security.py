@@ -5,6 +5,7 @@ import re
 import socket
 from datetime import UTC, datetime
 
+import httpx
 from fastapi.testclient import TestClient
 
 from src.db.database import create_database
@@ -156,6 +157,39 @@ def test_validate_public_http_url_blocks_private_dns_resolution(monkeypatch):
         raise AssertionError("expected private DNS resolution to be rejected")
 
 
+def test_page_analyzer_fetch_stops_reading_oversized_pages(monkeypatch):
+    import src.scrapers.analyzer as analyzer_module
+
+    served: list[int] = []
+
+    async def body(size: int):
+        for _ in range(size):
+            served.append(1)
+            yield b"<p>" + b"x" * 65_533 + b"</p>"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        size = 64 if request.url.path == "/huge" else 1
+        return httpx.Response(200, headers={"content-type": "text/html"}, content=body(size))
+
+    monkeypatch.setattr(analyzer_module, "validate_public_http_url", lambda url: None)
+    monkeypatch.setattr(
+        analyzer_module, "_PublicIPOnlyTransport", lambda **_: httpx.MockTransport(handler)
+    )
+    analyzer = analyzer_module.PageAnalyzer()
+
+    small = asyncio.run(analyzer._fetch("https://events.example/small"))
+    served.clear()
+    try:
+        asyncio.run(analyzer._fetch("https://events.example/huge"))
+    except ValueError as exc:
+        assert "too large" in str(exc)
+    else:
+        raise AssertionError("expected oversized page to be rejected")
+
+    assert small.startswith("<p>x")
+    assert len(served) < 64
+
+
 def test_signup_rejects_missing_csrf(client):
     response = client.post(
         "/signup",
@@ -140,3 +140,56 @@ def test_source_mutations_forbid_other_users(
     persisted = run_database_method(client.app.state.db.database_url, "get_source", source.id)
     assert persisted is not None
     assert persisted.user_id == owner.id
+
+
+def test_analyze_job_reuses_cached_recipe_when_url_is_re_added(
+    isolated_postgres_database_url: str, monkeypatch
+) -> None:
+    import asyncio
+
+    import src.web.routes.sources as sources_module
+    from src.db.database import create_database
+    from src.scrapers.recipe import ScrapeRecipe
+
+    analyzed: list[str] = []
+
+    class FakeAnalyzer:
+        async def analyze(self, url: str) -> ScrapeRecipe:
+            analyzed.append(url)
+            return ScrapeRecipe(
+                strategy="jsonld",
+                analyzed_at=datetime.now(tz=UTC),
+                confidence=0.9,
+                notes=f"pass {len(analyzed)}",
+            )
+
+    monkeypatch.setattr(sources_module, "PageAnalyzer", FakeAnalyzer)
+    url = "https://calendar.example.com/events"
+
+    async def analyze(db, *, reuse_recent: bool) -> dict:
+        source = Source(name="Calendar", url=url, domain="calendar", status="analyzing")
+        await db.create_source(source)
+        result = await sources_module._run_source_analyze_job(
+            db,
+            source_id=source.id,
+            source_name=source.name,
+            source_url=url,
+            reuse_recent=reuse_recent,
+        )
+        await db.delete_source(source.id)
+        return result
+
+    async def scenario() -> list[dict]:
+        async with create_database(database_url=isolated_postgres_database_url) as db:
+            return [
+                await analyze(db, reuse_recent=True),
+                await analyze(db, reuse_recent=True),
+                await analyze(db, reuse_recent=False),
+            ]
+
+    first, re_added, forced = asyncio.run(scenario())
+
+    assert (first["reused"], first["notes"]) == (False, "pass 1")
+    assert (re_added["reused"], re_added["notes"]) == (True, "pass 1")
+    assert (forced["reused"], forced["notes"]) == (False, "pass 2")
+    assert analyzed == [url, url]
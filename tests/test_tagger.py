@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 from datetime import datetime
 
 from src.db.models import Event
@@ -71,6 +72,32 @@ def test_tag_events_in_batches_calls_callback():
     assert callbacks == [(0, 2, 2), (2, 2, 2), (4, 1, 1)]
 
 
+def test_tag_events_in_batches_starts_next_batch_while_slow_call_finishes():
+    timeline: list[str] = []
+
+    class SlowFirstTagger(_FakeTagger):
+        async def tag_event(self, event: Event):
+            timeline.append(f"start {event.title}")
+            await asyncio.sleep(0.05 if event.title == "Event 0" else 0.001)
+            timeline.append(f"end {event.title}")
+            return self._heuristic_tag(event)
+
+    callbacks: list[int] = []
+
+    async def on_batch_complete(start_idx, _batch, _tagged_batch, _all_results):
+        callbacks.append(start_idx)
+
+    results = asyncio.run(
+        SlowFirstTagger().tag_events_in_batches(
+            [_event(i) for i in range(4)], batch_size=2, on_batch_complete=on_batch_complete
+        )
+    )
+
+    assert len(results) == 4
+    assert callbacks == [0, 2]
+    assert timeline.index("start Event 2") < timeline.index("end Event 0")
+
+
 def test_rule_based_tagger_flags_adult_event_low_score():
     event = Event(
         title="Brewery Trivia Night",
@@ -228,3 +255,51 @@ def test_count_stale_tagged_events(isolated_postgres_database_url: str):
             await db.close()
 
     asyncio.run(scenario())
+
+
+def test_category_patterns_match_like_substring_terms():
+    from src.tagger.llm import _CATEGORY_PATTERNS
+    from src.tagger.taxonomy import CATEGORY_RULES
+
+    samples = ["splashpad saturday", "artisan market", "dance-along at the zoo", "wine tasting"]
+    for text in samples:
+        for category, terms in CATEGORY_RULES.items():
+            expected = any(term in text for term in terms)
+            assert (_CATEGORY_PATTERNS[category].search(text) is not None) is expected
+
+
+def test_rule_assessment_is_reused_for_recurring_listings():
+    tagger = EventTagger()
+    first = _event(1)
+    repeat = first.model_copy(update={"start_time": datetime(2026, 3, 15, 10, 30)})
+    evening = first.model_copy(update={"start_time": datetime(2026, 3, 15, 19, 0)})
+
+    assert tagger._rule_based_assessment(repeat) is tagger._rule_based_assessment(first)
+    assert "late start time" in tagger._heuristic_tag(evening).caution_signals
+    assert tagger._heuristic_tag(first).categories is not tagger._heuristic_tag(repeat).categories
+
+
+def test_tag_events_in_batches_cancels_queued_batch_when_cancelled():
+    finished: list[str] = []
+    release = asyncio.Event()
+
+    class BlockingTagger(_FakeTagger):
+        async def tag_event(self, event: Event):
+            await release.wait()
+            finished.append(event.title)
+            return self._heuristic_tag(event)
+
+    async def scenario() -> None:
+        run = asyncio.create_task(
+            BlockingTagger().tag_events_in_batches([_event(i) for i in range(4)], batch_size=2)
+        )
+        await asyncio.sleep(0.01)
+        run.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await run
+        release.set()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+
+    assert finished == []
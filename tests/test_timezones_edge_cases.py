@@ -9,7 +9,14 @@ from src.scrapers.eventbrite import EventbriteScraper
 from src.scrapers.generic import GenericScraper
 from src.scrapers.lafayette import _parse_mec_dt
 from src.scrapers.library import LibraryScraper
-from src.timezones import APP_TZ, as_local_date, local_date_range_utc, local_today
+from src.timezones import (
+    APP_TZ,
+    as_local_date,
+    format_clock_12h,
+    local_date_range_utc,
+    local_today,
+    weekday_abbr,
+)
 
 
 def test_local_today_uses_app_timezone_around_utc_midnight() -> None:
@@ -17,6 +24,14 @@ def test_local_today_uses_app_timezone_around_utc_midnight() -> None:
     assert local_today(now=datetime(2025, 3, 8, 6, 30, tzinfo=UTC)) == date(2025, 3, 8)
 
 
+def test_format_clock_12h_handles_midnight_and_noon() -> None:
+    assert format_clock_12h(datetime(2025, 3, 8, 0, 5)) == "12:05am"
+    assert format_clock_12h(datetime(2025, 3, 8, 9, 30)) == "9:30am"
+    assert format_clock_12h(datetime(2025, 3, 8, 12, 0)) == "12:00pm"
+    assert format_clock_12h(datetime(2025, 3, 8, 19, 0), minutes=False) == "7pm"
+    assert weekday_abbr(date(2025, 3, 8)) == "Sat"
+
+
 def test_local_date_range_utc_handles_dst_length_changes() -> None:
     spring_start, spring_end = local_date_range_utc(date(2025, 3, 9), date(2025, 3, 10))
     fall_start, fall_end = local_date_range_utc(date(2025, 11, 2), date(2025, 11, 3))
@@ -44,6 +59,21 @@ def test_eventbrite_parse_dt_preserves_utc_suffix() -> None:
     assert as_local_date(parsed) == date(2025, 3, 9)
 
 
+def test_eventbrite_parse_dt_handles_iso_variants_and_card_dates() -> None:
+    assert EventbriteScraper._parse_dt("2025-03-09T06:30:00.000Z") == datetime(
+        2025, 3, 9, 6, 30, tzinfo=UTC
+    )
+    assert EventbriteScraper._parse_dt("2025-03-09T10:00:00-05:00").utcoffset() == timedelta(
+        hours=-5
+    )
+    assert EventbriteScraper._parse_dt("2025-03-09T10:00:00") == datetime(
+        2025, 3, 9, 10, 0, tzinfo=APP_TZ
+    )
+    assert EventbriteScraper._parse_dt("Sun, Mar 09, 2025 10:00 AM") == datetime(
+        2025, 3, 9, 10, 0, tzinfo=APP_TZ
+    )
+
+
 def test_allevents_parse_dt_assumes_app_timezone_for_date_only_strings() -> None:
     parsed = parse_allevents_dt("2025-03-09")
 
@@ -51,6 +81,14 @@ def test_allevents_parse_dt_assumes_app_timezone_for_date_only_strings() -> None
     assert as_local_date(parsed) == date(2025, 3, 9)
 
 
+def test_allevents_parse_dt_keeps_iso_offsets_and_falls_back_to_listing_formats() -> None:
+    assert parse_allevents_dt("2025-03-09T06:30:00Z") == datetime(2025, 3, 9, 6, 30, tzinfo=UTC)
+    assert parse_allevents_dt("2025-03-09T10:00:00-05:00").utcoffset() == timedelta(hours=-5)
+    assert parse_allevents_dt("March 9, 2025 10:00 AM") == datetime(
+        2025, 3, 9, 10, 0, tzinfo=APP_TZ
+    )
+
+
 def test_library_rss_dates_stay_timezone_aware() -> None:
     parsed = LibraryScraper._parse_rss_date("Sun, 09 Mar 2025 06:30:00 GMT")
 
@@ -58,6 +96,15 @@ def test_library_rss_dates_stay_timezone_aware() -> None:
     assert as_local_date(parsed) == date(2025, 3, 9)
 
 
+def test_library_rss_dates_handle_us_zone_names_and_iso_fallback() -> None:
+    assert LibraryScraper._parse_rss_date("Tue, 24 Feb 2026 09:00:00 CST") == datetime(
+        2026, 2, 24, 15, 0, tzinfo=UTC
+    )
+    assert LibraryScraper._parse_rss_date("2025-03-09T10:00:00") == datetime(
+        2025, 3, 9, 10, 0, tzinfo=APP_TZ
+    )
+
+
 def test_lafayette_mec_parser_anchors_midnight_times_to_app_timezone() -> None:
     parsed = _parse_mec_dt("March 09, 2025", "12:30 am")
 
@@ -79,3 +126,26 @@ def test_brec_parser_anchors_midnight_times_to_app_timezone() -> None:
 
     assert parsed == datetime(2025, 3, 9, 0, 30, tzinfo=APP_TZ)
     assert as_local_date(parsed) == date(2025, 3, 9)
+
+
+def test_generic_parse_dt_cache_does_not_pin_fallback_now() -> None:
+    first = GenericScraper._parse_dt("not a date")
+    second = GenericScraper._parse_dt("not a date")
+
+    assert first.tzinfo is not None
+    assert second >= first
+    assert GenericScraper._parse_dt("2025-03-09 10:00") is GenericScraper._parse_dt(
+        "2025-03-09 10:00"
+    )
+
+
+def test_generic_parse_dt_cache_follows_the_current_day(monkeypatch) -> None:
+    import src.scrapers.generic as generic_module
+
+    monkeypatch.setattr(generic_module, "local_today", lambda: date(2025, 3, 8))
+    first = GenericScraper._parse_dt("10:00")
+    monkeypatch.setattr(generic_module, "local_today", lambda: date(2025, 3, 9))
+    second = GenericScraper._parse_dt("10:00")
+
+    assert first == datetime(2025, 3, 8, 10, 0, tzinfo=APP_TZ)
+    assert second == datetime(2025, 3, 9, 10, 0, tzinfo=APP_TZ)